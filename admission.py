@@ -0,0 +1,143 @@
+import functools
+import math
+import threading
+import time
+
+from flask import jsonify, make_response, request
+
+from constants import *
+
+
+# ------------------------------------------------------------------
+# Admission control for heavy endpoints
+#
+# Each request is costed from its raw body (bytes and operation row
+# count) before JSON parsing. Work is admitted while both the memory
+# budget and the CPU slots allow it, otherwise it waits in a bounded
+# queue; requests that cannot be queued or wait too long get 429 with
+# Retry-After. Budgets are per process (i.e. per gunicorn worker). The
+# pipeline's stage and chunk caches and the in-process aggregate cache
+# live in the same process and may fill up at any time, so their
+# configured maxima are reserved out of the memory budget up front.
+# ------------------------------------------------------------------
+ROW_MARKER = b'"MaintenanceOrderOperation"'
+
+
+class Rejected(Exception):
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def estimate_cost(body):
+    """
+    Estimated peak memory (MB) for analyzing a raw /analyze body.
+    """
+    rows = body.count(ROW_MARKER)
+    return (
+        len(body) * ADMISSION_BYTES_MULTIPLIER + rows * ADMISSION_BYTES_PER_ROW
+    ) / (1024 * 1024)
+
+
+class AdmissionController:
+
+    def __init__(self, memory_budget_mb=ADMISSION_MEMORY_BUDGET_MB,
+                 cpu_slots=ADMISSION_CPU_SLOTS, max_queue=ADMISSION_MAX_QUEUE,
+                 queue_timeout=ADMISSION_QUEUE_TIMEOUT_S,
+                 reserved_mb=(PIPELINE_STAGE_CACHE_MAX_MB + PIPELINE_CHUNK_CACHE_MAX_MB
+                              + AGG_CACHE_MEMORY_MB)):
+        self.reserved_mb = reserved_mb
+        # Left for requests; past that, the idle-node rule in _fits still
+        # lets them run one at a time
+        self.memory_budget_mb = max(memory_budget_mb - reserved_mb, 0)
+        self.cpu_slots = cpu_slots
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._cond = threading.Condition()
+        self._memory_in_use = 0.0
+        self._running = 0
+        self._queued = 0
+        self._counters = {"admitted": 0, "rejected_queue_full": 0, "rejected_timeout": 0}
+
+    def _fits(self, cost):
+        if self._running >= self.cpu_slots:
+            return False
+        # A request larger than the whole budget only runs on an idle node
+        return self._running == 0 or self._memory_in_use + cost <= self.memory_budget_mb
+
+    def _retry_after(self):
+        return max(1, math.ceil(self.queue_timeout / 2))
+
+    def acquire(self, cost):
+        with self._cond:
+            if not self._fits(cost):
+                if self._queued >= self.max_queue:
+                    self._counters["rejected_queue_full"] += 1
+                    raise Rejected("queue full", self._retry_after())
+
+                self._queued += 1
+                deadline = time.monotonic() + self.queue_timeout
+                try:
+                    while not self._fits(cost):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._counters["rejected_timeout"] += 1
+                            raise Rejected("timed out waiting for capacity", self._retry_after())
+                        self._cond.wait(remaining)
+                finally:
+                    self._queued -= 1
+
+            self._running += 1
+            self._memory_in_use += cost
+            self._counters["admitted"] += 1
+
+    def release(self, cost):
+        with self._cond:
+            self._running -= 1
+            self._memory_in_use -= cost
+            self._cond.notify_all()
+
+    def metrics(self):
+        with self._cond:
+            return {
+                "queue_depth": self._queued,
+                "in_flight": self._running,
+                "memory_in_use_mb": round(self._memory_in_use, 1),
+                "memory_budget_mb": self.memory_budget_mb,
+                "memory_reserved_mb": self.reserved_mb,
+                "cpu_slots": self.cpu_slots,
+                **self._counters
+            }
+
+    def guard(self, view):
+        """
+        Flask view decorator applying admission control.
+        """
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            cost = estimate_cost(request.get_data(cache=True))
+            try:
+                self.acquire(cost)
+            except Rejected as e:
+                response = jsonify({"Message": f"Server busy: {e.reason}"})
+                response.status_code = 429
+                response.headers["Retry-After"] = str(e.retry_after)
+                return response
+
+            try:
+                response = make_response(view(*args, **kwargs))
+            except BaseException:
+                self.release(cost)
+                raise
+
+            if response.is_streamed:
+                # Streamed bodies are produced after the view returns
+                response.call_on_close(lambda: self.release(cost))
+            else:
+                self.release(cost)
+            return response
+
+        return wrapper
@@ -0,0 +1,130 @@
+import pickle
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+from constants import (
+    AGG_CACHE_MAX_ENTRIES, AGG_CACHE_SHARED, AGG_CACHE_PATH, AGG_CACHE_MAX_MB,
+    AGG_CACHE_MEMORY_MB
+)
+from pipeline import LRUCache
+
+
+# ------------------------------------------------------------------
+# LRU of analysed aggregates, referenced by id
+#
+# Entries always live in an in-process LRU, bounded by entry count and
+# by the sizeof() of the entries (paged entries hold full order
+# results). With a path (shared mode, on by default when serve.py runs
+# more than one worker) every entry is also pickled into SQLite, so agg
+# ids and cursors issued by one worker resolve on any other. That write
+# happens on a background thread, off the request path: another worker
+# can miss an id for the moment it takes to land. The shared table is
+# bounded by entry count and total size; the oldest entries go first.
+# ------------------------------------------------------------------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agg_cache (
+    agg_id TEXT PRIMARY KEY, entry BLOB, size INTEGER, created REAL
+);
+CREATE INDEX IF NOT EXISTS ix_agg_cache_created ON agg_cache (created);
+"""
+
+
+class AggCache:
+
+    def __init__(self, max_entries=AGG_CACHE_MAX_ENTRIES,
+                 path=AGG_CACHE_PATH if AGG_CACHE_SHARED else None,
+                 max_mb=AGG_CACHE_MAX_MB, memory_mb=AGG_CACHE_MEMORY_MB):
+        self.max_entries = max_entries
+        self.path = path
+        self.max_bytes = max_mb * 1024 * 1024
+        self._entries = LRUCache(max_entries, memory_mb)
+        # Writes waiting for the writer thread; when full, entries stay local
+        self._pending = queue.Queue(maxsize=max_entries)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+        if path:
+            with self._connect() as conn:
+                conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def put(self, entry):
+        agg_id = uuid.uuid4().hex
+        self._entries.put(agg_id, entry)
+
+        if self.path:
+            self._start_writer()
+            try:
+                self._pending.put_nowait((agg_id, entry, time.time()))
+            except queue.Full:
+                print(f"Agg cache writer behind: {agg_id} not shared")
+        return agg_id
+
+    def _start_writer(self):
+        # Started on first use, i.e. in the worker process after forking
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="agg-cache-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            agg_id, entry, created = self._pending.get()
+            try:
+                self._write(agg_id, entry, created)
+            except (sqlite3.Error, pickle.PicklingError) as e:
+                print(f"Agg cache write failed for {agg_id}: {e}")
+            finally:
+                self._pending.task_done()
+
+    def flush(self):
+        """
+        Waits until every queued entry is in the shared table.
+        """
+        if self._writer is not None:
+            self._pending.join()
+
+    def _write(self, agg_id, entry, created):
+        blob = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO agg_cache VALUES (?, ?, ?, ?)",
+                (agg_id, blob, len(blob), created)
+            )
+            conn.execute(
+                "DELETE FROM agg_cache WHERE agg_id NOT IN "
+                "(SELECT agg_id FROM agg_cache ORDER BY created DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            # Oldest first until the table fits the size budget
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM agg_cache").fetchone()[0]
+            for old_id, size in conn.execute(
+                "SELECT agg_id, size FROM agg_cache ORDER BY created"
+            ).fetchall():
+                if total <= self.max_bytes or old_id == agg_id:
+                    break
+                conn.execute("DELETE FROM agg_cache WHERE agg_id = ?", (old_id,))
+                total -= size
+
+    def get(self, agg_id):
+        entry = self._entries.get(agg_id)
+        if entry is not None or not self.path:
+            return entry
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT entry FROM agg_cache WHERE agg_id = ?", (agg_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = pickle.loads(row[0])
+        self._entries.put(agg_id, entry)
+        return entry
@@ -1,46 +1,256 @@
-from flask import Flask, request, jsonify
+import threadConfig  # before numpy / torch load
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from dataCreation import *
 import json
 from setupData import *
+from orderStore import OrderStore, analyze_incremental
+from aggCache import AggCache
+from thresholdSweep import sweep_thresholds
+from serializer import json_response, order_level_output
+from orderDetail import *
+from streaming import STREAM_FORMATS, stream_analysis
+from admission import AdmissionController
+from singleFlight import SingleFlight
+from deadline import Deadline, parse_deadline_ms
+from batch import BATCH_ORDER_DETAIL_MODES, analyze_batch
+from pipeline import build_analyze_pipeline
+from capture import RequestCapture
+import hashlib
 import os
+import time
 
 app = Flask(__name__)
+_order_store = None
+agg_cache = AggCache()
+admission = AdmissionController()
+single_flight = SingleFlight()
+analyze_pipeline = build_analyze_pipeline()
+
+
+@app.before_request
+def mark_arrival():
+    # Deadlines run from arrival, so time spent queued in admission counts
+    g.arrived_at = time.monotonic()
+
+
+request_capture = RequestCapture()
+request_capture.init_app(app)
+
+
+def get_order_store():
+    global _order_store
+    if _order_store is None:
+        _order_store = OrderStore()
+    return _order_store
 
 
 @app.route("/analyze", methods=["POST"])
+# Incremental requests update the order store: never share their result
+@single_flight.coalesce(skip=lambda r: r.args.get("incremental") in ("1", "true"))
+@admission.guard
 def analyze():
+    try:
+        deadline = Deadline(
+            parse_deadline_ms(request.args.get("deadline_ms", request.headers.get("X-Deadline-Ms"))),
+            DEADLINE_RESERVE_FRACTION,
+            started_at=g.arrived_at
+        )
+    except ValueError as e:
+        return jsonify({"Message": str(e)}), 400
+
+    order_detail = request.args.get("order_detail", "full")
+    if order_detail not in ORDER_DETAIL_MODES:
+        return jsonify({"Message": f"order_detail must be one of {ORDER_DETAIL_MODES}"}), 400
+    try:
+        page_size = parse_page_size(request.args.get("page_size"))
+    except ValueError as e:
+        return jsonify({"Message": str(e)}), 400
+
     payload = json.loads(request.data.decode("utf-8"))
     # print(payload)
     # return jsonify({"Good": [1,2,3,4]})
-    task_df, mo_df = build_data_model(payload)
+    streaming_stats = request.args.get("stats", "sketch" if ENABLE_STREAMING_STATS else "exact") == "sketch"
+    stream_format = request.args.get("stream")
+    incremental = request.args.get("incremental") in ("1", "true")
 
-    if task_df is None or mo_df is None:
-        print("No Data Case")
-        return jsonify({"Message": "No Data sent to python server"})
+    if not stream_format and not incremental:
+        # threshold.<name>=<value> overrides one proposer setting
+        try:
+            thresholds = resolve_thresholds({
+                name[len("threshold."):]: float(value)
+                for name, value in request.args.items() if name.startswith("threshold.")
+            })
+        except ValueError as e:
+            return jsonify({"Message": str(e)}), 400
 
-    grouped_orders = group_by_order(mo_df)
+        dry_run = request.args.get("dry_run") in ("1", "true")
+        values, stages = analyze_pipeline.run(
+            {"payload": payload, "streaming_stats": streaming_stats, "thresholds": thresholds},
+            fingerprints={"payload": hashlib.sha1(request.data).hexdigest()},
+            deadline=deadline,
+            dry_run=dry_run
+        )
+        if dry_run:
+            return jsonify({"dry_run": True, "stages": stages})
 
-    order_results = {
-        order_id: analyze_single_order(df, task_df)
-        for order_id, df in grouped_orders.items()
-    }
+        task_df, mo_df = values["task_df"], values["mo_df"]
+        if task_df is None or mo_df is None:
+            print("No Data Case")
+            return jsonify({"Message": "No Data sent to python server"})
 
-    agg = aggregate_learning(order_results)
+        order_results, agg = values["order_results"], values["agg"]
+        total_orders, proposals = values["total_orders"], values["proposals"]
+    else:
+        task_df, mo_df = build_data_model(payload)
 
-    proposals = propose_master_changes(
-        task_df,
-        agg,
-        total_orders=len(grouped_orders)
-    )
+        if task_df is None or mo_df is None:
+            print("No Data Case")
+            return jsonify({"Message": "No Data sent to python server"})
+
+        if stream_format:
+            if stream_format not in STREAM_FORMATS:
+                return jsonify({"Message": f"stream must be one of {STREAM_FORMATS}"}), 400
+
+            return Response(
+                stream_with_context(stream_analysis(
+                    task_df, mo_df, stream_format, streaming_stats=streaming_stats,
+                    deadline=deadline
+                )),
+                mimetype="application/x-ndjson" if stream_format == "ndjson" else "application/json"
+            )
+
+        order_results, agg, total_orders = analyze_incremental(
+            get_order_store(), task_df, mo_df, streaming=streaming_stats, deadline=deadline
+        )
+
+        proposals = propose_master_changes(
+            task_df,
+            agg,
+            total_orders=total_orders,
+            deadline=deadline
+        )
 
     print("RESULTS: ", proposals)
 
+    entry = {"task_df": task_df, "agg": agg, "total_orders": total_orders}
+    if order_detail == "page":
+        # Only paged requests keep order detail alive for follow-up pages
+        entry["order_results"] = order_results
+    agg_id = agg_cache.put(entry)
+
+    body = {
+        "master_change_proposals": proposals,
+        "agg_id": agg_id
+    }
+    if deadline.seconds is not None:
+        body["deadline"] = deadline.report()
+    if request.args.get("explain") in ("1", "true") and not (stream_format or incremental):
+        body["pipeline"] = stages
+
+    if order_detail == "summary":
+        body["order_level_analysis"] = summarize_order_results(order_results)
+    elif order_detail in ("full", "page"):
+        if order_detail == "page":
+            order_results, body["next_cursor"] = order_page(
+                order_results, agg_id, page_size=page_size
+            )
+        body["order_level_analysis"] = order_level_output(order_results, request.args.get("format"))
+
+    return json_response(body)
+
+
+@app.route("/analyze/batch", methods=["POST"])
+@admission.guard
+def analyze_batch_groups():
+    """
+    Body: {"groups": [{"id": "...", "payload": {<analyze payload>}}, ...]}
+    Results are keyed by group id ("<task list hash>:<position>" when id is absent).
+    """
+    order_detail = request.args.get("order_detail", "none")
+    if order_detail not in BATCH_ORDER_DETAIL_MODES:
+        return jsonify({"Message": f"order_detail must be one of {BATCH_ORDER_DETAIL_MODES}"}), 400
+
+    body = json.loads(request.data.decode("utf-8"))
+    groups = body.get("groups") if isinstance(body, dict) else None
+    if not groups:
+        return jsonify({"Message": "No groups sent to python server"}), 400
+
+    return json_response(analyze_batch(groups, order_detail))
+
+
+@app.route("/orders", methods=["GET"])
+def order_level_page():
+    """
+    Next page of order_level_analysis for /analyze?order_detail=page.
+    """
+    try:
+        agg_id, offset = decode_cursor(request.args.get("cursor"))
+        page_size = parse_page_size(request.args.get("page_size"))
+    except ValueError as e:
+        return jsonify({"Message": str(e)}), 400
+
+    entry = agg_cache.get(agg_id)
+    if entry is None or "order_results" not in entry:
+        return jsonify({"Message": f"Unknown or expired cursor: {agg_id}"}), 404
+
+    page, next_cursor = order_page(entry["order_results"], agg_id, offset, page_size=page_size)
+    return json_response({
+        "order_level_analysis": order_level_output(page, request.args.get("format")),
+        "next_cursor": next_cursor
+    })
+
+
+@app.route("/proposals/<agg_id>", methods=["POST"])
+@admission.guard
+def reevaluate_proposals(agg_id):
+    """
+    Re-runs the proposers on a cached aggregate.
+    Body: {"thresholds": {...}} for one run, or
+          {"sweep": {"min_order_ratio": [0.5, 0.6], ...}} for a grid.
+    """
+    entry = agg_cache.get(agg_id)
+    if entry is None:
+        return jsonify({"Message": f"Unknown or expired agg_id: {agg_id}"}), 404
+
+    body = json.loads(request.data.decode("utf-8") or "{}")
+    if not isinstance(body, dict):
+        return jsonify({"Message": "Body must be a JSON object"}), 400
+
+    try:
+        if "sweep" in body:
+            return jsonify({
+                "agg_id": agg_id,
+                "sweep": sweep_thresholds(
+                    entry["task_df"], entry["agg"], entry["total_orders"], body["sweep"]
+                )
+            })
+
+        proposals = propose_master_changes(
+            entry["task_df"],
+            entry["agg"],
+            total_orders=entry["total_orders"],
+            thresholds=body.get("thresholds")
+        )
+    except ValueError as e:
+        return jsonify({"Message": str(e)}), 400
+
     return jsonify({
-        "order_level_analysis": order_results,
+        "agg_id": agg_id,
+        "thresholds": resolve_thresholds(body.get("thresholds")),
         "master_change_proposals": proposals
     })
 
 
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    return jsonify({
+        "admission": admission.metrics(),
+        "coalescing": single_flight.metrics(),
+        "capture": request_capture.metrics(),
+        "embedding": embedding_metrics()
+    })
+
+
 @app.route("/get_data", methods=["GET"])
 def get_data():
     payloadGenerated = generate_large_payload(int(json.loads(request.data.decode("utf-8"))['num']))
@@ -0,0 +1,151 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from setupData import *
+from orderStore import task_list_key
+from orderDetail import summarize_order_results
+from constants import BATCH_WORKERS
+from threadConfig import thread_config, apply_runtime
+
+
+# ------------------------------------------------------------------
+# Multi-task-list batch analysis
+#
+# Groups run in a forked process pool, so workers inherit the already
+# loaded model and modules. Each group is isolated: an exception (or a
+# crashed worker) is reported for that group only.
+# ------------------------------------------------------------------
+BATCH_ORDER_DETAIL_MODES = ("none", "summary", "full")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker():
+    # Parallelism comes from the pool; one intra-op / BLAS thread per worker
+    apply_runtime(dict(thread_config(), torch_threads=1, blas_threads=1))
+
+
+def get_pool():
+    """
+    The shared process pool, created once under a lock (gthread workers
+    serve batches concurrently). BATCH_WORKERS defaults to the cores
+    per server worker, so W workers do not fork W x cpu processes.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            get_embedding_model()  # loaded once here, shared by the forked workers
+            _pool = ProcessPoolExecutor(
+                max_workers=BATCH_WORKERS,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker
+            )
+        return _pool
+
+
+def _discard_pool(pool, futures=()):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # shutdown(cancel_futures=True) needs Python 3.9
+    for future in futures:
+        future.cancel()
+    pool.shutdown(wait=False)
+
+
+def analyze_group(group, order_detail="none"):
+    """
+    Full analysis of one {"id": ..., "payload": {...}} group.
+    Returns (group_key, result, error); group_key is the task list hash
+    when the group has no id.
+    """
+    key = group.get("id")
+    try:
+        task_df, mo_df = build_data_model(group["payload"])
+        key = key or task_list_key(task_df)
+
+        order_results = analyze_orders(mo_df, task_df)
+        agg = aggregate_learning(order_results)
+        result = {
+            "master_change_proposals": propose_master_changes(
+                task_df, agg, total_orders=len(order_results)
+            )
+        }
+
+        if order_detail == "summary":
+            result["order_level_analysis"] = summarize_order_results(order_results)
+        elif order_detail == "full":
+            result["order_level_analysis"] = order_results.to_dict()
+
+        return key, result, None
+    except Exception as e:
+        return key, None, f"{type(e).__name__}: {e}"
+
+
+def _run_groups(indices, groups, order_detail, outcomes):
+    """
+    Runs groups[indices] on the pool into outcomes; returns the indices
+    lost to a crashed pool (which is then discarded).
+    """
+    pool = get_pool()
+    futures, broken = {}, []
+    for i in indices:
+        try:
+            futures[i] = pool.submit(analyze_group, groups[i], order_detail)
+        except BrokenProcessPool:
+            broken.append(i)
+
+    for i, future in futures.items():
+        try:
+            outcomes[i] = future.result()
+        except BrokenProcessPool:
+            broken.append(i)
+
+    if broken:
+        _discard_pool(pool, futures.values())
+    return sorted(broken)
+
+
+def analyze_batch(groups, order_detail="none"):
+    """
+    Returns {"results": {key: result}, "errors": {key: message}}.
+    Groups without an id are keyed "<task list hash>:<position>" (or
+    their position if the payload cannot be read). A crashed worker
+    breaks the whole pool, so the groups it took down are retried on a
+    fresh one; groups that still crash are then run one at a time, so
+    only the culprit is reported as crashed.
+    """
+    groups = [
+        dict(group, id=group.get("id") or None) if "payload" in group else {"payload": group}
+        for group in groups
+    ]
+
+    outcomes = {}
+    broken = _run_groups(range(len(groups)), groups, order_detail, outcomes)
+    if broken:
+        broken = _run_groups(broken, groups, order_detail, outcomes)
+    for i in broken:
+        if _run_groups([i], groups, order_detail, outcomes):
+            outcomes[i] = (groups[i].get("id"), None, "worker crashed while analyzing this group")
+
+    results, errors = {}, {}
+    for index, group in enumerate(groups):
+        key, result, error = outcomes[index]
+        if group.get("id") is None:
+            key = str(index) if key is None else f"{key}:{index}"
+        else:
+            key = str(key)
+            if key in results or key in errors:
+                errors[f"{key}:{index}"] = f"duplicate group id {key}"
+                continue
+
+        if error is None:
+            results[key] = result
+        else:
+            errors[key] = error
+
+    return {"results": results, "errors": errors}
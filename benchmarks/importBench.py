@@ -0,0 +1,79 @@
+"""
+Import time of the service (python -X importtime), against a budget.
+
+    python benchmarks/importBench.py [--module app] [--budget 1.0] [--repeat 5]
+
+Imports --module in fresh interpreters, keeps the fastest run and
+reports the slowest top-level packages by cumulative time. Exits
+non-zero when the import exceeds --budget seconds or loads one of the
+--forbid modules (the semantic stack is imported on first use only).
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+FORBIDDEN = "torch,sentence_transformers,transformers,sklearn,scipy.stats"
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_profile(module):
+    """
+    {module: cumulative seconds} for one fresh import of module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            profile[match.group(4)] = int(match.group(2)) / 1e6
+    return profile
+
+
+def by_package(profile):
+    """
+    Cumulative time per top-level package (outermost import only).
+    """
+    packages = {}
+    for name, seconds in profile.items():
+        top = name.split(".")[0]
+        packages[top] = max(packages.get(top, 0), seconds)
+    return packages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--budget", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--forbid", default=FORBIDDEN)
+    args = parser.parse_args()
+
+    runs = [import_profile(args.module) for _ in range(args.repeat)]
+    profile = min(runs, key=lambda p: p[args.module])
+    total = profile[args.module]
+
+    print(f"import {args.module}: {total:.3f}s (best of {args.repeat}, budget {args.budget:.2f}s)")
+    for name, seconds in sorted(by_package(profile).items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {name:<28} {seconds:8.3f}s")
+
+    forbidden = [m for m in args.forbid.split(",") if m and m in profile]
+    if forbidden:
+        print(f"FAIL: import {args.module} loads {', '.join(forbidden)}")
+    if total > args.budget:
+        print(f"FAIL: {total:.3f}s over the {args.budget:.2f}s budget")
+    sys.exit(1 if forbidden or total > args.budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Throughput of serve.py over a workers x torch threads matrix.
+
+    python benchmarks/loadTest.py --workers 1,2,4 --torch-threads 0,1,2,4 --orders 200
+
+For every combination a server is started on --port, warmed up, and
+hammered with --clients concurrent /analyze calls for --duration seconds.
+Torch threads 0 means cpus / workers (the threadConfig default); BLAS
+threads follow torch threads unless --blas-threads is given.
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+
+from dataCreation import generate_large_payload
+
+
+def wait_for_server(url, timeout=300):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.5)
+    raise RuntimeError(f"server did not come up at {url}")
+
+
+def run_load(url, body, clients, duration):
+    latencies = []
+    stop_at = time.time() + duration
+
+    def client():
+        session = requests.Session()
+        while time.time() < stop_at:
+            start = time.perf_counter()
+            r = session.post(url, data=body, params={"order_detail": "none"})
+            r.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    with ThreadPoolExecutor(clients) as pool:
+        for f in [pool.submit(client) for _ in range(clients)]:
+            f.result()
+
+    return np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--torch-threads", default="0")
+    parser.add_argument("--blas-threads", type=int, default=None)
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--port", type=int, default=3100)
+    args = parser.parse_args()
+
+    body = json.dumps(generate_large_payload(args.orders))
+    base = f"http://127.0.0.1:{args.port}"
+
+    matrix = itertools.product(
+        [int(w) for w in args.workers.split(",")],
+        [int(t) for t in args.torch_threads.split(",")]
+    )
+
+    print(f"{'workers':>7} {'torch':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for workers, torch_threads in matrix:
+        command = [sys.executable, "serve.py", "--bind", f"127.0.0.1:{args.port}",
+                   "--workers", str(workers), "--threads", str(args.threads),
+                   "--torch-threads", str(torch_threads)]
+        if args.blas_threads is not None:
+            command += ["--blas-threads", str(args.blas_threads)]
+
+        server = subprocess.Popen(command, cwd=ROOT)
+        try:
+            wait_for_server(base + "/")
+            run_load(base + "/analyze", body, args.clients, 3)  # warm-up
+            lat = run_load(base + "/analyze", body, args.clients, args.duration)
+            p50, p95, p99 = np.percentile(lat, [50, 95, 99]) * 1000
+            print(f"{workers:>7} {torch_threads or 'auto':>6} {len(lat) / args.duration:>8.1f} {p50:>8.0f} {p95:>8.0f} {p99:>8.0f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Replays captured /analyze requests against a running server.
+
+    python benchmarks/replay.py captures/requests.jsonl --concurrency 8 --repeat 3
+    python benchmarks/replay.py --fixture generated_orders_1000 --concurrency 4 --repeat 50
+
+Captured records ({"query", "payload"} per line, see capture.py) keep
+their original query string unless --query is given. Prints latency
+percentiles, throughput and status counts.
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+
+from fixtures import load_fixture
+
+
+def load_requests(paths, fixtures, query=None, limit=None):
+    """
+    Returns [(query_string, body_bytes)].
+    """
+    out = []
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    payload = record.get("payload", record)
+                    out.append((
+                        record.get("query", "") if query is None else query,
+                        json.dumps(payload).encode("utf-8")
+                    ))
+    for name in fixtures:
+        out.append((query or "", json.dumps(load_fixture(name)).encode("utf-8")))
+    return out[:limit] if limit else out
+
+
+def replay(url, reqs, concurrency, repeat):
+    """
+    Sends every request `repeat` times from `concurrency` threads.
+    Returns (latencies in seconds, Counter of status codes, wall seconds).
+    """
+    jobs = [r for _ in range(repeat) for r in reqs]
+    latencies, statuses = [], Counter()
+    lock = threading.Lock()
+    local = threading.local()
+
+    def send(job):
+        query, body = job
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+
+        start = time.perf_counter()
+        try:
+            status = session.post(f"{url}/analyze?{query}", data=body).status_code
+        except requests.RequestException as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - start
+
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(send, jobs))
+    return np.array(latencies), statuses, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("captures", nargs="*", help="capture JSONL files")
+    parser.add_argument("--fixture", action="append", default=[], help="fixture name")
+    parser.add_argument("--url", default="http://127.0.0.1:3000")
+    parser.add_argument("--query", help="query string for every request (default: as captured)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=1, help="untimed passes over the requests")
+    parser.add_argument("--limit", type=int, help="replay only the first N requests")
+    args = parser.parse_args()
+
+    reqs = load_requests(args.captures, args.fixture, args.query, args.limit)
+    if not reqs:
+        parser.error("no captures or fixtures given")
+
+    if args.warmup:
+        replay(args.url, reqs, args.concurrency, args.warmup)
+    lat, statuses, wall = replay(args.url, reqs, args.concurrency, args.repeat)
+
+    p50, p90, p95, p99 = np.percentile(lat, [50, 90, 95, 99]) * 1000
+    print(f"requests {len(lat)}  concurrency {args.concurrency}  req/s {len(lat) / wall:.1f}")
+    print(f"p50 {p50:.0f} ms  p90 {p90:.0f} ms  p95 {p95:.0f} ms  p99 {p99:.0f} ms  "
+          f"max {lat.max() * 1000:.0f} ms")
+    print("status " + "  ".join(f"{k}: {v}" for k, v in sorted(statuses.items(), key=str)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Analyze-response serialization: jsonify vs serializer.dumps.
+
+    python benchmarks/serializeBench.py [num_orders]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from flask import Flask, jsonify
+
+import serializer
+from dataCreation import generate_large_payload
+from setupData import build_data_model, analyze_orders
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    size = len(fn())
+    print(f"{label:<28} {time.perf_counter() - start:8.3f}s  {size / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    num_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(0)
+    task_df, mo_df = build_data_model(generate_large_payload(num_orders))
+    store = analyze_orders(mo_df, task_df)
+
+    app = Flask(__name__)
+    print(f"{num_orders} orders, orjson={'yes' if serializer.orjson else 'no'}")
+
+    with app.app_context():
+        timed("jsonify(to_dict)", lambda: jsonify({
+            "order_level_analysis": store.to_dict(), "master_change_proposals": []
+        }).get_data())
+
+    timed("serializer.dumps(to_dict)", lambda: serializer.dumps({
+        "order_level_analysis": store.to_dict(), "master_change_proposals": []
+    }))
+    timed("serializer.dumps(columns)", lambda: serializer.dumps({
+        "order_level_analysis": store.to_columns(), "master_change_proposals": []
+    }))
@@ -0,0 +1,99 @@
+"""
+Pairwise description similarity: full embeddings vs PCA projections.
+
+For every projection size, reports the time and peak memory (numpy
+allocations, via tracemalloc) to build the similarity matrix, the
+projection included, plus the memory the projection itself keeps
+resident and the fraction of descriptions whose cluster (at the
+threshold) differs from the full embeddings.
+
+    python benchmarks/similarityBench.py [num_texts] [threshold]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from dataCreation import TASK_LIST_DESCRIPTIONS, NEW_OPERATION_DESCRIPTIONS
+from nlpUtils import embed_texts, cluster_from_similarity
+from similarity import Projection, pairwise_similarity
+
+PCA_COMPONENTS = (0, 128, 64)
+
+
+def description_corpus(n):
+    """
+    Maintenance-style descriptions: real ones with words dropped,
+    swapped or typo'd, plus random recombinations of their vocabulary.
+    """
+    base = list(TASK_LIST_DESCRIPTIONS.values()) + list(NEW_OPERATION_DESCRIPTIONS)
+    vocab = sorted({w for d in base for w in d.lower().split()})
+    texts = set(base)
+
+    while len(texts) < n:
+        words = random.choice(base).lower().split()
+        roll = random.random()
+        if roll < 0.3 and len(words) > 1:
+            words.pop(random.randrange(len(words)))
+        elif roll < 0.6:
+            i = random.randrange(len(words))
+            w = words[i]
+            j = random.randrange(len(w))
+            words[i] = w[:j] + random.choice("aeiourst") + w[j + 1:]
+        else:
+            words = random.sample(vocab, random.randint(2, 5))
+        texts.add(" ".join(words))
+
+    return sorted(texts)[:n]
+
+
+def assignments(clusters, n):
+    """
+    Frozen member set of the cluster each text ended up in.
+    """
+    member_sets = [None] * n
+    for cluster in clusters:
+        members = frozenset(cluster)
+        for i in cluster:
+            member_sets[i] = members
+    return member_sets
+
+
+if __name__ == "__main__":
+    num_texts = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else 0.8
+    random.seed(0)
+
+    texts = description_corpus(num_texts)
+    embeddings = np.asarray(embed_texts(texts), dtype=np.float32)
+    print(f"{len(texts)} descriptions, {embeddings.shape[1]} dims, threshold {threshold}")
+
+    reference = assignments(
+        cluster_from_similarity(pairwise_similarity(embeddings), threshold),
+        len(texts)
+    )
+
+    print(f"{'pca':>6}{'matrix s':>10}{'peak MB':>10}{'proj MB':>10}{'changed':>10}")
+    for k in PCA_COMPONENTS:
+        projection = Projection.fit(embeddings, k) if k else None
+        resident = projection.components.nbytes if projection is not None else 0
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        sim = pairwise_similarity(embeddings, projection=projection)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        clusters = assignments(cluster_from_similarity(sim, threshold), len(texts))
+        changed = np.mean([a != b for a, b in zip(clusters, reference)])
+
+        print(
+            f"{k or '-':>6}{elapsed:>10.3f}{peak / 2 ** 20:>10.1f}"
+            f"{resident / 2 ** 20:>10.2f}{changed:>10.2%}"
+        )
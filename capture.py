@@ -0,0 +1,86 @@
+import json
+import os
+import random
+import threading
+import time
+import uuid
+
+from flask import request
+
+from serializer import dumps
+from constants import (
+    CAPTURE_ENABLED, CAPTURE_PATH, CAPTURE_SAMPLE_RATE,
+    CAPTURE_MAX_BODY_BYTES, CAPTURE_MAX_FILE_MB
+)
+
+
+# ------------------------------------------------------------------
+# /analyze request capture
+#
+# Appends a sample of incoming /analyze bodies to a JSONL file, one
+# {"id", "ts", "query", "payload"} record per line. The same file
+# feeds benchmarks/replay.py and reanalyze.py. Off unless
+# CAPTURE_ENABLED is set; bodies over CAPTURE_MAX_BODY_BYTES are
+# skipped and capture stops once the file reaches CAPTURE_MAX_FILE_MB.
+# ------------------------------------------------------------------
+CAPTURED_PATHS = ("/analyze",)
+
+
+class RequestCapture:
+
+    def __init__(self, path=CAPTURE_PATH, sample_rate=CAPTURE_SAMPLE_RATE,
+                 max_body_bytes=CAPTURE_MAX_BODY_BYTES, max_file_mb=CAPTURE_MAX_FILE_MB,
+                 enabled=CAPTURE_ENABLED):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self.max_file_bytes = max_file_mb * 1024 * 1024
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.captured = 0
+        self.skipped_too_large = 0
+        self.skipped_file_full = 0
+
+    def init_app(self, app):
+        if self.enabled:
+            app.before_request(self.capture)
+
+    def capture(self):
+        if request.method != "POST" or request.path not in CAPTURED_PATHS:
+            return
+        if random.random() >= self.sample_rate:
+            return
+        if (request.content_length or 0) > self.max_body_bytes:
+            self.skipped_too_large += 1
+            return
+
+        try:
+            payload = json.loads(request.get_data())
+        except ValueError:
+            return  # the view reports bad bodies
+
+        line = dumps({
+            "id": uuid.uuid4().hex,
+            "ts": time.time(),
+            "query": request.query_string.decode("utf-8"),
+            "payload": payload
+        }) + b"\n"
+
+        with self._lock:
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_file_bytes:
+                self.skipped_file_full += 1
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(line)
+            self.captured += 1
+
+    def metrics(self):
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "sample_rate": self.sample_rate,
+            "captured": self.captured,
+            "skipped_too_large": self.skipped_too_large,
+            "skipped_file_full": self.skipped_file_full
+        }
@@ -0,0 +1,323 @@
+import numpy as np
+import pandas as pd
+
+from constants import FIELDS_TO_COMPARE
+
+
+# ------------------------------------------------------------------
+# Columnar order results
+#
+# Hand-off between order analysis, aggregation and the proposers. All
+# per-order findings live in typed arrays sorted by order index; field
+# values are dictionary-encoded. The dict shape returned by
+# analyze_single_order is only produced when a response is serialized.
+# ------------------------------------------------------------------
+OP = "TaskListOperationInternalId"
+COMPARED_FIELDS = [field for field in FIELDS_TO_COMPARE if field != "Quantity"]
+FIELD_CODES = {field: code for code, field in enumerate(COMPARED_FIELDS)}
+
+
+class StringDictionary:
+    """
+    Value <-> int32 code mapping shared by every chunk of one analysis.
+    Missing values (None / NaN) share a single code decoding to None.
+    """
+
+    def __init__(self):
+        self.values = []
+        self._index = {}
+
+    def encode(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode_many(self, values):
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        lookup = np.array(
+            [self.encode(v) for v in uniques] + [self.encode(None)],
+            dtype=np.int32
+        )
+        return lookup[codes]  # -1 (missing) maps to the trailing None code
+
+    def decode(self, codes):
+        return [self.values[c] for c in codes]
+
+
+def _field_mismatches(actual, planned, dictionary):
+    """
+    Row positions where actual != planned, plus the dictionary codes of
+    the actual values there. Columns sharing a CategoricalDtype are
+    compared by category code; anything else falls back to objects.
+    A value missing on both sides is a match (the original object
+    frames held None there, and None != None is False).
+    """
+    if (isinstance(actual.dtype, pd.CategoricalDtype)
+            and actual.dtype == planned.dtype):
+        actual_codes = actual.cat.codes.to_numpy()
+        mismatch = np.flatnonzero(actual_codes != planned.cat.codes.to_numpy())
+        # Category code -> dictionary code; -1 (missing) hits the None slot
+        lookup = dictionary.encode_many(actual.cat.categories.to_numpy(dtype=object))
+        lookup = np.append(lookup, dictionary.encode(None))
+        return mismatch, lookup[actual_codes[mismatch]]
+
+    both_missing = (actual.isna() & planned.isna()).to_numpy()
+    actual = actual.to_numpy(dtype=object)
+    planned = planned.to_numpy(dtype=object)
+    mismatch = np.flatnonzero(np.asarray(actual != planned, dtype=bool) & ~both_missing)
+    return mismatch, dictionary.encode_many(actual[mismatch])
+
+
+def _bounds(order_codes, n_orders):
+    return np.searchsorted(order_codes, np.arange(n_orders + 1))
+
+
+class OrderResultStore:
+
+    def __init__(self, dictionary=None):
+        self.dictionary = dictionary or StringDictionary()
+        self.order_ids = np.empty(0, dtype=object)
+
+        self.quantity_order = np.empty(0, dtype=np.int32)
+        self.quantity_op = np.empty(0, dtype=np.int64)
+        self.quantity_delta = np.empty(0, dtype=np.float64)
+
+        self.field_order = np.empty(0, dtype=np.int32)
+        self.field_op = np.empty(0, dtype=np.int64)
+        self.field_code = np.empty(0, dtype=np.int8)
+        self.field_value = np.empty(0, dtype=np.int32)
+
+        self.missing_order = np.empty(0, dtype=np.int32)
+        self.missing_op = np.empty(0, dtype=np.int64)
+
+        self.new_op_order = np.empty(0, dtype=np.int32)
+        self.new_ops = pd.DataFrame()
+
+    def __len__(self):
+        return len(self.order_ids)
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory held by this store (the shared dictionary
+        is not counted).
+        """
+        arrays = [value for value in vars(self).values() if isinstance(value, np.ndarray)]
+        return (
+            sum(a.nbytes for a in arrays)
+            + sum(len(str(order_id)) + 49 for order_id in self.order_ids)
+            + int(self.new_ops.memory_usage(deep=True).sum())
+        )
+
+    # --------------------------------------------------------------
+    # Construction
+    # --------------------------------------------------------------
+    @classmethod
+    def from_frames(cls, mo_df, task_df, dictionary=None):
+        """
+        Vectorized equivalent of analyze_single_order over every order
+        in mo_df.
+        """
+        store = cls(dictionary)
+
+        codes, order_ids = pd.factorize(mo_df["MaintenanceOrder"], sort=True)
+        codes = codes.astype(np.int32)
+        store.order_ids = np.asarray(order_ids, dtype=object)
+        op_ids = mo_df[OP].to_numpy(dtype=np.int64)
+
+        # New operations (InternalId = 0)
+        is_new = op_ids == 0
+        new_order = np.argsort(codes[is_new], kind="stable")
+        store.new_op_order = codes[is_new][new_order]
+        store.new_ops = mo_df[is_new].iloc[new_order]
+
+        # Missing operations: master ops absent from each order
+        task_ops = np.unique(task_df[OP].to_numpy(dtype=np.int64))
+        pos = np.searchsorted(task_ops, op_ids)
+        known = pos < len(task_ops)
+        known[known] = task_ops[pos[known]] == op_ids[known]
+        present = np.zeros((len(store.order_ids), len(task_ops)), dtype=bool)
+        present[codes[known], pos[known]] = True
+        missing_order, missing_pos = np.nonzero(~present)
+        store.missing_order = missing_order.astype(np.int32)
+        store.missing_op = task_ops[missing_pos]
+
+        # Planned vs actual, rows kept in per-order input order
+        merged = mo_df.assign(_order=codes, _row=np.arange(len(mo_df))).merge(
+            task_df,
+            on=OP,
+            how="inner",
+            suffixes=("_actual", "_planned")
+        ).sort_values(["_order", "_row"], kind="stable")
+
+        row_order = merged["_order"].to_numpy(dtype=np.int32)
+        row_op = merged[OP].to_numpy(dtype=np.int64)
+
+        store.quantity_order = row_order
+        store.quantity_op = row_op
+        store.quantity_delta = (
+            merged["Quantity_H_actual"].to_numpy(dtype=np.float64)
+            - merged["Quantity_H_planned"].to_numpy(dtype=np.float64)
+        )
+
+        rows, field_codes, values = [], [], []
+        for field, code in FIELD_CODES.items():
+            mismatch, encoded = _field_mismatches(
+                merged[f"{field}_actual"], merged[f"{field}_planned"], store.dictionary
+            )
+            rows.append(mismatch)
+            field_codes.append(np.full(len(mismatch), code, dtype=np.int8))
+            values.append(encoded)
+
+        rows = np.concatenate(rows)
+        field_codes = np.concatenate(field_codes)
+        values = np.concatenate(values).astype(np.int32)
+        by_row = np.lexsort((field_codes, rows))
+
+        store.field_order = row_order[rows[by_row]]
+        store.field_op = row_op[rows[by_row]]
+        store.field_code = field_codes[by_row]
+        store.field_value = values[by_row]
+
+        return store
+
+    @classmethod
+    def concat(cls, parts, dictionary=None):
+        """
+        Joins stores built over consecutive order ranges into a single
+        store. Parts with a dictionary other than the target one get
+        their field values re-encoded.
+        """
+        store = cls(dictionary or (parts[0].dictionary if parts else None))
+        if not parts:
+            return store
+
+        offsets = np.cumsum([0] + [len(p) for p in parts[:-1]])
+        store.order_ids = np.concatenate([p.order_ids for p in parts])
+
+        for prefix in ("quantity", "field", "missing", "new_op"):
+            order_attr = f"{prefix}_order"
+            setattr(store, order_attr, np.concatenate([
+                getattr(p, order_attr) + off for p, off in zip(parts, offsets)
+            ]).astype(np.int32))
+
+        for attr in ("quantity_op", "quantity_delta", "field_op", "field_code", "missing_op"):
+            setattr(store, attr, np.concatenate([getattr(p, attr) for p in parts]))
+
+        field_values = []
+        for p in parts:
+            if p.dictionary is store.dictionary:
+                field_values.append(p.field_value)
+            else:
+                lookup = np.array(
+                    [store.dictionary.encode(v) for v in p.dictionary.values], dtype=np.int32
+                )
+                field_values.append(lookup[p.field_value])
+        store.field_value = np.concatenate(field_values).astype(np.int32)
+
+        store.new_ops = pd.concat([p.new_ops for p in parts])
+        return store
+
+    def slice(self, start, stop):
+        """
+        Store restricted to orders [start, stop).
+        """
+        out = OrderResultStore(self.dictionary)
+        out.order_ids = self.order_ids[start:stop]
+
+        for prefix, attrs in (
+            ("quantity", ("quantity_op", "quantity_delta")),
+            ("field", ("field_op", "field_code", "field_value")),
+            ("missing", ("missing_op",)),
+        ):
+            order = getattr(self, f"{prefix}_order")
+            lo, hi = np.searchsorted(order, [start, stop])
+            setattr(out, f"{prefix}_order", order[lo:hi] - start)
+            for attr in attrs:
+                setattr(out, attr, getattr(self, attr)[lo:hi])
+
+        lo, hi = np.searchsorted(self.new_op_order, [start, stop])
+        out.new_op_order = self.new_op_order[lo:hi] - start
+        out.new_ops = self.new_ops.iloc[lo:hi]
+        return out
+
+    # --------------------------------------------------------------
+    # Output shapes (serialization time only)
+    # --------------------------------------------------------------
+    def to_dict(self):
+        """
+        {order_id: analyze_single_order-shaped result}
+        """
+        n = len(self)
+        q = _bounds(self.quantity_order, n)
+        f = _bounds(self.field_order, n)
+        m = _bounds(self.missing_order, n)
+        x = _bounds(self.new_op_order, n)
+
+        quantity_op = self.quantity_op.tolist()
+        quantity_delta = self.quantity_delta.tolist()
+        field_op = self.field_op.tolist()
+        field_name = [COMPARED_FIELDS[c] for c in self.field_code.tolist()]
+        field_value = self.dictionary.decode(self.field_value.tolist())
+        missing_op = self.missing_op.tolist()
+        new_ops = self.new_ops.to_dict("records")
+
+        results = {}
+        for i, order_id in enumerate(self.order_ids.tolist()):
+            results[order_id] = {
+                "new_operations": new_ops[x[i]:x[i + 1]],
+                "missing_operations": missing_op[m[i]:m[i + 1]],
+                "quantity_deltas": [
+                    {OP: quantity_op[j], "delta": quantity_delta[j]}
+                    for j in range(q[i], q[i + 1])
+                ],
+                "field_deltas": [
+                    {OP: field_op[j], "field": field_name[j], "actual": field_value[j]}
+                    for j in range(f[i], f[i + 1])
+                ]
+            }
+        return results
+
+    def order_result(self, index):
+        return next(iter(self.slice(index, index + 1).to_dict().values()))
+
+    def summary(self):
+        """
+        Per-order row counts.
+        """
+        n = len(self)
+        counts = {
+            "new_operations": np.bincount(self.new_op_order, minlength=n),
+            "missing_operations": np.bincount(self.missing_order, minlength=n),
+            "quantity_deltas": np.bincount(self.quantity_order, minlength=n),
+            "field_deltas": np.bincount(self.field_order, minlength=n)
+        }
+        columns = {section: c.tolist() for section, c in counts.items()}
+        return {
+            order_id: {section: c[i] for section, c in columns.items()}
+            for i, order_id in enumerate(self.order_ids.tolist())
+        }
+
+    def to_columns(self):
+        """
+        Flat column arrays; "order" columns index into "orders" and
+        field names / values index into "dictionaries".
+        """
+        new_ops = {col: self.new_ops[col].tolist() for col in self.new_ops.columns}
+        new_ops["order"] = self.new_op_order
+
+        return {
+            "orders": self.order_ids.tolist(),
+            "new_operations": new_ops,
+            "missing_operations": {"order": self.missing_order, OP: self.missing_op},
+            "quantity_deltas": {
+                "order": self.quantity_order, OP: self.quantity_op, "delta": self.quantity_delta
+            },
+            "field_deltas": {
+                "order": self.field_order, OP: self.field_op,
+                "field": self.field_code, "actual": self.field_value
+            },
+            "dictionaries": {"field": COMPARED_FIELDS, "actual": self.dictionary.values}
+        }
@@ -1,3 +1,5 @@
+import os
+
 UNIT_CONVERSION_TO_HOURS = {
     "H": 1.0,
     "MIN": 1 / 60,
@@ -28,4 +30,113 @@ UNIT_PREFERENCE_RULES = {
 }
 ENABLE_SEMANTIC_DESC = True
 MIN_PRESENCE_RATIO = 0.2
-MIN_ORDERED_NEEDED_FOR_DELETE = 10
\ No newline at end of file
+MIN_ORDERED_NEEDED_FOR_DELETE = 10
+
+# Default proposal thresholds (overridable per request)
+PROPOSAL_THRESHOLDS = {
+    "min_order_ratio": 0.6,
+    "z_score_max": 2.5,
+    "min_delta_hours": 0.25,
+    "semantic_similarity": 0.8,
+    "existing_op_similarity": 0.8,
+    "min_presence_ratio": MIN_PRESENCE_RATIO
+}
+
+# Largest threshold grid (number of combinations) one /proposals sweep
+# may request
+SWEEP_MAX_POINTS = int(os.environ.get("SWEEP_MAX_POINTS", 1000))
+
+# Sketch-based quantity statistics (constant memory per op)
+ENABLE_STREAMING_STATS = False
+SKETCH_COMPRESSION = 100
+
+# Incremental analysis state (SQLite)
+ORDER_STORE_PATH = os.environ.get("ORDER_STORE_PATH", "orderStore.sqlite3")
+
+# Cached aggregates for what-if proposal runs and order pages. With
+# more than one server worker they are shared through SQLite, so a
+# follow-up request can land on any worker.
+AGG_CACHE_MAX_ENTRIES = 32
+AGG_CACHE_SHARED = os.environ.get(
+    "AGG_CACHE_SHARED", "1" if int(os.environ.get("WEB_WORKERS", 1)) > 1 else "0"
+) in ("1", "true")
+AGG_CACHE_PATH = os.environ.get("AGG_CACHE_PATH", "aggCache.sqlite3")
+AGG_CACHE_MAX_MB = int(os.environ.get("AGG_CACHE_MAX_MB", 1024))
+# In-process copies (per worker), by sizeof() of the cached entries
+AGG_CACHE_MEMORY_MB = int(os.environ.get("AGG_CACHE_MEMORY_MB", 256))
+
+# Default page size for paginated order_level_analysis
+ORDER_PAGE_SIZE = 1000
+
+# Orders per chunk in streamed /analyze responses
+STREAM_CHUNK_ORDERS = 100
+
+# Admission control for /analyze (per worker process). The memory
+# budget covers the pipeline caches and the in-process aggregate cache:
+# their maxima are reserved out of it.
+ADMISSION_MEMORY_BUDGET_MB = int(os.environ.get("ADMISSION_MEMORY_BUDGET_MB", 2048))
+ADMISSION_CPU_SLOTS = int(os.environ.get("ADMISSION_CPU_SLOTS", 2))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", 16))
+ADMISSION_QUEUE_TIMEOUT_S = float(os.environ.get("ADMISSION_QUEUE_TIMEOUT_S", 10))
+ADMISSION_BYTES_MULTIPLIER = 6     # parsed JSON + frames relative to raw body size
+ADMISSION_BYTES_PER_ROW = 4096     # per-operation analysis structures
+
+# Identical concurrent /analyze requests share one computation
+ENABLE_COALESCING = os.environ.get("ENABLE_COALESCING", "1") in ("1", "true")
+
+# Per-request deadlines: share of the budget reserved after order analysis
+DEADLINE_RESERVE_FRACTION = 0.2
+
+# Process pool size for /analyze/batch
+# (default: the cores left per server worker)
+BATCH_WORKERS = int(os.environ.get(
+    "BATCH_WORKERS", max(1, (os.cpu_count() or 1) // int(os.environ.get("WEB_WORKERS", 1)))
+))
+
+# Orders per vectorized analysis chunk (deadline checks run between chunks)
+ANALYZE_CHUNK_ORDERS = 2000
+
+# String columns dictionary-encoded with one dtype across task_df / mo_df
+SHARED_CATEGORICAL_COLUMNS = ["WorkCenter", "Plant", "Unit", "OperationDescription"]
+
+# Memoized /analyze pipeline stages (whole-stage results / order chunks)
+PIPELINE_STAGE_CACHE_ENTRIES = 16
+PIPELINE_CHUNK_CACHE_ENTRIES = 256
+PIPELINE_STAGE_CACHE_MAX_MB = int(os.environ.get("PIPELINE_STAGE_CACHE_MAX_MB", 512))
+PIPELINE_CHUNK_CACHE_MAX_MB = int(os.environ.get("PIPELINE_CHUNK_CACHE_MAX_MB", 256))
+PIPELINE_CHUNK_TARGET_ORDERS = 1000   # average orders per content-defined chunk
+
+# Payload fixtures (gzipped JSON) and /analyze request capture
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CAPTURE_ENABLED = os.environ.get("CAPTURE_ENABLED", "0") in ("1", "true")
+CAPTURE_PATH = os.environ.get("CAPTURE_PATH", os.path.join("captures", "requests.jsonl"))
+CAPTURE_SAMPLE_RATE = float(os.environ.get("CAPTURE_SAMPLE_RATE", 0.01))
+CAPTURE_MAX_BODY_BYTES = int(os.environ.get("CAPTURE_MAX_BODY_BYTES", 5 * 1024 * 1024))
+CAPTURE_MAX_FILE_MB = int(os.environ.get("CAPTURE_MAX_FILE_MB", 512))
+
+# Embedding reuse: per-text vectors and master description indexes
+EMBEDDING_CACHE_MAX_TEXTS = 20000
+MASTER_INDEX_CACHE_ENTRIES = 32
+
+# Cluster assignments per distinct description variant set
+CLUSTER_CACHE_MAX_ENTRIES = 4096
+CLUSTER_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Lexical pre-clustering ahead of embedding (MinHash + LSH)
+LEXICAL_MINHASH_PERMUTATIONS = 64
+LEXICAL_LSH_BANDS = 16                # 4 rows per band
+LEXICAL_JACCARD_THRESHOLD = 0.85
+
+# Embedding model: exported artifact directory (see modelArtifacts.py)
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_MODEL_DIR = os.environ.get("EMBEDDING_MODEL_DIR", os.path.join("models", EMBEDDING_MODEL_NAME))
+EMBEDDING_MODEL_MMAP = os.environ.get("EMBEDDING_MODEL_MMAP", "1") in ("1", "true")
+
+# Shared memory-mapped embedding store (one directory per model)
+ENABLE_EMBEDDING_STORE = os.environ.get("ENABLE_EMBEDDING_STORE", "1") in ("1", "true")
+EMBEDDING_STORE_DIR = os.environ.get("EMBEDDING_STORE_DIR", "embeddingStore")
+EMBEDDING_STORE_DTYPE = os.environ.get("EMBEDDING_STORE_DTYPE", "float32")
+EMBEDDING_STORE_MAX_ROWS = int(os.environ.get("EMBEDDING_STORE_MAX_ROWS", 200000))
+
+# Similarity computation: optional PCA dimension (0 = off)
+SIMILARITY_PCA_COMPONENTS = int(os.environ.get("SIMILARITY_PCA_COMPONENTS", 0))
@@ -0,0 +1,62 @@
+import math
+import time
+
+
+# ------------------------------------------------------------------
+# Per-request deadline
+#
+# Stages call expired() between units of work and record what they
+# skipped, so a request that runs out of time still returns the
+# proposals that finished plus a description of what is missing.
+# ------------------------------------------------------------------
+class Deadline:
+
+    def __init__(self, seconds=None, reserve_fraction=0.0, started_at=None):
+        """
+        started_at: time.monotonic() the clock starts from (default
+        now); pass the request's arrival so queueing counts.
+        """
+        self.seconds = seconds
+        if started_at is None:
+            started_at = time.monotonic()
+        self.expires_at = None if seconds is None else started_at + seconds
+        # Share of the budget kept back for proposals + serialization
+        self.reserve = 0.0 if seconds is None else seconds * reserve_fraction
+        self.skipped = []
+        self.details = {}
+
+    def remaining(self):
+        if self.expires_at is None:
+            return float("inf")
+        return self.expires_at - time.monotonic()
+
+    def expired(self, keep_reserve=False):
+        return self.remaining() <= (self.reserve if keep_reserve else 0.0)
+
+    def skip(self, stage, **details):
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+        self.details.update(details)
+
+    def report(self):
+        return {
+            "deadline_seconds": self.seconds,
+            "partial": bool(self.skipped),
+            "skipped": list(self.skipped),
+            **self.details
+        }
+
+
+def parse_deadline_ms(value):
+    """
+    Seconds for a deadline_ms / X-Deadline-Ms value (None when unset).
+    """
+    if value is None:
+        return None
+    try:
+        ms = float(value)
+    except ValueError:
+        raise ValueError(f"deadline_ms must be a number of milliseconds: {value}")
+    if not math.isfinite(ms) or ms <= 0:
+        raise ValueError(f"deadline_ms must be positive: {value}")
+    return ms / 1000
@@ -1,13600 +1,9 @@
 import pandas as pd
 from setupData import *
-v = {
-    "count": 2,
-    "results": [
-        {
-            "d": {
-                "results": [
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009904",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800204",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000300",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180020400000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5096452",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009904",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001800204",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000638",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756191936000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756191936000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180020400000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "/Date(1756166400000)/",
-                        "OpActualExecutionStartTime": "PT07H05M36S",
-                        "OpActualExecutionEndDate": "/Date(1756166400000)/",
-                        "OpActualExecutionEndTime": "PT07H05M36S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "3.0",
-                        "ActualWorkQuantity": "3.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5096453",
-                        "MaintOrderConfCntrValue": "1",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "PCNF JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009904",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001800204",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180020400000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5096454",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009904",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001800204",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180020400000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5096455",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009904",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001800204",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180020400000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5096456",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009904",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800204",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737154800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737154800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180020400000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737072000000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5096457",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009904',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009907",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001802067",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000300",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756072800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756072800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756072800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756072800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180206700000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755993600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755993600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755993600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755993600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5100399",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009907",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001802067",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000638",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756193127000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756194704000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756193127000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756194704000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756193127000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756194704000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180206700000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756166400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT07H25M27S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756166400000)/",
-                        "OpErlstSchedldExecEndTme": "PT07H51M44S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756166400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT07H25M27S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756166400000)/",
-                        "OpLtstSchedldExecEndTme": "PT07H51M44S",
-                        "OpActualExecutionStartDate": "/Date(1756166400000)/",
-                        "OpActualExecutionStartTime": "PT07H25M27S",
-                        "OpActualExecutionEndDate": "/Date(1756166400000)/",
-                        "OpActualExecutionEndTime": "PT07H51M44S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "4.0",
-                        "ActualWorkQuantity": "2.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5100400",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "PCNF JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009907",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001802067",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000638",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756197951000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756197951000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756197951000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756197951000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756197951000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1759443764000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180206700000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756166400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT08H45M51S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756166400000)/",
-                        "OpErlstSchedldExecEndTme": "PT08H45M51S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756166400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT08H45M51S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756166400000)/",
-                        "OpLtstSchedldExecEndTme": "PT08H45M51S",
-                        "OpActualExecutionStartDate": "/Date(1756166400000)/",
-                        "OpActualExecutionStartTime": "PT08H45M51S",
-                        "OpActualExecutionEndDate": "/Date(1759363200000)/",
-                        "OpActualExecutionEndTime": "PT22H22M44S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "1.0",
-                        "ActualWorkQuantity": "0.200",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5100401",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "PCNF JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009907',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009942",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800648",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000195",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755678766000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755762828000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755678766000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755762828000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1755678766000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1755789746000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "10713420",
-                        "FunctionalLocation": "?0100000000000013543",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180064800000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT08H32M46S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT07H53M48S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT08H32M46S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT07H53M48S",
-                        "OpActualExecutionStartDate": "/Date(1755648000000)/",
-                        "OpActualExecutionStartTime": "PT08H32M46S",
-                        "OpActualExecutionEndDate": "/Date(1755734400000)/",
-                        "OpActualExecutionEndTime": "PT15H22M26S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "1.0",
-                        "ActualWorkQuantity": "1.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097198",
-                        "MaintOrderConfCntrValue": "4",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "PCNF JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009942",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001800648",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000300",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755657639000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755657639000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1755657639000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1755755758000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180064800000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT02H40M39S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT05H55M58S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT02H40M39S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT05H55M58S",
-                        "OpActualExecutionStartDate": "/Date(1755648000000)/",
-                        "OpActualExecutionStartTime": "PT02H40M39S",
-                        "OpActualExecutionEndDate": "/Date(1755734400000)/",
-                        "OpActualExecutionEndTime": "PT05H55M58S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "6.0",
-                        "ActualWorkQuantity": "6.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097199",
-                        "MaintOrderConfCntrValue": "3",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "PCNF JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009942",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001800648",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000636",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1755767790000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1755767842000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "10713420",
-                        "FunctionalLocation": "?0100000000000013543",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180064800000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT05H55M58S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT05H55M58S",
-                        "OpActualExecutionStartDate": "/Date(1755734400000)/",
-                        "OpActualExecutionStartTime": "PT09H16M30S",
-                        "OpActualExecutionEndDate": "/Date(1755734400000)/",
-                        "OpActualExecutionEndTime": "PT09H17M22S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "5.0",
-                        "ActualWorkQuantity": "5.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097200",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009942",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001800648",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180064800000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT05H55M58S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT05H55M58S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097201",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009942",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001800648",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000636",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1755768834000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1755768869000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180064800000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT05H55M58S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT05H55M58S",
-                        "OpActualExecutionStartDate": "/Date(1755734400000)/",
-                        "OpActualExecutionStartTime": "PT09H33M54S",
-                        "OpActualExecutionEndDate": "/Date(1755734400000)/",
-                        "OpActualExecutionEndTime": "PT09H34M29S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "8.0",
-                        "ActualWorkQuantity": "8.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097202",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009942",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800648",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755755758000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755755758000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180064800000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT05H55M58S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT05H55M58S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT05H55M58S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097203",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009942',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009958",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800719",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180071900000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097332",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009958",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Check the Cartridge",
-                        "MaintOrderRoutingNumber": "1001800719",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180071900000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097333",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009958",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001800719",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180071900000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097336",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009958",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800719",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745100000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745100000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180071900000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745020800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097337",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009958',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009959",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800723",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1752962400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1752962400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1752962400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1752962400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072300000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1752883200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1752883200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1752883200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1752883200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097345",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009959",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Replace the Power wire connection",
-                        "MaintOrderRoutingNumber": "1001800723",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1752962400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1752962400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1752962400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1752962400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072300000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1752883200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1752883200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1752883200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1752883200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097349",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009959",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800723",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1752962400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1752962400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1752962400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1752962400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072300000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1752883200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1752883200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1752883200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1752883200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097350",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009959',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009962",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800727",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755554400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755554400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755554400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755554400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072700000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755475200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755475200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755475200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755475200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097354",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009962",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Change the rolls",
-                        "MaintOrderRoutingNumber": "1001800727",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755554400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755554400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755554400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755554400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072700000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755475200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755475200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755475200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755475200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097359",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009962',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009963",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800729",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072900000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097361",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009963",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001800729",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072900000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097362",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009963",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001800729",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072900000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097363",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009963",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001800729",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072900000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097364",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009963",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001800729",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072900000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097365",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009963",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800729",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180072900000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097366",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009963',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009964",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800730",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073000000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097367",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009964",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001800730",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073000000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097368",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009964",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001800730",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073000000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097369",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009964",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001800730",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073000000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097370",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009964",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001800730",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073000000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097371",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009964",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800730",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755640800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755640800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073000000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755561600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097372",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009964',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009966",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001800732",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073200000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097374",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009966",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001800732",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073200000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097375",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009966",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001800732",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073200000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097376",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009966",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001800732",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073200000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097377",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009966",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001800732",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073200000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097378",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000009966",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001800732",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1754085600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1754085600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180073200000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1754006400000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5097379",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000009966',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010041",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Dismantle the Boiler",
-                        "MaintOrderRoutingNumber": "1001801524",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737327600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737327600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737327600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737327600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152400000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737244800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737244800000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737244800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737244800000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098848",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010041",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001801524",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737327600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737327600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737327600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737327600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152400000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737244800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737244800000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737244800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737244800000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098852",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010041",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001801524",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1737327600000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1737327600000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1737327600000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1737327600000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152400000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1737244800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1737244800000)/",
-                        "OpErlstSchedldExecEndTme": "PT23H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1737244800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT23H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1737244800000)/",
-                        "OpLtstSchedldExecEndTme": "PT23H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098853",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010041',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010042",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Dismantle the Boiler",
-                        "MaintOrderRoutingNumber": "1001801525",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152500000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098854",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010042",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Remove the screws",
-                        "MaintOrderRoutingNumber": "1001801525",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152500000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098855",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010042",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001801525",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152500000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098858",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010042",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001801525",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1745186400000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1745186400000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152500000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1745107200000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098859",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010042',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010043",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001801526",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152600000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098860",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010043",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001801526",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152600000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098861",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010043",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001801526",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152600000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098862",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010043",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001801526",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152600000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098863",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010043",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001801526",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152600000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098864",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010043",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001801526",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152600000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098865",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010043',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010044",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001801527",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152700000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098866",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010044",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001801527",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152700000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098867",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010044",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001801527",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152700000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098868",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010044",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001801527",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152700000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098869",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010044",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001801527",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152700000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098870",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010044",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001801527",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152700000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098871",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CRTD",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010044',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010045",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Replace pin and dial",
-                        "MaintOrderRoutingNumber": "1001801528",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152800000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098874",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010045",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001801528",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152800000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098876",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010045",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001801528",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755727200000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755727200000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152800000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755648000000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098877",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JBFI TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010045',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010046",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001801529",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1755790593000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1755790641000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1755790593000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1755790641000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1755790593000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1755790641000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152900000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecStrtTme": "PT15H36M33S",
-                        "OpErlstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpErlstSchedldExecEndTme": "PT15H37M21S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecStrtTme": "PT15H36M33S",
-                        "OpLtstSchedldExecEndDte": "/Date(1755734400000)/",
-                        "OpLtstSchedldExecEndTme": "PT15H37M21S",
-                        "OpActualExecutionStartDate": "/Date(1755734400000)/",
-                        "OpActualExecutionStartTime": "PT15H36M33S",
-                        "OpActualExecutionEndDate": "/Date(1755734400000)/",
-                        "OpActualExecutionEndTime": "PT15H37M21S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "15.0",
-                        "ActualWorkQuantity": "15.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098878",
-                        "MaintOrderConfCntrValue": "3",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010046",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001801529",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756446820000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756446846000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756446820000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756446846000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756446820000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756446846000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152900000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT05H53M40S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecEndTme": "PT05H54M06S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT05H53M40S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecEndTme": "PT05H54M06S",
-                        "OpActualExecutionStartDate": "/Date(1756425600000)/",
-                        "OpActualExecutionStartTime": "PT05H53M40S",
-                        "OpActualExecutionEndDate": "/Date(1756425600000)/",
-                        "OpActualExecutionEndTime": "PT05H54M06S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "4.0",
-                        "ActualWorkQuantity": "4.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098882",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010046",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001801529",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756449338000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756449363000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756449338000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756449363000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756449338000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756449363000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180152900000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT06H35M38S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecEndTme": "PT06H36M03S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT06H35M38S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecEndTme": "PT06H36M03S",
-                        "OpActualExecutionStartDate": "/Date(1756425600000)/",
-                        "OpActualExecutionStartTime": "PT06H35M38S",
-                        "OpActualExecutionEndDate": "/Date(1756425600000)/",
-                        "OpActualExecutionEndTime": "PT06H36M03S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "3.0",
-                        "ActualWorkQuantity": "3.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5098883",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  TECO",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010046',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010396",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001804644",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000300",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756504800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756504800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756504800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756504800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180464400000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105205",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010396",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001804644",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000638",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756504800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756504800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756504800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756504800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180464400000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105206",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010396",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001804644",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000638",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756504800000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756504800000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756504800000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756504800000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180464400000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756425600000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105207",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010396',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010420",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "NP_OP10",
-                        "OperationDescription": "Dsimantle the boiler",
-                        "MaintOrderRoutingNumber": "1001804788",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756895775000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756895797000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756895775000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756895797000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756895775000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756895797000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180478800000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT10H36M15S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT10H36M37S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT10H36M15S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT10H36M37S",
-                        "OpActualExecutionStartDate": "/Date(1756857600000)/",
-                        "OpActualExecutionStartTime": "PT10H36M15S",
-                        "OpActualExecutionEndDate": "/Date(1756857600000)/",
-                        "OpActualExecutionEndTime": "PT10H36M37S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "1.0",
-                        "ActualWorkQuantity": "1.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105471",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010420",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "NP_OP10",
-                        "OperationDescription": "REmove the rods",
-                        "MaintOrderRoutingNumber": "1001804788",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756722467000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756722508000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756722467000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756722508000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756722467000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756722508000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180478800000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756684800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT10H27M47S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756684800000)/",
-                        "OpErlstSchedldExecEndTme": "PT10H28M28S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756684800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT10H27M47S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756684800000)/",
-                        "OpLtstSchedldExecEndTme": "PT10H28M28S",
-                        "OpActualExecutionStartDate": "/Date(1756684800000)/",
-                        "OpActualExecutionStartTime": "PT10H27M47S",
-                        "OpActualExecutionEndDate": "/Date(1756684800000)/",
-                        "OpActualExecutionEndTime": "PT10H28M28S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "2.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105472",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "PCNF JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010420",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001804788",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756722508000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756722508000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756722508000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756722508000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180478800000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756684800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT10H28M28S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756684800000)/",
-                        "OpErlstSchedldExecEndTme": "PT10H28M28S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756684800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT10H28M28S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756684800000)/",
-                        "OpLtstSchedldExecEndTme": "PT10H28M28S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105473",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010420",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001804788",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756801392000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756801413000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756801392000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756801413000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756801392000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756801413000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180478800000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756771200000)/",
-                        "OpErlstSchedldExecStrtTme": "PT08H23M12S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756771200000)/",
-                        "OpErlstSchedldExecEndTme": "PT08H23M33S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756771200000)/",
-                        "OpLtstSchedldExecStrtTme": "PT08H23M12S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756771200000)/",
-                        "OpLtstSchedldExecEndTme": "PT08H23M33S",
-                        "OpActualExecutionStartDate": "/Date(1756771200000)/",
-                        "OpActualExecutionStartTime": "PT08H23M12S",
-                        "OpActualExecutionEndDate": "/Date(1756771200000)/",
-                        "OpActualExecutionEndTime": "PT08H23M33S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "2.0",
-                        "ActualWorkQuantity": "2.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105474",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010420",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001804788",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756723360000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756723378000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756723360000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756723378000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756723360000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756723378000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180478800000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756684800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT10H42M40S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756684800000)/",
-                        "OpErlstSchedldExecEndTme": "PT10H42M58S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756684800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT10H42M40S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756684800000)/",
-                        "OpLtstSchedldExecEndTme": "PT10H42M58S",
-                        "OpActualExecutionStartDate": "/Date(1756684800000)/",
-                        "OpActualExecutionStartTime": "PT10H42M40S",
-                        "OpActualExecutionEndDate": "/Date(1756684800000)/",
-                        "OpActualExecutionEndTime": "PT10H42M58S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "4.0",
-                        "ActualWorkQuantity": "4.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105475",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010420",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001804788",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756894825000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756894846000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756894825000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756894846000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756894825000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756894846000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180478800000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT10H20M25S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT10H20M46S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT10H20M25S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT10H20M46S",
-                        "OpActualExecutionStartDate": "/Date(1756857600000)/",
-                        "OpActualExecutionStartTime": "PT10H20M25S",
-                        "OpActualExecutionEndDate": "/Date(1756857600000)/",
-                        "OpActualExecutionEndTime": "PT10H20M46S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "1.0",
-                        "ActualWorkQuantity": "1.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5105476",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010420',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010483",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "GKOPEXT",
-                        "OperationDescription": "Dismantle the Boiler",
-                        "MaintOrderRoutingNumber": "1001805402",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756899644000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756899644000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756899644000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756899667000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180540200000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT11H40M44S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT11H41M07S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT11H40M44S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT11H41M07S",
-                        "OpActualExecutionStartDate": "/Date(1756857600000)/",
-                        "OpActualExecutionStartTime": "PT11H40M44S",
-                        "OpActualExecutionEndDate": "/Date(1756857600000)/",
-                        "OpActualExecutionEndTime": "PT11H41M07S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "1.0",
-                        "ActualWorkQuantity": "1.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5106978",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010483",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001805402",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpActualExecutionStartDateTime": "/Date(1756900714000+0000)/",
-                        "OpActualExecutionEndDateTime": "/Date(1756900736000+0000)/",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "10713958",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180540200000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT11H41M07S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT11H41M07S",
-                        "OpActualExecutionStartDate": "/Date(1756857600000)/",
-                        "OpActualExecutionStartTime": "PT11H58M34S",
-                        "OpActualExecutionEndDate": "/Date(1756857600000)/",
-                        "OpActualExecutionEndTime": "PT11H58M56S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "2.0",
-                        "ActualWorkQuantity": "2.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5106979",
-                        "MaintOrderConfCntrValue": "2",
-                        "MaintOrdOpHasNoRemainingWork": True,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "CNF  JBFI PWF  REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010483",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001805402",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180540200000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT11H41M07S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT11H41M07S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5106980",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010483",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001805402",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180540200000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT11H41M07S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT11H41M07S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5106981",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010483",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001805402",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180540200000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT11H41M07S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT11H41M07S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5106982",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010483",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001805402",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "EN",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "0",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1756899667000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1756899667000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180540200000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpErlstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpErlstSchedldExecEndTme": "PT11H41M07S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecStrtTme": "PT11H41M07S",
-                        "OpLtstSchedldExecEndDte": "/Date(1756857600000)/",
-                        "OpLtstSchedldExecEndTme": "PT11H41M07S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5106983",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010483',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010747",
-                        "MaintenanceOrderOperation": "0010",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Dismantle the Printer",
-                        "MaintOrderRoutingNumber": "1001808361",
-                        "MaintenanceOrderRoutingNode": "1",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000176",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180836100000001",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5114123",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "JIPR REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "1",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0010',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010747",
-                        "MaintenanceOrderOperation": "0020",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "REmove the Toner",
-                        "MaintOrderRoutingNumber": "1001808361",
-                        "MaintenanceOrderRoutingNode": "2",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000176",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180836100000002",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5114124",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "2",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0020',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010747",
-                        "MaintenanceOrderOperation": "0030",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Replace all Gears",
-                        "MaintOrderRoutingNumber": "1001808361",
-                        "MaintenanceOrderRoutingNode": "3",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000176",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180836100000003",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5114125",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "3",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0030',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010747",
-                        "MaintenanceOrderOperation": "0040",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Inspect the power supply",
-                        "MaintOrderRoutingNumber": "1001808361",
-                        "MaintenanceOrderRoutingNode": "4",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000176",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "2.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180836100000004",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5114126",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "4",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0040',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010747",
-                        "MaintenanceOrderOperation": "0050",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Clean",
-                        "MaintOrderRoutingNumber": "1001808361",
-                        "MaintenanceOrderRoutingNode": "5",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000176",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "4.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180836100000005",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5114127",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "5",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0050',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    },
-                    {
-                        "__metadata": {
-                            "id": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')",
-                            "type": "cds_api_maintenanceorder_2.MaintenanceOrderOperationType"
-                        },
-                        "MaintenanceOrder": "670000010747",
-                        "MaintenanceOrderOperation": "0060",
-                        "MaintenanceOrderSubOperation": "",
-                        "OperationControlKey": "PM01",
-                        "OperationWorkCenterInternalID": "10022507",
-                        "WorkCenter": "BGL3001",
-                        "Plant": "1710",
-                        "OperationStandardTextCode": "",
-                        "OperationDescription": "Assemble and check",
-                        "MaintOrderRoutingNumber": "1001808361",
-                        "MaintenanceOrderRoutingNode": "6",
-                        "SuperiorOperationInternalID": "0",
-                        "OperationWorkCenterTypeCode": "A",
-                        "Language": "",
-                        "NumberOfTimeTickets": "0",
-                        "OperationPurgInfoRecdSearchTxt": "",
-                        "OperationSupplier": "",
-                        "OpExternalProcessingPrice": "0.00",
-                        "OpExternalProcessingPriceUnit": "0",
-                        "OpExternalProcessingCurrency": "USD",
-                        "CostElement": "",
-                        "OperationPurchasingInfoRecord": "",
-                        "PurchasingOrganization": "",
-                        "PurchasingGroup": "",
-                        "MaterialGroup": "",
-                        "OpPurchaseOutlineAgreement": "",
-                        "OpPurchaseOutlineAgreementItem": "0",
-                        "OperationRequisitionerName": "",
-                        "OperationTrackingNumber": "",
-                        "NumberOfCapacities": 0,
-                        "OperationWorkPercent": 0,
-                        "OperationCalculationControl": "",
-                        "ActivityType": "",
-                        "OperationSystemCondition": "",
-                        "OperationGoodsRecipientName": "",
-                        "OperationUnloadingPointName": "",
-                        "OperationPersonResponsible": "50000176",
-                        "DeliveryTimeInDays": "0",
-                        "MaintOrderOperationDuration": "0.0",
-                        "MaintOrdOperationDurationUnit": "H",
-                        "OpErlstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpErlstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecStrtDteTme": "/Date(1758060000000+0000)/",
-                        "OpLtstSchedldExecEndDteTme": "/Date(1758060000000+0000)/",
-                        "OpActualExecutionStartDateTime": "",
-                        "OpActualExecutionEndDateTime": "",
-                        "OpBscStartDateConstraintType": "",
-                        "OpBscEndDateConstraintType": "",
-                        "MaintOrdOperationWorkDuration": "1.0",
-                        "MaintOrdOpWorkDurationUnit": "H",
-                        "MaintOrdOpConstraintStrtDteTme": "",
-                        "ConstraintDateForBscStartDate": "",
-                        "ConstraintTimeForBscStartTime": "PT00H00M00S",
-                        "MaintOrdOpCstrtFinishDteTme": "",
-                        "ConstraintDateForBscFinishDate": "",
-                        "ConstraintTimeForBscFinishTime": "PT00H00M00S",
-                        "MaintOrdOperationExecutionRate": "1",
-                        "Equipment": "",
-                        "FunctionalLocation": "",
-                        "MaintenanceActivityType": "",
-                        "BusinessArea": "",
-                        "ProfitCenter": "",
-                        "CostingSheet": "",
-                        "TaxJurisdiction": "",
-                        "FunctionalArea": "",
-                        "PurReqnOrResvnGeneration": "3",
-                        "MaintControllingObjectClass": "OC",
-                        "WrkCtrIntCapRqmtsDistr": "",
-                        "MaintOrdOperationOverheadCode": "",
-                        "MaintOrderOperationQuantity": "1.000",
-                        "MaintOrdOperationQuantityUnit": "",
-                        "Assembly": "",
-                        "MaintOperationExecStageCode": "",
-                        "MaintOrdOpAssgdWBSElmntInt": "0",
-                        "WBSElement": "",
-                        "IsMarkedForDeletion": False,
-                        "MaintOrderOperationInternalID": "OV100180836100000006",
-                        "MaintenanceObjectListItem": 0,
-                        "PurchaseRequisition": "",
-                        "PurchaseRequisitionItem": "0",
-                        "OpErlstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpErlstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpErlstSchedldExecEndTme": "PT22H00M00S",
-                        "OpLtstSchedldExecStrtDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecStrtTme": "PT22H00M00S",
-                        "OpLtstSchedldExecEndDte": "/Date(1757980800000)/",
-                        "OpLtstSchedldExecEndTme": "PT22H00M00S",
-                        "OpActualExecutionStartDate": "",
-                        "OpActualExecutionStartTime": "PT00H00M00S",
-                        "OpActualExecutionEndDate": "",
-                        "OpActualExecutionEndTime": "PT00H00M00S",
-                        "ActyConfFcstdEndDate": "",
-                        "ActyConfFcstdEndTime": "PT00H00M00S",
-                        "ActyConfForecastedEndDateTime": "",
-                        "ForecastWorkQuantity": "0.0",
-                        "ActualWorkQuantity": "0.000",
-                        "MaintOrdOpProcessPhaseCode": "",
-                        "MaintOrdOpProcessSubPhaseCode": "",
-                        "AllMaintOrdCompCmtdQtsAreKept": False,
-                        "ControllingArea": "A000",
-                        "MaintOrderConfirmation": "5114128",
-                        "MaintOrderConfCntrValue": "0",
-                        "MaintOrdOpHasNoRemainingWork": False,
-                        "MaintOrdOpHasLeanServices": False,
-                        "MaintOrdOpDelivDateAdjustment": "",
-                        "TaskListType": "A",
-                        "TaskListGroup": "9960",
-                        "TaskListGroupCounter": "1",
-                        "MaintOperationalChecklistType": "",
-                        "SystemStatusText": "REL",
-                        "UserStatusText": "",
-                        "TaskListOperationInternalId": "6",
-                        "to_MaintenanceOrder": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintenanceOrder"
-                            }
-                        },
-                        "to_MaintOrderOpComponent_2": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpComponent_2"
-                            }
-                        },
-                        "to_MaintOrderOpLongText": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpLongText"
-                            }
-                        },
-                        "to_MaintOrderOpPhaseControl": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpPhaseControl"
-                            }
-                        },
-                        "to_MaintOrderOpProdnRsceTool": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpProdnRsceTool"
-                            }
-                        },
-                        "to_MaintOrderOpRelationship": {
-                            "__deferred": {
-                                "uri": "https://ldai1qm7.wdf.sap.corp:44320/sap/opu/odata/sap/API_MAINTENANCEORDER;v=2/MaintenanceOrderOperation(MaintenanceOrder='670000010747',MaintenanceOrderOperation='0060',MaintenanceOrderSubOperation='')/to_MaintOrderOpRelationship"
-                            }
-                        }
-                    }
-                ]
-            }
-        },
-        {
-            "@odata.context": "$metadata#MaintenanceTaskListOperation",
-            "@odata.metadataEtag": "W/\"20260105204605\"",
-            "value": [
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "1",
-                    "TaskListOpBOMItmIntVersCounter": "1",
-                    "MaintenanceTaskListOperation": "10",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "Dismantle the Printer",
-                    "OperationControlProfile": "PM01",
-                    "WorkCenter": "BGL3001",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 1.0,
-                    "OpWorkQuantityUnit": "H",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2025-08-19",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
+from fixtures import load_fixture
 
-                    ]
-                },
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "2",
-                    "TaskListOpBOMItmIntVersCounter": "2",
-                    "MaintenanceTaskListOperation": "20",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "REmove the Toner",
-                    "OperationControlProfile": "PM01",
-                    "WorkCenter": "BGL3001",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 2.0,
-                    "OpWorkQuantityUnit": "H",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2025-08-19",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
-
-                    ]
-                },
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "3",
-                    "TaskListOpBOMItmIntVersCounter": "3",
-                    "MaintenanceTaskListOperation": "30",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "Replace all Gears",
-                    "OperationControlProfile": "PM01",
-                    "WorkCenter": "BGL3001",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 4.0,
-                    "OpWorkQuantityUnit": "H",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2025-08-19",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
-
-                    ]
-                },
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "4",
-                    "TaskListOpBOMItmIntVersCounter": "4",
-                    "MaintenanceTaskListOperation": "40",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "Inspect the power supply",
-                    "OperationControlProfile": "PM01",
-                    "WorkCenter": "BGL3001",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 2.0,
-                    "OpWorkQuantityUnit": "H",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2025-08-19",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
-
-                    ]
-                },
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "5",
-                    "TaskListOpBOMItmIntVersCounter": "5",
-                    "MaintenanceTaskListOperation": "50",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "Clean",
-                    "OperationControlProfile": "PM01",
-                    "WorkCenter": "BGL3001",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 4.0,
-                    "OpWorkQuantityUnit": "H",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2025-08-19",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
-
-                    ]
-                },
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "6",
-                    "TaskListOpBOMItmIntVersCounter": "6",
-                    "MaintenanceTaskListOperation": "60",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "Assemble and check",
-                    "OperationControlProfile": "PM01",
-                    "WorkCenter": "BGL3001",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 1.0,
-                    "OpWorkQuantityUnit": "H",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2025-08-19",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
-
-                    ]
-                },
-                {
-                    "TaskListType": "A",
-                    "TaskListGroup": "9960",
-                    "TaskListGroupCounter": "1",
-                    "TaskListSequence": "0",
-                    "TaskListOperationInternalId": "7",
-                    "TaskListOpBOMItmIntVersCounter": "7",
-                    "MaintenanceTaskListOperation": "70",
-                    "MaintOperationExecStageCode": "",
-                    "OperationText": "DEMO",
-                    "OperationControlProfile": "0001",
-                    "WorkCenter": "RES-0200",
-                    "Plant": "1710",
-                    "Assembly": "",
-                    "OperationCalculationControl": "",
-                    "OpPlannedWorkQuantity": 0.0,
-                    "OpWorkQuantityUnit": "",
-                    "NumberOfCapacities": 0,
-                    "PurchaseOrderQty": 0.000,
-                    "PurchaseOrderQuantityUnit": "",
-                    "OperationStandardDuration": 0.0,
-                    "OperationStandardDurationUnit": "",
-                    "CostCtrActivityType": "",
-                    "MaterialGroup": "",
-                    "OpExternalProcessingPrice": 0.00,
-                    "OpExternalProcessingCurrency": "USD",
-                    "CostElement": "",
-                    "PurchasingGroup": "",
-                    "PurchasingOrganization": "",
-                    "PurchaseContract": "",
-                    "PurchaseContractItem": "0",
-                    "Supplier": "",
-                    "ChangeNumber": "",
-                    "PurchasingInfoRecord": "",
-                    "IsBusinessPurposeCompleted": "",
-                    "SupplierAccountGroup": "",
-                    "AuthorizationGroup": "",
-                    "TaskListStatus": "4",
-                    "ResponsiblePlannerGroup": "",
-                    "MaintenancePlanningPlant": "",
-                    "MaintenancePlannerGroup": "",
-                    "ControllingArea": "",
-                    "CostCenter": "",
-                    "MaintenancePlant": "",
-                    "ValidityStartDate": "2026-01-05",
-                    "ValidityEndDate": "9999-12-31",
-                    "TechnicalObject": "",
-                    "TechObjIsEquipOrFuncnlLoc": "",
-                    "MaintOperationalChecklistType": "",
-                    "MaintenanceActivityType": "",
-                    "SAP__Messages": [
-
-                    ]
-                }
-            ]
-        }
-    ]
-}
+# Real-shaped SAP OData payload (fixtures/sap_odata_payload.json.gz)
+v = load_fixture("sap_odata_payload")
 
 # print(v['results'][1]['value'][0].keys())
 
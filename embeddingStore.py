@@ -0,0 +1,206 @@
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+from constants import EMBEDDING_STORE_DTYPE, EMBEDDING_STORE_MAX_ROWS
+
+
+# ------------------------------------------------------------------
+# Memory-mapped embedding store shared across worker processes
+#
+# <dir>/vectors.bin holds fixed-size rows, <dir>/index.jsonl one JSON
+# string (the text) per row. Both files are append-only. Every process
+# maps vectors.bin read-only, so the OS page cache holds one copy no
+# matter how many workers read it. Appends from any process are
+# serialized with flock; vectors are written before their index lines,
+# so a row only becomes visible once it is complete. A torn write from
+# a crashed writer is cut back to the last indexed row by the next one.
+#
+# The store holds at most max_rows rows: an append that would pass the
+# cap first compacts it to the most recently added half, writing new
+# files and renaming them into place. Readers take a shared lock while
+# they refresh and start over when <dir>/generation changed (a
+# compaction bumps it); the mapping they already hold stays valid. A store written
+# with another dim / dtype is a stale cache and is reset.
+# ------------------------------------------------------------------
+class EmbeddingStore:
+
+    def __init__(self, path, dim, dtype=EMBEDDING_STORE_DTYPE, max_rows=EMBEDDING_STORE_MAX_ROWS):
+        self.path = path
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.row_bytes = dim * self.dtype.itemsize
+        self.max_rows = max_rows
+
+        self._vectors_path = os.path.join(path, "vectors.bin")
+        self._index_path = os.path.join(path, "index.jsonl")
+        self._lock_path = os.path.join(path, ".lock")
+        self._generation_path = os.path.join(path, "generation")
+
+        self._rows = {}
+        self._count = 0
+        self._index_offset = 0
+        self._generation = None
+        self._matrix = None
+        self._lock = threading.Lock()
+        self.compactions = 0
+
+        os.makedirs(path, exist_ok=True)
+        with self._file_lock():
+            self._check_meta()
+            for p in (self._vectors_path, self._index_path):
+                open(p, "ab").close()
+        self.refresh()
+
+    def __len__(self):
+        return self._count
+
+    @contextmanager
+    def _file_lock(self, shared=False):
+        with open(self._lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _check_meta(self):
+        meta_path = os.path.join(self.path, "meta.json")
+        meta = {"dim": self.dim, "dtype": self.dtype.name}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                stored = json.load(f)
+            if stored == meta:
+                return
+            print(f"Embedding store {self.path} holds {stored}, expected {meta}: resetting it")
+            for p in (self._vectors_path, self._index_path):
+                if os.path.exists(p):
+                    os.remove(p)
+            self._bump_generation()
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+    def refresh(self):
+        """
+        Picks up rows appended by other processes since the last call.
+        """
+        with self._file_lock(shared=True):
+            self._refresh()
+
+    def _refresh(self):
+        # Caller holds the file lock (shared or exclusive)
+        with self._lock:
+            generation = self._read_generation()
+            if generation != self._generation:
+                # First call, or the store was compacted: start over
+                self._rows, self._count, self._index_offset = {}, 0, 0
+                self._matrix = None
+                self._generation = generation
+
+            with open(self._index_path, "rb") as f:
+                f.seek(self._index_offset)
+                data = f.read()
+
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                self._rows.setdefault(json.loads(line), self._count)
+                self._count += 1
+            self._index_offset += end
+
+            n = self._count
+            if n and (self._matrix is None or len(self._matrix) < n):
+                self._matrix = np.memmap(
+                    self._vectors_path, dtype=self.dtype, mode="r", shape=(n, self.dim)
+                )
+
+    def _read_generation(self):
+        try:
+            with open(self._generation_path) as f:
+                return int(f.read() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _bump_generation(self):
+        # Caller holds the exclusive file lock
+        generation = self._read_generation() + 1
+        with open(self._generation_path, "w") as f:
+            f.write(str(generation))
+
+    def get(self, texts):
+        """
+        (float32 vectors, found mask) row-aligned with texts; rows of
+        texts that are not stored are zero.
+        """
+        if any(t not in self._rows for t in texts):
+            self.refresh()
+
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        with self._lock:
+            rows = np.array([self._rows.get(t, -1) for t in texts], dtype=np.int64)
+            found = rows >= 0
+            if found.any():
+                out[found] = self._matrix[rows[found]]
+        return out, found
+
+    def all_vectors(self):
+        self.refresh()
+        with self._lock:
+            if self._matrix is None:
+                return np.empty((0, self.dim), dtype=np.float32)
+            return np.asarray(self._matrix[:self._count], dtype=np.float32)
+
+    def append(self, texts, vectors):
+        with self._file_lock():
+            self._refresh()
+
+            new = {}
+            for text, vector in zip(texts, vectors):
+                if text not in self._rows and text not in new:
+                    new[text] = vector
+            if not new:
+                return
+
+            if self._count + len(new) > self.max_rows:
+                self._compact(max(0, min(self.max_rows // 2, self.max_rows - len(new))))
+
+            n = self._count
+            matrix = np.asarray(list(new.values()), dtype=self.dtype).reshape(len(new), self.dim)
+
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(n * self.row_bytes)
+                f.seek(n * self.row_bytes)
+                f.write(matrix.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            with open(self._index_path, "r+b") as f:
+                f.truncate(self._index_offset)
+                f.seek(self._index_offset)
+                f.write(b"".join(json.dumps(t).encode("utf-8") + b"\n" for t in new))
+
+        self.refresh()
+
+    def _compact(self, keep):
+        # Caller holds the exclusive file lock; keeps the last `keep` rows
+        with self._lock:
+            texts = sorted(self._rows, key=self._rows.get)[self._count - keep:] if keep else []
+            rows = np.array([self._rows[t] for t in texts], dtype=np.int64)
+            matrix = self._matrix[rows] if keep else np.empty((0, self.dim), dtype=self.dtype)
+
+        for target, data in (
+            (self._vectors_path, np.ascontiguousarray(matrix, dtype=self.dtype).tobytes()),
+            (self._index_path, b"".join(json.dumps(t).encode("utf-8") + b"\n" for t in texts)),
+        ):
+            with open(target + ".tmp", "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(target + ".tmp", target)
+
+        self._bump_generation()
+        self.compactions += 1
+        self._refresh()
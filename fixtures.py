@@ -0,0 +1,62 @@
+import gzip
+import json
+import os
+
+from constants import FIXTURES_DIR
+
+
+# ------------------------------------------------------------------
+# Payload fixtures
+#
+# Real-shaped /analyze payloads stored as gzipped JSON under
+# fixtures/, so scripts and benchmarks can load them without
+# compiling a large Python literal.
+#
+#   sap_odata_payload      raw SAP OData sample; its empty units make
+#                          build_data_model fail, so /analyze answers 500
+#   generated_orders_1000  generate_large_payload(1000) with seed 0, an
+#                          analyzable payload for replay / benchmarks
+#
+# Regenerate a generated fixture with
+#   python fixtures.py generated_orders_1000 1000
+# ------------------------------------------------------------------
+FIXTURE_SUFFIX = ".json.gz"
+
+
+def fixture_path(name, fixtures_dir=FIXTURES_DIR):
+    return os.path.join(fixtures_dir, name + FIXTURE_SUFFIX)
+
+
+def list_fixtures(fixtures_dir=FIXTURES_DIR):
+    return sorted(
+        name[:-len(FIXTURE_SUFFIX)]
+        for name in os.listdir(fixtures_dir) if name.endswith(FIXTURE_SUFFIX)
+    )
+
+
+def load_fixture(name, fixtures_dir=FIXTURES_DIR):
+    with gzip.open(fixture_path(name, fixtures_dir), "rb") as f:
+        return json.loads(f.read())
+
+
+def save_fixture(name, payload, fixtures_dir=FIXTURES_DIR):
+    os.makedirs(fixtures_dir, exist_ok=True)
+    # mtime=0 keeps the file byte-identical for identical payloads
+    with gzip.GzipFile(fixture_path(name, fixtures_dir), "wb", mtime=0) as f:
+        f.write(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+
+def generate_fixture(name, num_orders, seed=0, fixtures_dir=FIXTURES_DIR):
+    """
+    Saves a seeded generate_large_payload(num_orders) as a fixture.
+    """
+    import random
+    from dataCreation import generate_large_payload
+
+    random.seed(seed)
+    save_fixture(name, generate_large_payload(num_orders), fixtures_dir)
+
+
+if __name__ == "__main__":
+    import sys
+    generate_fixture(sys.argv[1], int(sys.argv[2]))
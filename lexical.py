@@ -0,0 +1,95 @@
+import re
+import threading
+import zlib
+
+import numpy as np
+
+from constants import (
+    LEXICAL_MINHASH_PERMUTATIONS, LEXICAL_LSH_BANDS, LEXICAL_JACCARD_THRESHOLD
+)
+
+
+# ------------------------------------------------------------------
+# Lexical pre-clustering
+#
+# Collapses description variants that need no model to tell apart:
+#   1. token-set key: casing, punctuation, repeated words and word
+#      order are ignored ("Replace seal" == "seal - replace").
+#   2. MinHash over character 3-grams of the key, bucketed with LSH;
+#      a text joins the first earlier group representative whose
+#      estimated Jaccard similarity reaches LEXICAL_JACCARD_THRESHOLD
+#      (typos, plurals).
+# Only one representative per group is embedded.
+# ------------------------------------------------------------------
+_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.default_rng(20240601)
+# a < 2^32, b < 2^31 and crc32 hashes < 2^32 keep a * h + b below 2^64
+_PERM_A = _rng.integers(1, 1 << 32, LEXICAL_MINHASH_PERMUTATIONS, dtype=np.uint64)[:, None]
+_PERM_B = _rng.integers(0, 1 << 31, LEXICAL_MINHASH_PERMUTATIONS, dtype=np.uint64)[:, None]
+
+_metrics = {"texts": 0, "token_set_groups": 0, "lexical_groups": 0}
+_metrics_lock = threading.Lock()
+
+
+def token_set_key(text):
+    return " ".join(sorted(set(re.findall(r"[a-z0-9]+", str(text).lower()))))
+
+
+def minhash(key):
+    padded = f" {key} "
+    shingles = {padded[i:i + 3] for i in range(max(1, len(padded) - 2))}
+    hashes = np.array([zlib.crc32(s.encode("utf-8")) for s in shingles], dtype=np.uint64)
+    return ((_PERM_A * hashes[None, :] + _PERM_B) % _PRIME).min(axis=1)
+
+
+def lexical_groups(texts, threshold=LEXICAL_JACCARD_THRESHOLD):
+    """
+    Returns (group per text, index of each group's representative).
+    Representatives are the first text of their group, so ordering
+    texts by frequency makes the most common variant represent it.
+    """
+    keys = [token_set_key(t) for t in texts]
+    group_of = np.empty(len(texts), dtype=np.int64)
+    reps = []
+    by_key = {}
+    signatures = []
+    buckets = {}
+    rows = LEXICAL_MINHASH_PERMUTATIONS // LEXICAL_LSH_BANDS
+
+    for i, key in enumerate(keys):
+        group = by_key.get(key)
+
+        if group is None:
+            sig = minhash(key)
+            bands = [sig[b * rows:(b + 1) * rows].tobytes() for b in range(LEXICAL_LSH_BANDS)]
+
+            candidates = sorted({g for b, band in enumerate(bands) for g in buckets.get((b, band), ())})
+            for g in candidates:
+                if (signatures[g] == sig).mean() >= threshold:
+                    group = g
+                    break
+
+            if group is None:
+                group = len(reps)
+                reps.append(i)
+                signatures.append(sig)
+                for b, band in enumerate(bands):
+                    buckets.setdefault((b, band), []).append(group)
+
+            by_key[key] = group
+
+        group_of[i] = group
+
+    with _metrics_lock:
+        _metrics["texts"] += len(texts)
+        _metrics["token_set_groups"] += len(by_key)
+        _metrics["lexical_groups"] += len(reps)
+
+    return group_of, reps
+
+
+def lexical_metrics():
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    metrics["embeddings_saved"] = metrics["texts"] - metrics["lexical_groups"]
+    return metrics
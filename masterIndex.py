@@ -0,0 +1,98 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from utils import normalize_description
+from nlpUtils import embed_cached
+from constants import MASTER_INDEX_CACHE_ENTRIES
+
+OP = "TaskListOperationInternalId"
+
+
+# ------------------------------------------------------------------
+# Embedding index over master task list descriptions
+#
+# Built once per task list (keyed by its op ids + descriptions) and
+# kept in a small LRU, so matching new operations against the master
+# is one batched embedding call plus one matrix product per request.
+# ------------------------------------------------------------------
+class MasterIndex:
+
+    def __init__(self, task_df):
+        ops = task_df[[OP, "OperationDescription"]].drop_duplicates(OP)
+        descriptions = ops["OperationDescription"].astype(object).tolist()
+        normalized = [normalize_description(d) for d in descriptions]
+        keep = [i for i, n in enumerate(normalized) if n]
+
+        self.op_ids = ops[OP].to_numpy(dtype=np.int64)[keep]
+        self.descriptions = [descriptions[i] for i in keep]
+        self.embeddings = embed_cached([normalized[i] for i in keep])
+
+    def __len__(self):
+        return len(self.op_ids)
+
+    def nearest(self, texts):
+        """
+        Closest master op for each normalized text.
+        Returns (positions into op_ids, cosine similarities).
+        """
+        if not len(self) or not len(texts):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        sims = embed_cached(texts) @ self.embeddings.T
+        best = sims.argmax(axis=1)
+        return best, sims[np.arange(len(texts)), best]
+
+
+def description_key(task_df):
+    pairs = task_df[[OP, "OperationDescription"]].drop_duplicates(OP).sort_values(OP)
+    return hashlib.sha1(json.dumps(
+        [[int(op), str(desc)] for op, desc in pairs.itertuples(index=False)]
+    ).encode("utf-8")).hexdigest()
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def master_index(task_df):
+    key = description_key(task_df)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+
+    index = MasterIndex(task_df)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > MASTER_INDEX_CACHE_ENTRIES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def likely_existing_operations(task_df, descriptions, threshold):
+    """
+    For each description, the master op it most likely duplicates
+    ({TaskListOperationInternalId, Description, similarity}) or None
+    when nothing reaches threshold.
+    """
+    if not descriptions:
+        return []
+
+    normalized = [normalize_description(d) or "" for d in descriptions]
+    index = master_index(task_df)
+    positions, sims = index.nearest(normalized)
+
+    matches = [None] * len(descriptions)
+    for i, (pos, sim) in enumerate(zip(positions.tolist(), sims.tolist())):
+        if normalized[i] and sim >= threshold:
+            matches[i] = {
+                OP: int(index.op_ids[pos]),
+                "Description": index.descriptions[pos],
+                "similarity": round(sim, 3)
+            }
+    return matches
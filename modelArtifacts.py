@@ -0,0 +1,122 @@
+"""
+Local model artifacts for air-gapped nodes.
+
+    python modelArtifacts.py [--model all-MiniLM-L6-v2] [--out models/all-MiniLM-L6-v2]
+
+Exports a sentence-transformers model (from the hub, or any path it can
+load) into a self-contained directory with safetensors weights. Point
+EMBEDDING_MODEL_DIR at that directory and the service loads it without
+touching the hub.
+"""
+import argparse
+import json
+import os
+import struct
+import time
+
+from constants import EMBEDDING_MODEL_NAME, EMBEDDING_MODEL_DIR, EMBEDDING_MODEL_MMAP
+
+WEIGHTS_FILE = "model.safetensors"
+
+_SAFETENSORS_DTYPES = {
+    "F64": "float64", "F32": "float32", "F16": "float16", "BF16": "bfloat16",
+    "I64": "int64", "I32": "int32", "I16": "int16", "I8": "int8", "U8": "uint8",
+    "BOOL": "bool",
+}
+
+
+# ------------------------------------------------------------------
+# Memory-mapped safetensors
+#
+# The file is mapped privately (copy-on-write) and every tensor is a
+# view into that mapping, so weight pages come from the OS page cache
+# and are shared by every process that maps the same file; nothing is
+# copied unless a tensor is written to.
+# ------------------------------------------------------------------
+def mmap_state_dict(path):
+    import torch
+
+    with open(path, "rb") as f:
+        header_size = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_size))
+
+    storage = torch.UntypedStorage.from_file(path, shared=False, nbytes=os.path.getsize(path))
+    data = torch.empty(0, dtype=torch.uint8).set_(storage)
+    base = 8 + header_size
+
+    state = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        dtype = getattr(torch, _SAFETENSORS_DTYPES[info["dtype"]])
+        start, end = info["data_offsets"]
+        raw = data[base + start:base + end]
+        if (base + start) % dtype.itemsize:
+            raw = raw.clone()  # misaligned for a zero-copy view
+        state[name] = raw.view(dtype).reshape(info["shape"])
+    return state
+
+
+def _mmap_weights(model, directory):
+    path = os.path.join(directory, WEIGHTS_FILE)
+    if not os.path.exists(path):
+        return False
+
+    auto_model = model[0].auto_model
+    state = mmap_state_dict(path)
+    result = auto_model.load_state_dict(state, strict=False, assign=True)
+    missing = [k for k in result.missing_keys if k in dict(auto_model.named_parameters())]
+    if missing:
+        raise ValueError(f"{path} is missing weights: {missing[:5]}")
+    return True
+
+
+# ------------------------------------------------------------------
+# Loading
+# ------------------------------------------------------------------
+def load_embedding_model(name=EMBEDDING_MODEL_NAME, directory=EMBEDDING_MODEL_DIR,
+                         use_mmap=EMBEDDING_MODEL_MMAP):
+    """
+    SentenceTransformer from directory (offline) when it holds an
+    exported model, otherwise resolved by name through the hub cache.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    start = time.perf_counter()
+    local = os.path.exists(os.path.join(directory, "modules.json"))
+
+    if local:
+        model = SentenceTransformer(directory, device="cpu", local_files_only=True)
+        mapped = use_mmap and _mmap_weights(model, directory)
+        source = f"{directory} ({'memory-mapped' if mapped else 'copied'} weights)"
+    else:
+        print(f"No exported model in {directory}, resolving {name} through the hub cache")
+        model = SentenceTransformer(name, device="cpu")
+        source = name
+
+    print(f"Loaded embedding model from {source} in {time.perf_counter() - start:.2f}s")
+    return model
+
+
+def export_model(name, directory):
+    from sentence_transformers import SentenceTransformer
+
+    start = time.perf_counter()
+    model = SentenceTransformer(name, device="cpu")
+    model.save(directory, safe_serialization=True)
+
+    if not os.path.exists(os.path.join(directory, WEIGHTS_FILE)):
+        raise RuntimeError(f"export of {name} wrote no {WEIGHTS_FILE} to {directory}")
+    print(f"Exported {name} to {directory} in {time.perf_counter() - start:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default=EMBEDDING_MODEL_NAME)
+    parser.add_argument("--out", default=EMBEDDING_MODEL_DIR)
+    args = parser.parse_args(argv)
+    export_model(args.model, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,150 @@
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
 
-_embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+from threadConfig import thread_config, apply_runtime
+import numpy as np
+
+from constants import (
+    EMBEDDING_MODEL_NAME, EMBEDDING_CACHE_MAX_TEXTS,
+    ENABLE_EMBEDDING_STORE, EMBEDDING_STORE_DIR,
+    CLUSTER_CACHE_MAX_ENTRIES, CLUSTER_CACHE_MAX_BYTES
+)
+from lexical import lexical_groups, lexical_metrics
+from embeddingStore import EmbeddingStore
+from similarity import pairwise_similarity, load_projection
+from modelArtifacts import load_embedding_model
+
+_embedding_model = None
+_embedding_model_lock = threading.Lock()
+_embedding_store = None
+_embedding_store_disabled = not ENABLE_EMBEDDING_STORE
+_embedding_cache = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+_embedding_metrics = {"model_calls": 0, "texts_embedded": 0, "cache_hits": 0}
+_cluster_cache = OrderedDict()
+_cluster_cache_lock = threading.Lock()
+_cluster_cache_metrics = {"hits": 0, "misses": 0, "bytes": 0}
+
+
+def get_embedding_model():
+    """
+    Loaded on first use, so importing the app (and every non-semantic
+    path) never pulls in torch / sentence-transformers. serve.py calls
+    this before forking so workers share the loaded model.
+    """
+    global _embedding_model
+    if _embedding_model is None:
+        with _embedding_model_lock:
+            if _embedding_model is None:
+                _embedding_model = load_embedding_model()
+                # torch is only imported by the load above
+                apply_runtime(thread_config())
+    return _embedding_model
+
+
+def embedding_dimension():
+    return get_embedding_model().get_sentence_embedding_dimension()
 
 
 def embed_texts(texts):
-    return _embedding_model.encode(texts, normalize_embeddings=True)
+    return get_embedding_model().encode(texts, normalize_embeddings=True)
+
+
+def get_embedding_store():
+    """
+    The shared on-disk store for this model, or None when disabled or
+    not writable (embed_cached then falls back to the in-process LRU).
+    """
+    global _embedding_store, _embedding_store_disabled
+    if _embedding_store is None and not _embedding_store_disabled:
+        try:
+            _embedding_store = EmbeddingStore(
+                os.path.join(EMBEDDING_STORE_DIR, EMBEDDING_MODEL_NAME),
+                embedding_dimension()
+            )
+        except (OSError, ValueError) as e:
+            print(f"Embedding store disabled: {e}")
+            _embedding_store_disabled = True
+    return _embedding_store
+
+
+def embed_cached(texts):
+    """
+    Row-aligned embeddings for texts; only texts not seen before go
+    through the model (in one batch). Vectors live in the shared
+    embedding store, or in an LRU over EMBEDDING_CACHE_MAX_TEXTS.
+    """
+    texts = list(texts)
+    store = get_embedding_store()
+    if store is not None:
+        return _embed_stored(store, texts)
+
+    with _embedding_cache_lock:
+        missing = [t for t in dict.fromkeys(texts) if t not in _embedding_cache]
+        _embedding_metrics["cache_hits"] += len(texts) - len(missing)
+
+    if missing:
+        vectors = np.asarray(embed_texts(missing), dtype=np.float32)
+        with _embedding_cache_lock:
+            _embedding_cache.update(zip(missing, vectors))
+            _embedding_metrics["model_calls"] += 1
+            _embedding_metrics["texts_embedded"] += len(missing)
+
+    with _embedding_cache_lock:
+        rows = []
+        for t in texts:
+            vector = _embedding_cache.get(t)
+            if vector is None:  # evicted by a concurrent caller
+                vector = np.asarray(embed_texts([t]), dtype=np.float32)[0]
+                _embedding_cache[t] = vector
+            _embedding_cache.move_to_end(t)
+            rows.append(vector)
+        while len(_embedding_cache) > EMBEDDING_CACHE_MAX_TEXTS:
+            _embedding_cache.popitem(last=False)
+
+    if not rows:
+        return np.empty((0, embedding_dimension()), dtype=np.float32)
+    return np.stack(rows)
+
+
+def _embed_stored(store, texts):
+    vectors, found = store.get(texts)
+    missing = list(dict.fromkeys(t for t, hit in zip(texts, found) if not hit))
+
+    with _embedding_cache_lock:
+        _embedding_metrics["cache_hits"] += int(found.sum())
+
+    if missing:
+        embedded = np.asarray(embed_texts(missing), dtype=np.float32)
+        store.append(missing, embedded)
+        # Rounded like the stored copy, so hits and misses agree
+        by_text = dict(zip(missing, embedded.astype(store.dtype).astype(np.float32)))
+        for i in np.flatnonzero(~found):
+            vectors[i] = by_text[texts[i]]
+        with _embedding_cache_lock:
+            _embedding_metrics["model_calls"] += 1
+            _embedding_metrics["texts_embedded"] += len(missing)
+
+    return vectors
+
+
+def embedding_metrics():
+    store = _embedding_store
+    with _embedding_cache_lock:
+        metrics = dict(
+            _embedding_metrics,
+            model_loaded=_embedding_model is not None,
+            cached_texts=len(_embedding_cache) if store is None else len(store)
+        )
+    if store is not None:
+        metrics["store_compactions"] = store.compactions
+    metrics["lexical"] = lexical_metrics()
+    with _cluster_cache_lock:
+        metrics["cluster_cache"] = dict(_cluster_cache_metrics, entries=len(_cluster_cache))
+    return metrics
 
 
 def cluster_by_similarity(texts, threshold=0.8):
@@ -13,24 +152,165 @@ def cluster_by_similarity(texts, threshold=0.8):
     Groups texts by semantic similarity.
     Returns list of clusters (each cluster is list of indices).
     """
-    embeddings = embed_texts(texts)
-    sim_matrix = cosine_similarity(embeddings)
+    sim_matrix, members = lexical_similarity(texts)
+    return expand_clusters(cluster_from_similarity(sim_matrix, threshold), members)
+
+
+# ------------------------------------------------------------------
+# Cluster cache
+#
+# Keyed by (model, threshold, projection digest, distinct variants in
+# seeding order); holds one cluster label per distinct variant. A
+# hit skips embedding and clustering entirely. Bounded by entry count
+# and by the bytes held in label arrays.
+# ------------------------------------------------------------------
+def cluster_cache_key(variants, threshold):
+    projection = similarity_projection()
+    return hashlib.sha1(json.dumps([
+        EMBEDDING_MODEL_NAME, float(threshold),
+        projection.digest if projection is not None else None,
+        variants
+    ]).encode("utf-8")).hexdigest()
+
+
+def seeding_order(texts):
+    """
+    Distinct texts in the order greedy clustering seeds them: most
+    frequent first, ties in sorted order (as in cluster_new_operations).
+    Returns (variants, variant position of every text).
+    """
+    variants, inverse, counts = np.unique(
+        np.asarray(texts, dtype=object), return_inverse=True, return_counts=True
+    )
+    by_freq = np.argsort(-counts, kind="stable")
+    position = np.empty(len(by_freq), dtype=np.int64)
+    position[by_freq] = np.arange(len(by_freq))
+    return variants[by_freq].tolist(), position[inverse.ravel()]
+
 
+def cluster_cached_thresholds(texts, thresholds):
+    """
+    cluster_cached at several thresholds; thresholds missing from the
+    cache share one similarity matrix. One cluster list per threshold.
+    """
+    if not len(texts):
+        return [[] for _ in thresholds]
+
+    variants, text_variant = seeding_order(texts)
+    keys = [cluster_cache_key(variants, threshold) for threshold in thresholds]
+
+    with _cluster_cache_lock:
+        found = [_cluster_cache.get(key) for key in keys]
+        for key, labels in zip(keys, found):
+            if labels is not None:
+                _cluster_cache.move_to_end(key)
+                _cluster_cache_metrics["hits"] += 1
+
+    missing = [i for i, labels in enumerate(found) if labels is None]
+    if missing:
+        sim, members = lexical_similarity(variants)
+        for i in missing:
+            labels = np.empty(len(variants), dtype=np.int32)
+            clusters = expand_clusters(cluster_from_similarity(sim, thresholds[i]), members)
+            for label, cluster in enumerate(clusters):
+                labels[cluster] = label
+            found[i] = labels
+
+        with _cluster_cache_lock:
+            for i in missing:
+                _cluster_cache_metrics["misses"] += 1
+                if keys[i] not in _cluster_cache:
+                    _cluster_cache[keys[i]] = found[i]
+                    _cluster_cache_metrics["bytes"] += len(keys[i]) + found[i].nbytes
+            while _cluster_cache and (
+                len(_cluster_cache) > CLUSTER_CACHE_MAX_ENTRIES
+                or _cluster_cache_metrics["bytes"] > CLUSTER_CACHE_MAX_BYTES
+            ):
+                evicted_key, evicted = _cluster_cache.popitem(last=False)
+                _cluster_cache_metrics["bytes"] -= len(evicted_key) + evicted.nbytes
+
+    results = []
+    for labels in found:
+        text_labels = labels[text_variant]
+        order = np.argsort(text_labels, kind="stable")
+        bounds = np.searchsorted(text_labels[order], np.arange(1, labels.max() + 1))
+        results.append([cluster.tolist() for cluster in np.split(order, bounds)])
+    return results
+
+
+def cluster_cached(texts, threshold=0.8):
+    """
+    cluster_by_similarity over the distinct texts in seeding_order,
+    cached per variant set. Same return shape.
+    """
+    return cluster_cached_thresholds(texts, [threshold])[0]
+
+
+def lexical_similarity(texts):
+    """
+    Similarity matrix over lexical group representatives only, plus the
+    text indices each representative stands for.
+    """
+    group_of, reps = lexical_groups(texts)
+    by_group = np.argsort(group_of, kind="stable")
+    members = np.split(by_group, np.searchsorted(group_of[by_group], np.arange(1, len(reps))))
+
+    embeddings = embed_cached([texts[i] for i in reps])
+    return pairwise_similarity(embeddings, projection=similarity_projection()), members
+
+
+def expand_clusters(rep_clusters, members):
+    """
+    Clusters over representatives -> sorted clusters over the texts.
+    """
+    return [
+        sorted(np.concatenate([members[r] for r in cluster]).tolist())
+        for cluster in rep_clusters
+    ]
+
+
+def similarity_matrix(texts):
+    return pairwise_similarity(embed_cached(texts), projection=similarity_projection())
+
+
+def embedding_corpus():
+    """
+    Every embedding this process can see (the offline PCA fitting
+    corpus, see similarity.py).
+    """
+    store = get_embedding_store()
+    if store is not None:
+        return store.all_vectors()
+    with _embedding_cache_lock:
+        vectors = list(_embedding_cache.values())
+    if not vectors:
+        return np.empty((0, embedding_dimension()), dtype=np.float32)
+    return np.stack(vectors)
+
+
+def similarity_projection():
+    return load_projection()
+
+
+def cluster_from_similarity(sim_matrix, threshold=0.8):
+    """
+    Greedy threshold clustering over a precomputed similarity matrix.
+    """
+    sim_matrix = np.asarray(sim_matrix)
+    n = len(sim_matrix)
     clusters = []
-    used = set()
+    used = np.zeros(n, dtype=bool)
 
-    for i in range(len(texts)):
-        if i in used:
+    for i in range(n):
+        if used[i]:
             continue
 
-        cluster = [i]
-        used.add(i)
-
-        for j in range(i + 1, len(texts)):
-            if j not in used and sim_matrix[i][j] >= threshold:
-                cluster.append(j)
-                used.add(j)
+        members = i + 1 + np.flatnonzero(
+            (sim_matrix[i, i + 1:] >= threshold) & ~used[i + 1:]
+        )
+        used[i] = True
+        used[members] = True
 
-        clusters.append(cluster)
+        clusters.append([i] + members.tolist())
 
     return clusters
\ No newline at end of file
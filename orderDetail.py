@@ -0,0 +1,44 @@
+from constants import ORDER_PAGE_SIZE
+
+
+# ------------------------------------------------------------------
+# order_level_analysis shaping (full / summary / page / none)
+# ------------------------------------------------------------------
+ORDER_DETAIL_MODES = ("full", "summary", "page", "none")
+
+
+def summarize_order_results(order_results):
+    """
+    Per-order counts instead of the individual rows.
+    """
+    return order_results.summary()
+
+
+def encode_cursor(agg_id, offset):
+    return f"{agg_id}:{offset}"
+
+
+def decode_cursor(cursor):
+    agg_id, _, offset = (cursor or "").partition(":")
+    if not agg_id or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return agg_id, int(offset)
+
+
+def parse_page_size(value):
+    if value is None:
+        return ORDER_PAGE_SIZE
+    if not str(value).isdigit() or int(value) < 1:
+        raise ValueError(f"page_size must be a positive integer: {value}")
+    return int(value)
+
+
+def order_page(order_results, agg_id, offset=0, page_size=ORDER_PAGE_SIZE):
+    """
+    Returns (page, next_cursor) where page is an OrderResultStore slice;
+    next_cursor is None on the last page.
+    """
+    page = order_results.slice(offset, offset + page_size)
+    next_offset = offset + page_size
+    next_cursor = encode_cursor(agg_id, next_offset) if next_offset < len(order_results) else None
+    return page, next_cursor
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from constants import ORDER_STORE_PATH, ENABLE_STREAMING_STATS
+from setupData import analyze_orders, new_aggregate
+from streamStats import DeltaSketch
+
+
+# ------------------------------------------------------------------
+# Persistent order store for incremental analysis
+#
+# State is kept per task list (keyed by a hash of the master rows, so a
+# changed master starts from scratch). Each order's contribution is
+# stored next to the running aggregates, which lets a changed order be
+# subtracted and re-added without touching the others. Counts are
+# updated in SQL and each op keeps a DeltaSketch of its quantity deltas,
+# so ingesting new orders only writes rows for those orders plus the
+# (bounded) sketches of the ops they touch. A changed order triggers a
+# rebuild of its ops' sketches from their stored deltas, since
+# sketches cannot subtract. Exact stats read the per-order delta rows.
+# ------------------------------------------------------------------
+STORE_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    task_list_key TEXT, order_id TEXT, fingerprint TEXT,
+    PRIMARY KEY (task_list_key, order_id)
+);
+CREATE TABLE IF NOT EXISTS quantity_deltas (
+    task_list_key TEXT, order_id TEXT, op_id INTEGER, delta REAL
+);
+CREATE INDEX IF NOT EXISTS ix_quantity_deltas ON quantity_deltas (task_list_key, order_id);
+CREATE INDEX IF NOT EXISTS ix_quantity_deltas_op ON quantity_deltas (task_list_key, op_id);
+CREATE TABLE IF NOT EXISTS field_deltas (
+    task_list_key TEXT, order_id TEXT, op_id INTEGER, field TEXT, actual TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_field_deltas ON field_deltas (task_list_key, order_id);
+CREATE TABLE IF NOT EXISTS missing_ops (
+    task_list_key TEXT, order_id TEXT, op_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_missing_ops ON missing_ops (task_list_key, order_id);
+CREATE TABLE IF NOT EXISTS field_stats (
+    task_list_key TEXT, op_id INTEGER, field TEXT, actual TEXT, count INTEGER,
+    PRIMARY KEY (task_list_key, op_id, field, actual)
+);
+CREATE TABLE IF NOT EXISTS missing_ops_count (
+    task_list_key TEXT, op_id INTEGER, count INTEGER,
+    PRIMARY KEY (task_list_key, op_id)
+);
+CREATE TABLE IF NOT EXISTS op_sketches (
+    task_list_key TEXT, op_id INTEGER, sketch TEXT,
+    PRIMARY KEY (task_list_key, op_id)
+);
+CREATE TABLE IF NOT EXISTS new_op_rows (
+    task_list_key TEXT, order_id TEXT, record TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_new_op_rows ON new_op_rows (task_list_key, order_id);
+"""
+# Every table any layout used, so an older store is dropped completely
+TABLES = (
+    "orders", "quantity_deltas", "field_deltas", "missing_ops", "new_ops",
+    "field_stats", "missing_ops_count", "op_quantities", "new_op_records",
+    "op_sketches", "new_op_rows"
+)
+
+
+def _json_default(value):
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def task_list_key(task_df):
+    rows = task_df.sort_values("TaskListOperationInternalId").to_dict("records")
+    return hashlib.sha1(
+        json.dumps(rows, sort_keys=True, default=_json_default).encode("utf-8")
+    ).hexdigest()
+
+
+def order_fingerprints(mo_df):
+    """
+    Content hash per MaintenanceOrder (independent of row order).
+    """
+    row_hashes = pd.util.hash_pandas_object(mo_df, index=False)
+    sums = row_hashes.groupby(mo_df["MaintenanceOrder"]).sum()
+    return {order_id: format(int(h), "x") for order_id, h in sums.items()}
+
+
+class OrderStore:
+
+    def __init__(self, path=ORDER_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            # Older layouts are dropped: the store is rebuilt from the
+            # next requests' orders
+            if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+                for table in TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def changed_orders(self, key, fingerprints):
+        ids = [str(order_id) for order_id in fingerprints]
+        stored = {}
+        with self._connect() as conn:
+            # Only the request's orders, in batches under SQLite's variable limit
+            for start in range(0, len(ids), 500):
+                batch = ids[start:start + 500]
+                stored.update(conn.execute(
+                    "SELECT order_id, fingerprint FROM orders WHERE task_list_key = ? "
+                    f"AND order_id IN ({','.join('?' * len(batch))})",
+                    [key] + batch
+                ))
+
+        return [
+            order_id for order_id, fp in fingerprints.items()
+            if stored.get(str(order_id)) != fp
+        ]
+
+    def ingest(self, key, order_results, fingerprints):
+        removed_ops, added = set(), {}
+
+        with self._lock, self._connect() as conn:
+            for order_id, res in order_results.items():
+                order_id = str(order_id)
+                removed_ops.update(self._remove_order(conn, key, order_id))
+                self._add_order(conn, key, order_id, res)
+                conn.execute(
+                    "INSERT INTO orders VALUES (?, ?, ?)",
+                    (key, order_id, fingerprints[order_id])
+                )
+
+                for q in res["quantity_deltas"]:
+                    added.setdefault(int(q["TaskListOperationInternalId"]), []).append(float(q["delta"]))
+
+            self._update_sketches(conn, key, removed_ops, added)
+
+    def _remove_order(self, conn, key, order_id):
+        """
+        Subtracts a stored order from the counts; returns the ops it
+        had quantity deltas for.
+        """
+        params = (key, order_id)
+
+        for op_id, field, actual in conn.execute(
+            "SELECT op_id, field, actual FROM field_deltas "
+            "WHERE task_list_key = ? AND order_id = ?", params
+        ).fetchall():
+            conn.execute(
+                "UPDATE field_stats SET count = count - 1 WHERE task_list_key = ? "
+                "AND op_id = ? AND field = ? AND actual = ?",
+                (key, op_id, field, actual)
+            )
+            conn.execute(
+                "DELETE FROM field_stats WHERE task_list_key = ? "
+                "AND op_id = ? AND field = ? AND actual = ? AND count <= 0",
+                (key, op_id, field, actual)
+            )
+
+        for (op_id,) in conn.execute(
+            "SELECT op_id FROM missing_ops WHERE task_list_key = ? AND order_id = ?", params
+        ).fetchall():
+            conn.execute(
+                "UPDATE missing_ops_count SET count = count - 1 "
+                "WHERE task_list_key = ? AND op_id = ?",
+                (key, op_id)
+            )
+            conn.execute(
+                "DELETE FROM missing_ops_count WHERE task_list_key = ? AND op_id = ? AND count <= 0",
+                (key, op_id)
+            )
+
+        ops = {op_id for (op_id,) in conn.execute(
+            "SELECT op_id FROM quantity_deltas WHERE task_list_key = ? AND order_id = ?",
+            params
+        )}
+
+        for table in ("orders", "quantity_deltas", "field_deltas", "missing_ops", "new_op_rows"):
+            conn.execute(
+                f"DELETE FROM {table} WHERE task_list_key = ? AND order_id = ?", params
+            )
+        return ops
+
+    def _add_order(self, conn, key, order_id, res):
+        conn.executemany(
+            "INSERT INTO quantity_deltas VALUES (?, ?, ?, ?)",
+            [
+                (key, order_id, int(q["TaskListOperationInternalId"]), float(q["delta"]))
+                for q in res["quantity_deltas"]
+            ]
+        )
+
+        # actual values are stored JSON-encoded so None / numbers survive
+        field_rows = [
+            (int(f["TaskListOperationInternalId"]), f["field"],
+             json.dumps(f["actual"], default=_json_default))
+            for f in res["field_deltas"]
+        ]
+        conn.executemany(
+            "INSERT INTO field_deltas VALUES (?, ?, ?, ?, ?)",
+            [(key, order_id) + row for row in field_rows]
+        )
+        conn.executemany(
+            "INSERT INTO field_stats VALUES (?, ?, ?, ?, 1) "
+            "ON CONFLICT (task_list_key, op_id, field, actual) DO UPDATE SET count = count + 1",
+            [(key,) + row for row in field_rows]
+        )
+
+        missing = [int(op) for op in res["missing_operations"]]
+        conn.executemany(
+            "INSERT INTO missing_ops VALUES (?, ?, ?)",
+            [(key, order_id, op) for op in missing]
+        )
+        conn.executemany(
+            "INSERT INTO missing_ops_count VALUES (?, ?, 1) "
+            "ON CONFLICT (task_list_key, op_id) DO UPDATE SET count = count + 1",
+            [(key, op) for op in missing]
+        )
+
+        conn.executemany(
+            "INSERT INTO new_op_rows VALUES (?, ?, ?)",
+            [(key, order_id, json.dumps(r, default=_json_default)) for r in res["new_operations"]]
+        )
+
+    def _update_sketches(self, conn, key, removed_ops, added):
+        """
+        Merges the new deltas into each op's sketch; ops that lost
+        deltas (changed orders) are rebuilt from their stored rows.
+        """
+        for op_id in removed_ops | set(added):
+            sketch = DeltaSketch()
+            if op_id in removed_ops:
+                deltas = [d for (d,) in conn.execute(
+                    "SELECT delta FROM quantity_deltas WHERE task_list_key = ? AND op_id = ?",
+                    (key, op_id)
+                )]
+                if not deltas:
+                    conn.execute(
+                        "DELETE FROM op_sketches WHERE task_list_key = ? AND op_id = ?", (key, op_id)
+                    )
+                    continue
+                sketch.add_many(deltas)
+            else:
+                row = conn.execute(
+                    "SELECT sketch FROM op_sketches WHERE task_list_key = ? AND op_id = ?",
+                    (key, op_id)
+                ).fetchone()
+                if row is not None:
+                    sketch = DeltaSketch.from_state(json.loads(row[0]))
+                sketch.add_many(added[op_id])
+
+            conn.execute(
+                "INSERT OR REPLACE INTO op_sketches VALUES (?, ?, ?)",
+                (key, op_id, json.dumps(sketch.to_state()))
+            )
+
+    def load_agg(self, key, streaming=ENABLE_STREAMING_STATS):
+        """
+        Rebuilds the aggregate_learning structure from the stored state
+        (quantity sketches instead of delta arrays with streaming=True).
+        Returns (agg, total_orders).
+        """
+        agg = new_aggregate(streaming)
+
+        with self._connect() as conn:
+            total_orders = conn.execute(
+                "SELECT COUNT(*) FROM orders WHERE task_list_key = ?", (key,)
+            ).fetchone()[0]
+
+            if streaming:
+                for op_id, state in conn.execute(
+                    "SELECT op_id, sketch FROM op_sketches WHERE task_list_key = ? ORDER BY op_id",
+                    (key,)
+                ):
+                    agg["quantity_sketches"][op_id] = DeltaSketch.from_state(json.loads(state))
+            else:
+                rows = np.array(conn.execute(
+                    "SELECT op_id, delta FROM quantity_deltas WHERE task_list_key = ?", (key,)
+                ).fetchall(), dtype=np.float64).reshape(-1, 2)
+                by_op = np.argsort(rows[:, 0], kind="stable")
+                ops, starts = np.unique(rows[by_op, 0], return_index=True)
+                for op_id, deltas in zip(ops.astype(np.int64).tolist(), np.split(rows[by_op, 1], starts[1:])):
+                    agg["quantity_deltas"][op_id] = deltas
+
+            for op_id, field, actual, count in conn.execute(
+                "SELECT op_id, field, actual, count FROM field_stats WHERE task_list_key = ?",
+                (key,)
+            ):
+                agg["field_stats"][(op_id, field, json.loads(actual))] = count
+
+            agg["missing_ops_count"] = dict(conn.execute(
+                "SELECT op_id, count FROM missing_ops_count WHERE task_list_key = ?", (key,)
+            ))
+
+            # One JSON array decoded at once rather than a parse per record
+            records, orders = conn.execute(
+                "SELECT '[' || group_concat(record, ',') || ']', COUNT(DISTINCT order_id) "
+                "FROM (SELECT record, order_id FROM new_op_rows WHERE task_list_key = ? ORDER BY rowid)",
+                (key,)
+            ).fetchone()
+            if records is not None:
+                agg["new_ops"] = json.loads(records)
+                agg["new_ops_count"]["NEW_OP"] = orders
+
+        return agg, total_orders
+
+
+# ------------------------------------------------------------------
+# Incremental analysis
+# ------------------------------------------------------------------
+def analyze_incremental(store, task_df, mo_df, streaming=ENABLE_STREAMING_STATS, deadline=None):
+    """
+    Analyzes only new or changed orders, folds them into the stored
+    state and returns (order_results, agg, total_orders).
+    order_results (an OrderResultStore) only contains the orders
+    processed by this call; with a deadline, orders left unanalyzed are
+    not stored and are picked up by the next call.
+    """
+    key = task_list_key(task_df)
+    fingerprints = {str(k): v for k, v in order_fingerprints(mo_df).items()}
+    changed = store.changed_orders(key, fingerprints)
+
+    order_results = analyze_orders(
+        mo_df[mo_df["MaintenanceOrder"].astype(str).isin(changed)], task_df, deadline=deadline
+    )
+
+    store.ingest(key, order_results.to_dict(), fingerprints)
+    agg, total_orders = store.load_agg(key, streaming)
+
+    return order_results, agg, total_orders
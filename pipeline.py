@@ -0,0 +1,298 @@
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from setupData import *
+from orderStore import task_list_key, order_fingerprints
+from constants import (
+    PIPELINE_STAGE_CACHE_ENTRIES, PIPELINE_CHUNK_CACHE_ENTRIES, PIPELINE_CHUNK_TARGET_ORDERS,
+    PIPELINE_STAGE_CACHE_MAX_MB, PIPELINE_CHUNK_CACHE_MAX_MB
+)
+
+
+# ------------------------------------------------------------------
+# Stage pipeline with memoized intermediate results
+#
+# Each stage declares named inputs and outputs. A stage's cache key is
+# the fingerprint of its inputs; its outputs get fingerprints either
+# from their content (fingerprint_outputs) or derived from that key.
+# Unchanged inputs therefore reuse cached outputs, and only stages
+# downstream of a change run again. Results produced under a deadline
+# that skipped work are never cached.
+# ------------------------------------------------------------------
+def digest(*parts):
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def fingerprint(value):
+    return digest(json.dumps(value, sort_keys=True, default=str))
+
+
+def sizeof(value):
+    """
+    Approximate memory held by a cached value: frames, arrays and
+    order result stores by their buffers, containers recursively.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, OrderResultStore):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Bounded by entry count and, when max_mb is set, by the total
+    sizeof() of its values; least recently used entries go first.
+    """
+
+    def __init__(self, max_entries, max_mb=None):
+        self.max_entries = max_entries
+        self.max_bytes = None if max_mb is None else max_mb * 1024 * 1024
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        size = sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self._lock:
+            self.bytes -= self._sizes.pop(key, 0)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self.bytes += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self.bytes > self.max_bytes):
+                evicted, _ = self._entries.popitem(last=False)
+                self.bytes -= self._sizes.pop(evicted)
+
+
+class Stage:
+
+    def __init__(self, name, fn, inputs, outputs, fingerprint_outputs=None):
+        self.name = name
+        self.fn = fn
+        self.inputs = inputs
+        self.outputs = outputs
+        self.fingerprint_outputs = fingerprint_outputs
+
+
+class StageContext:
+
+    def __init__(self, pipeline, deadline=None):
+        self.pipeline = pipeline
+        self.deadline = deadline
+        self.details = {}
+
+
+class Pipeline:
+
+    def __init__(self, stages, stage_cache_entries=PIPELINE_STAGE_CACHE_ENTRIES,
+                 chunk_cache_entries=PIPELINE_CHUNK_CACHE_ENTRIES,
+                 stage_cache_mb=PIPELINE_STAGE_CACHE_MAX_MB,
+                 chunk_cache_mb=PIPELINE_CHUNK_CACHE_MAX_MB):
+        self.stages = stages
+        self.stage_cache = LRUCache(stage_cache_entries, stage_cache_mb)
+        # Sub-stage results for stages that split their work into chunks
+        self.chunk_cache = LRUCache(chunk_cache_entries, chunk_cache_mb)
+
+    def run(self, inputs, fingerprints=None, deadline=None, dry_run=False):
+        """
+        Returns (values, report). values holds every input and stage
+        output; report lists each stage as "cached" or "run" (in a
+        dry run: "would_run"), with timings and stage details.
+        In a dry run nothing is executed; stages whose inputs are not
+        yet known are reported as "would_run". Inputs with a caller
+        supplied fingerprint (e.g. a hash of the raw body) are not
+        serialized again.
+        """
+        fps = dict(fingerprints or {})
+        for name, value in inputs.items():
+            if name not in fps:
+                fps[name] = fingerprint(value)
+        values = dict(inputs)
+        report = []
+
+        for stage in self.stages:
+            entry = {"stage": stage.name}
+            report.append(entry)
+
+            if any(fps.get(name) is None for name in stage.inputs):
+                entry["status"] = "would_run"
+                fps.update({name: None for name in stage.outputs})
+                continue
+
+            if any(name in values and values[name] is None for name in stage.inputs):
+                # e.g. build found no data: nothing downstream can run
+                entry["status"] = "skipped"
+                values.update({name: None for name in stage.outputs})
+                fps.update({name: digest("none", name) for name in stage.outputs})
+                continue
+
+            key = digest(stage.name, *[fps[name] for name in stage.inputs])
+            cached = self.stage_cache.get(key)
+
+            if cached is not None:
+                outputs, output_fps = cached
+                entry["status"] = "cached"
+            elif dry_run:
+                entry["status"] = "would_run"
+                fps.update({name: None for name in stage.outputs})
+                continue
+            else:
+                ctx = StageContext(self, deadline)
+                start = time.perf_counter()
+                outputs = stage.fn(ctx, **{name: values[name] for name in stage.inputs})
+                entry["status"] = "run"
+                entry["seconds"] = round(time.perf_counter() - start, 4)
+                entry.update(ctx.details)
+
+                if stage.fingerprint_outputs is not None:
+                    output_fps = stage.fingerprint_outputs(outputs)
+                else:
+                    output_fps = {name: digest(key, name) for name in stage.outputs}
+
+                if deadline is None or not deadline.skipped:
+                    self.stage_cache.put(key, (outputs, output_fps))
+
+            values.update(outputs)
+            fps.update(output_fps)
+
+        return values, report
+
+
+# ------------------------------------------------------------------
+# /analyze stages: build -> analyze -> aggregate -> propose
+# ------------------------------------------------------------------
+def _build(ctx, payload):
+    task_df, mo_df = build_data_model(payload)
+    if task_df is None or mo_df is None:
+        return {"task_df": task_df, "mo_df": mo_df, "task_key": None, "order_fps": None}
+    # Hashed once here: they fingerprint the frames and key analyze's chunks
+    return {
+        "task_df": task_df,
+        "mo_df": mo_df,
+        "task_key": task_list_key(task_df),
+        "order_fps": order_fingerprints(mo_df)
+    }
+
+
+def _build_fingerprints(outputs):
+    if outputs["task_key"] is None:
+        return {name: digest("none") for name in outputs}
+    orders_fp = digest(*sorted(f"{k}={v}" for k, v in outputs["order_fps"].items()))
+    return {
+        "task_df": outputs["task_key"],
+        "mo_df": orders_fp,
+        "task_key": outputs["task_key"],
+        "order_fps": orders_fp
+    }
+
+
+def order_chunks(mo_df):
+    """
+    Content-defined chunks of orders: a chunk ends after every order id
+    whose hash is 0 mod PIPELINE_CHUNK_TARGET_ORDERS. Boundaries depend
+    only on the ids themselves, so adding orders changes just the
+    chunks the new orders fall into.
+    Yields (order_ids, row_positions).
+    """
+    codes, order_ids = pd.factorize(mo_df["MaintenanceOrder"], sort=True)
+    order_ids = np.asarray(order_ids, dtype=object)
+    rows = np.argsort(codes, kind="stable")
+    row_bounds = np.searchsorted(codes[rows], np.arange(len(order_ids) + 1))
+
+    hashes = pd.util.hash_array(order_ids.astype(str).astype(object))
+    ends = np.flatnonzero(hashes % PIPELINE_CHUNK_TARGET_ORDERS == 0) + 1
+    ends = np.union1d(ends, [len(order_ids)])
+
+    start = 0
+    for end in ends.tolist():
+        if end > start:
+            yield order_ids[start:end], rows[row_bounds[start]:row_bounds[end]]
+        start = end
+
+
+def _analyze(ctx, task_df, mo_df, task_key, order_fps):
+    parts = []
+    chunks_run = 0
+    total_orders = int(mo_df["MaintenanceOrder"].nunique())
+
+    for chunk_ids, rows in order_chunks(mo_df):
+        if ctx.deadline is not None and ctx.deadline.expired(keep_reserve=True):
+            ctx.deadline.skip(
+                "orders",
+                orders_analyzed=sum(len(p) for p in parts),
+                orders_total=total_orders
+            )
+            break
+
+        key = digest("analyze", task_key, *[order_fps[o] for o in chunk_ids])
+        cached = ctx.pipeline.chunk_cache.get(key)
+        if cached is None:
+            cached = OrderResultStore.from_frames(mo_df.iloc[rows], task_df)
+            ctx.pipeline.chunk_cache.put(key, cached)
+            chunks_run += 1
+        parts.append(cached)
+
+    ctx.details["chunks"] = len(parts)
+    ctx.details["chunks_run"] = chunks_run
+    return {"order_results": OrderResultStore.concat(parts, StringDictionary())}
+
+
+def _aggregate(ctx, order_results, streaming_stats):
+    return {
+        "agg": aggregate_learning(order_results, streaming=streaming_stats),
+        "total_orders": len(order_results)
+    }
+
+
+def _propose(ctx, task_df, agg, total_orders, thresholds):
+    return {
+        "proposals": propose_master_changes(
+            task_df, agg, total_orders=total_orders,
+            thresholds=thresholds, deadline=ctx.deadline
+        )
+    }
+
+
+def build_analyze_pipeline(**cache_sizes):
+    return Pipeline([
+        Stage("build", _build, ["payload"], ["task_df", "mo_df", "task_key", "order_fps"],
+              _build_fingerprints),
+        Stage("analyze", _analyze, ["task_df", "mo_df", "task_key", "order_fps"], ["order_results"]),
+        Stage("aggregate", _aggregate, ["order_results", "streaming_stats"], ["agg", "total_orders"]),
+        Stage("propose", _propose, ["task_df", "agg", "total_orders", "thresholds"], ["proposals"]),
+    ], **cache_sizes)
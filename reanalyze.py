@@ -0,0 +1,296 @@
+"""
+Offline reanalysis of saved /analyze payloads.
+
+    python reanalyze.py archive/ --out proposals.jsonl
+    python reanalyze.py payloads.jsonl --out proposals/ --format parquet --workers 8
+
+INPUT is a payload file (.json / .json.gz), a JSONL file with one
+payload (or {"id": ..., "payload": {...}}) per line, or a directory of
+such files. Payloads run through the same stage pipeline as /analyze
+in a forked process pool; the model is loaded once here and shared
+with the workers. Re-running with the same --out skips payloads that
+already have a result, so an interrupted run picks up where it stopped.
+"""
+import argparse
+import gc
+import gzip
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import threadConfig  # before numpy / torch load
+import pandas as pd
+
+from batch import _init_worker
+from constants import BATCH_WORKERS, ENABLE_STREAMING_STATS
+from nlpUtils import get_embedding_model
+from pipeline import build_analyze_pipeline
+from serializer import dumps
+from setupData import resolve_thresholds
+
+OUTPUT_FORMATS = ("jsonl", "parquet")
+PAYLOAD_SUFFIXES = (".json", ".json.gz", ".jsonl", ".jsonl.gz")
+
+
+# ------------------------------------------------------------------
+# Input
+# ------------------------------------------------------------------
+def _open(path):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def iter_payloads(path):
+    """
+    Yields (payload_id, raw_json_bytes). Ids are file names relative to
+    a directory input, the "id" of a JSONL group, or "<file>:<line>".
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(PAYLOAD_SUFFIXES):
+                yield from _iter_file(os.path.join(path, name), name)
+    else:
+        yield from _iter_file(path, os.path.basename(path))
+
+
+def _iter_file(path, name):
+    with _open(path) as f:
+        if not name.endswith((".jsonl", ".jsonl.gz")):
+            yield name, f.read()
+            return
+
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            group = json.loads(line)
+            if isinstance(group, dict) and "payload" in group:
+                yield str(group.get("id") or f"{name}:{line_no}"), dumps(group["payload"])
+            else:
+                yield f"{name}:{line_no}", line
+
+
+# ------------------------------------------------------------------
+# Worker
+# ------------------------------------------------------------------
+_pipeline = None
+
+
+def analyze_payload(payload_id, raw):
+    """
+    Runs one payload through the /analyze pipeline (default thresholds).
+    Returns {"id", "total_orders", "master_change_proposals", "error"}.
+    """
+    global _pipeline
+    if _pipeline is None:
+        # Payloads are independent: keep only the chunk memo warm
+        _pipeline = build_analyze_pipeline(stage_cache_entries=1)
+
+    try:
+        values, _ = _pipeline.run(
+            {
+                "payload": json.loads(raw),
+                "streaming_stats": ENABLE_STREAMING_STATS,
+                "thresholds": resolve_thresholds()
+            },
+            fingerprints={"payload": hashlib.sha1(raw).hexdigest()}
+        )
+        if values["proposals"] is None:
+            raise ValueError("No Data in payload")
+
+        return {
+            "id": payload_id,
+            "total_orders": values["total_orders"],
+            "master_change_proposals": values["proposals"],
+            "error": None
+        }
+    except Exception as e:
+        return {
+            "id": payload_id,
+            "total_orders": None,
+            "master_change_proposals": [],
+            "error": f"{type(e).__name__}: {e}"
+        }
+
+
+# ------------------------------------------------------------------
+# Output (append-only, so completed payloads survive an interruption)
+# ------------------------------------------------------------------
+class JsonlWriter:
+    """
+    One line per payload. A torn last line (interrupted write) is cut
+    off on open; the last line for an id wins.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.done = {}
+
+        if os.path.exists(path):
+            with open(path, "rb+") as f:
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                f.truncate(end)
+            for line in data[:end].splitlines():
+                record = json.loads(line)
+                self.done[record["id"]] = record["error"]
+
+        self._file = open(path, "ab")
+
+    def write(self, record):
+        self._file.write(dumps(record) + b"\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Directory of part-NNNNN.parquet files, one row per proposal
+    (id, op, type, confidence, proposal as JSON). _manifest.jsonl lists
+    the payloads in each part, including those with no proposals or an
+    error; parts missing from it are leftovers of an interrupted flush.
+    """
+
+    def __init__(self, path, flush_every=100):
+        self.path = path
+        self.flush_every = flush_every
+        self.done = {}
+        self._pending = []
+        self._manifest = os.path.join(path, "_manifest.jsonl")
+        os.makedirs(path, exist_ok=True)
+
+        parts = set()
+        if os.path.exists(self._manifest):
+            with open(self._manifest, "rb+") as f:
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                f.truncate(end)
+            for line in data[:end].splitlines():
+                entry = json.loads(line)
+                parts.add(entry["part"])
+                self.done.update(entry["payloads"])
+
+        for name in os.listdir(path):
+            if name.startswith("part-") and name not in parts:
+                os.remove(os.path.join(path, name))
+        self._next_part = len(parts)
+
+    def write(self, record):
+        self._pending.append(record)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        rows = [
+            {
+                "id": record["id"],
+                "TaskListOperationInternalId": proposal.get("TaskListOperationInternalId"),
+                "type": proposal["type"],
+                "confidence": proposal.get("confidence"),
+                "proposal": dumps(proposal).decode("utf-8")
+            }
+            for record in self._pending
+            for proposal in record["master_change_proposals"]
+        ]
+        part = f"part-{self._next_part:05d}.parquet"
+        pd.DataFrame(
+            rows, columns=["id", "TaskListOperationInternalId", "type", "confidence", "proposal"]
+        ).astype({"TaskListOperationInternalId": "Int64"}).to_parquet(
+            os.path.join(self.path, part), index=False
+        )
+
+        with open(self._manifest, "a") as f:
+            f.write(json.dumps({
+                "part": part,
+                "payloads": {record["id"]: record["error"] for record in self._pending}
+            }) + "\n")
+
+        self._next_part += 1
+        self._pending = []
+
+    def close(self):
+        self.flush()
+
+
+# ------------------------------------------------------------------
+# Driver
+# ------------------------------------------------------------------
+def reanalyze(source, writer, workers=BATCH_WORKERS, retry_errors=False):
+    """
+    Analyzes every payload in source not yet in writer.done.
+    Returns {"analyzed", "skipped", "errors"}.
+    """
+    counts = {"analyzed": 0, "skipped": 0, "errors": 0}
+
+    def collect(futures):
+        for future in futures:
+            record = future.result()
+            writer.write(record)
+            counts["analyzed"] += 1
+            if record["error"]:
+                counts["errors"] += 1
+                print(f"{record['id']}: {record['error']}")
+
+    # Load the model and freeze imported modules: the workers share them
+    get_embedding_model()
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker
+        ) as pool:
+            in_flight = set()
+            for payload_id, raw in iter_payloads(source):
+                if payload_id in writer.done and not (retry_errors and writer.done[payload_id]):
+                    counts["skipped"] += 1
+                    continue
+
+                in_flight.add(pool.submit(analyze_payload, payload_id, raw))
+                if len(in_flight) >= 2 * workers:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(finished)
+
+            collect(in_flight)
+    finally:
+        # Keep whatever finished before an interruption
+        writer.close()
+
+    return counts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="payload file, JSONL file or directory")
+    parser.add_argument("--out", required=True, help="JSONL file or Parquet directory")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS,
+                        help="default: jsonl if --out ends in .jsonl, else parquet")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    parser.add_argument("--flush-every", type=int, default=100,
+                        help="payloads per Parquet part file")
+    parser.add_argument("--retry-errors", action="store_true",
+                        help="re-run payloads whose previous result was an error")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or ("jsonl" if args.out.endswith(".jsonl") else "parquet")
+
+    if fmt == "parquet":
+        writer = ParquetWriter(args.out, args.flush_every)
+    else:
+        writer = JsonlWriter(args.out)
+
+    counts = reanalyze(args.input, writer, args.workers, args.retry_errors)
+    print(f"analyzed {counts['analyzed']} payloads ({counts['errors']} errors), "
+          f"skipped {counts['skipped']} already done -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
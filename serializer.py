@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # optional fast path
+    orjson = None
+
+
+# ------------------------------------------------------------------
+# Analyze response serialization
+#
+# Writes numpy / pandas values natively instead of going through
+# jsonify's generic encoder. Uses orjson when installed, stdlib json
+# with a numpy-aware default otherwise.
+# ------------------------------------------------------------------
+def _default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj):
+    """
+    Serializes obj to UTF-8 JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(obj, status=200):
+    return Response(dumps(obj), status=status, mimetype="application/json")
+
+
+def order_level_output(order_results, fmt=None):
+    """
+    Dict-shaped (default) or columnar view of an OrderResultStore.
+    """
+    if fmt == "columnar":
+        return order_results.to_columns()
+    return order_results.to_dict()
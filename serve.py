@@ -0,0 +1,97 @@
+"""
+Production entry point for the analyze service (gunicorn, preforked).
+
+    python serve.py --workers 4 --threads 2 --torch-threads 4
+
+Thread settings (torch, BLAS, tokenizers) come from threadConfig;
+the flags override them.
+
+The app, nlpUtils' model and constants are imported once in the master
+process (preload) and shared with the forked workers copy-on-write.
+gc.freeze() before forking keeps the collector from touching (and so
+copying) those shared pages. Send SIGHUP for a graceful reload; workers
+are also recycled after --max-requests requests.
+"""
+import argparse
+import gc
+import os
+import time
+
+from gunicorn.app.base import BaseApplication
+
+from threadConfig import thread_config, apply_env, apply_runtime
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def parse_args(argv=None):
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bind", default=f"0.0.0.0:{os.environ.get('PORT', 3000)}")
+    parser.add_argument("--workers", type=int, default=_env_int("WEB_WORKERS", max(1, cpus // 4)))
+    parser.add_argument("--threads", type=int, default=_env_int("WEB_THREADS", 2))
+    parser.add_argument("--torch-threads", type=int, default=None,
+                        help="intra-op threads per worker (default: thread config, 0 = cpus / workers)")
+    parser.add_argument("--blas-threads", type=int, default=None,
+                        help="BLAS threads per worker (default: thread config, 0 = torch threads)")
+    parser.add_argument("--timeout", type=int, default=_env_int("WEB_TIMEOUT", 120))
+    parser.add_argument("--graceful-timeout", type=int, default=_env_int("WEB_GRACEFUL_TIMEOUT", 60))
+    parser.add_argument("--max-requests", type=int, default=_env_int("WEB_MAX_REQUESTS", 1000))
+    return parser.parse_args(argv)
+
+
+def _post_fork(threads):
+    def post_fork(server, worker):
+        # Workers share the cores; without a cap every worker's torch
+        # and BLAS pools would spin up one thread per core.
+        apply_runtime(threads)
+        server.log.info("worker %s: threads %s", worker.pid, threads)
+    return post_fork
+
+
+class AnalyzeServer(BaseApplication):
+
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        start = time.perf_counter()
+        from app import app
+        from nlpUtils import get_embedding_model, similarity_projection
+        get_embedding_model()  # lazy everywhere else; workers must share it
+        similarity_projection()
+        print(f"Preloaded app in {time.perf_counter() - start:.2f}s")
+        gc.freeze()
+        return app
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Resolved before the app (numpy, torch, the model) is preloaded
+    os.environ["WEB_WORKERS"] = str(args.workers)
+    threads = thread_config(torch_threads=args.torch_threads, blas_threads=args.blas_threads)
+    apply_env(threads)
+
+    AnalyzeServer({
+        "bind": args.bind,
+        "workers": args.workers,
+        "threads": args.threads,
+        "worker_class": "gthread",
+        "preload_app": True,
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": max(1, args.max_requests // 10),
+        "post_fork": _post_fork(threads),
+    }).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,26 @@ import pandas as pd
 
 from utils import *
 from constants import FIELDS_TO_COMPARE
+from streamStats import DeltaSketch
+from columnar import OrderResultStore, StringDictionary, COMPARED_FIELDS
+from masterIndex import likely_existing_operations
+
+
+# ------------------------------------------------------------------
+# Proposal thresholds
+# ------------------------------------------------------------------
+def resolve_thresholds(overrides=None):
+    """
+    Defaults from PROPOSAL_THRESHOLDS with per-request overrides applied.
+    """
+    thresholds = dict(PROPOSAL_THRESHOLDS)
+    if overrides is not None and not isinstance(overrides, dict):
+        raise ValueError("thresholds must be an object of threshold name -> value")
+    for name, value in (overrides or {}).items():
+        if name not in thresholds:
+            raise ValueError(f"Unknown threshold: {name}")
+        thresholds[name] = float(value)
+    return thresholds
 
 
 # ------------------------------------------------------------------
@@ -39,30 +59,77 @@ def build_data_model(payload):
         'MaintOrdOperationQuantityUnit': 'Unit'
     }, inplace=True)
 
+    task_df, mo_df = encode_categoricals(task_df, mo_df)
+
     # Normalize to hours
-    task_df["Quantity_H"] = task_df.apply(
-        lambda r: normalize_to_hours(r["Quantity"], r["Unit"]),
-        axis=1
-    )
+    task_df["Quantity_H"] = quantity_hours(task_df)
+    mo_df["Quantity_H"] = quantity_hours(mo_df)
 
-    mo_df["Quantity_H"] = mo_df.apply(
-        lambda r: normalize_to_hours(r["Quantity"], r["Unit"]),
-        axis=1
+    task_df["NormDescription"], mo_df["NormDescription"] = normalized_descriptions(
+        task_df["OperationDescription"], mo_df["OperationDescription"]
     )
 
-    task_df["NormDescription"] = task_df["OperationDescription"].apply(normalize_description)
-    mo_df["NormDescription"] = mo_df["OperationDescription"].apply(normalize_description)
+    return task_df, mo_df
+
 
+def encode_categoricals(task_df, mo_df):
+    """
+    Dictionary-encodes the string columns. Columns present in both
+    frames share one CategoricalDtype, so planned vs actual comparisons
+    are integer code comparisons.
+    """
+    task_df = task_df.copy()
+    mo_df = mo_df.copy()
+
+    for col in SHARED_CATEGORICAL_COLUMNS:
+        values = pd.concat([task_df[col], mo_df[col]], ignore_index=True).dropna()
+        dtype = pd.CategoricalDtype(sorted(pd.unique(values).tolist(), key=str))
+        task_df[col] = task_df[col].astype(dtype)
+        mo_df[col] = mo_df[col].astype(dtype)
+
+    mo_df["MaintenanceOrder"] = mo_df["MaintenanceOrder"].astype("category")
     return task_df, mo_df
 
 
+def quantity_hours(df):
+    factors = df["Unit"].map(UNIT_CONVERSION_TO_HOURS)
+    unknown = df["Unit"][factors.isna()]
+    if len(unknown):
+        raise ValueError(f"Unsupported unit: {unknown.iloc[0]}")
+
+    return df["Quantity"].astype(float) * factors.astype(float)
+
+
+def normalized_descriptions(*columns):
+    """
+    normalize_description per category instead of per row; the result
+    columns share one categorical dtype.
+    """
+    categories = columns[0].cat.categories
+    normalized = [normalize_description(c) for c in categories]
+    norm_dtype = pd.CategoricalDtype(sorted({n for n in normalized if n}))
+    # Last slot handles missing descriptions (code -1)
+    lookup = np.array(
+        [norm_dtype.categories.get_loc(n) if n else -1 for n in normalized] + [-1]
+    )
+
+    return [
+        pd.Categorical.from_codes(lookup[col.cat.codes.to_numpy()], dtype=norm_dtype)
+        for col in columns
+    ]
+
+
 # ------------------------------------------------------------------
 # Group by maintenance order
 # ------------------------------------------------------------------
+def iter_orders(mo_df):
+    return iter(mo_df.groupby("MaintenanceOrder", observed=True))
+
+
 def group_by_order(mo_df):
     return {
         order_id: df
-        for order_id, df in mo_df.groupby("MaintenanceOrder")
+        for order_id, df in iter_orders(mo_df)
     }
 
 
@@ -70,78 +137,138 @@ def group_by_order(mo_df):
 # Analyze a single order
 # ------------------------------------------------------------------
 def analyze_single_order(order_df, task_df):
-    result = {
-        "new_operations": [],
-        "missing_operations": [],
-        "quantity_deltas": [],
-        "field_deltas": []
-    }
+    return OrderResultStore.from_frames(order_df, task_df).order_result(0)
 
-    task_ops = set(task_df["TaskListOperationInternalId"])
-    order_ops = set(order_df["TaskListOperationInternalId"])
 
-    # New operations (InternalId = 0)
-    new_ops = order_df[order_df["TaskListOperationInternalId"] == 0]
-    if not new_ops.empty:
-        result["new_operations"] = new_ops.to_dict("records")
+def iter_order_chunks(mo_df, task_df, chunk_orders=ANALYZE_CHUNK_ORDERS, dictionary=None):
+    """
+    Yields OrderResultStores over consecutive ranges of chunk_orders
+    orders (in group_by_order order), sharing one value dictionary.
+    """
+    dictionary = dictionary or StringDictionary()
+    codes, order_ids = pd.factorize(mo_df["MaintenanceOrder"], sort=True)
 
-    # Missing operations
-    result["missing_operations"] = list(task_ops - order_ops)
+    for start in range(0, len(order_ids), chunk_orders):
+        rows = mo_df[(codes >= start) & (codes < start + chunk_orders)]
+        yield OrderResultStore.from_frames(rows, task_df, dictionary), len(order_ids)
 
-    merged = order_df.merge(
-        task_df,
-        on="TaskListOperationInternalId",
-        how="inner",
-        suffixes=("_actual", "_planned")
-    )
 
-    for _, row in merged.iterrows():
-        for field in FIELDS_TO_COMPARE:
-            actual = row[f"{field}_actual"]
-            planned = row[f"{field}_planned"]
+def analyze_orders(mo_df, task_df, deadline=None):
+    """
+    Analyzes every order into one OrderResultStore. With a deadline,
+    chunks stop early (keeping the reserve for proposals) and the
+    deadline records how far analysis got.
+    """
+    dictionary = StringDictionary()
+    parts = []
+    analyzed = 0
 
-            if field == "Quantity":
-                delta = row["Quantity_H_actual"] - row["Quantity_H_planned"]
-                result["quantity_deltas"].append({
-                    "TaskListOperationInternalId": row["TaskListOperationInternalId"],
-                    "delta": delta
-                })
-            elif actual != planned:
-                result["field_deltas"].append({
-                    "TaskListOperationInternalId": row["TaskListOperationInternalId"],
-                    "field": field,
-                    "actual": actual
-                })
-    return result
+    for part, total in iter_order_chunks(mo_df, task_df, dictionary=dictionary):
+        if deadline is not None and deadline.expired(keep_reserve=True):
+            deadline.skip("orders", orders_analyzed=analyzed, orders_total=total)
+            break
+        parts.append(part)
+        analyzed += len(part)
+
+    return OrderResultStore.concat(parts, dictionary)
 
 
 # ------------------------------------------------------------------
 # Aggregate learning across all orders
 # ------------------------------------------------------------------
-def aggregate_learning(order_results):
+def aggregate_learning(order_results, streaming=ENABLE_STREAMING_STATS):
+    """
+    order_results is an OrderResultStore or a {order_id: result} dict.
+    With streaming=True quantity deltas are folded into a DeltaSketch
+    per op (agg["quantity_sketches"]) instead of being kept as arrays.
+    """
+    agg = new_aggregate(streaming)
+
+    if isinstance(order_results, OrderResultStore):
+        return accumulate_store(agg, order_results)
+
+    for res in order_results.values():
+        accumulate_order_result(agg, res)
+
+    return agg
+
+
+def new_aggregate(streaming=ENABLE_STREAMING_STATS):
     agg = {
         "quantity_deltas": {},
         "field_stats": {},
         "new_ops_count": {},
         "missing_ops_count": {}
     }
+    if streaming:
+        agg["quantity_sketches"] = {}
+    return agg
 
-    for res in order_results.values():
 
-        for q in res["quantity_deltas"]:
-            op = q["TaskListOperationInternalId"]
+def accumulate_store(agg, store):
+    """
+    Folds an OrderResultStore into agg (in place) with array operations.
+    """
+    # Quantity deltas grouped by op
+    by_op = np.argsort(store.quantity_op, kind="stable")
+    ops, starts = np.unique(store.quantity_op[by_op], return_index=True)
+    for op, deltas in zip(ops.tolist(), np.split(store.quantity_delta[by_op], starts[1:])):
+        if "quantity_sketches" in agg:
+            agg["quantity_sketches"].setdefault(op, DeltaSketch()).add_many(deltas)
+        else:
+            previous = agg["quantity_deltas"].get(op)
+            agg["quantity_deltas"][op] = (
+                deltas if previous is None else np.concatenate([previous, deltas])
+            )
+
+    # Field value counts
+    if len(store.field_op):
+        keys = np.stack([
+            store.field_op, store.field_code.astype(np.int64), store.field_value.astype(np.int64)
+        ], axis=1)
+        keys, counts = np.unique(keys, axis=0, return_counts=True)
+        values = store.dictionary.values
+        for (op, code, value), count in zip(keys.tolist(), counts.tolist()):
+            key = (op, COMPARED_FIELDS[code], values[value])
+            agg["field_stats"][key] = agg["field_stats"].get(key, 0) + count
+
+    ops, counts = np.unique(store.missing_op, return_counts=True)
+    for op, count in zip(ops.tolist(), counts.tolist()):
+        agg["missing_ops_count"][op] = agg["missing_ops_count"].get(op, 0) + count
+
+    if len(store.new_op_order):
+        # Per-chunk frames, concatenated once by new_operation_frame
+        agg.setdefault("new_ops", []).append(store.new_ops)
+        agg["new_ops_count"]["NEW_OP"] = (
+            agg["new_ops_count"].get("NEW_OP", 0) + len(np.unique(store.new_op_order))
+        )
+
+    return agg
+
+
+def accumulate_order_result(agg, res):
+    """
+    Folds one analyze_single_order result into agg (in place).
+    """
+    streaming = "quantity_sketches" in agg
+
+    for q in res["quantity_deltas"]:
+        op = q["TaskListOperationInternalId"]
+        if streaming:
+            agg["quantity_sketches"].setdefault(op, DeltaSketch()).add(q["delta"])
+        else:
             agg["quantity_deltas"].setdefault(op, []).append(q["delta"])
 
-        for f in res["field_deltas"]:
-            key = (f["TaskListOperationInternalId"], f["field"], f["actual"])
-            agg["field_stats"][key] = agg["field_stats"].get(key, 0) + 1
+    for f in res["field_deltas"]:
+        key = (f["TaskListOperationInternalId"], f["field"], f["actual"])
+        agg["field_stats"][key] = agg["field_stats"].get(key, 0) + 1
 
-        for op in res["missing_operations"]:
-            agg["missing_ops_count"][op] = agg["missing_ops_count"].get(op, 0) + 1
+    for op in res["missing_operations"]:
+        agg["missing_ops_count"][op] = agg["missing_ops_count"].get(op, 0) + 1
 
-        if res["new_operations"]:
-            agg.setdefault("new_ops", []).extend(res["new_operations"])
-            agg["new_ops_count"]["NEW_OP"] = agg["new_ops_count"].get("NEW_OP", 0) + 1
+    if res["new_operations"]:
+        agg.setdefault("new_ops", []).extend(res["new_operations"])
+        agg["new_ops_count"]["NEW_OP"] = agg["new_ops_count"].get("NEW_OP", 0) + 1
 
     return agg
 
@@ -149,23 +276,50 @@ def aggregate_learning(order_results):
 # ------------------------------------------------------------------
 # Quantity proposal logic (STATISTICAL + UNIT COUPLED)
 # ------------------------------------------------------------------
-def propose_quantity_changes(task_df, agg):
-    proposals = []
+def exact_delta_stats(deltas, z_threshold=2.5, trim=0.1):
+    from scipy import stats
 
+    deltas = np.array(deltas)
+
+    z = np.abs(stats.zscore(deltas))
+    filtered = deltas[z < z_threshold]
+
+    if len(filtered) == 0:
+        return None
+
+    mean_delta = stats.trim_mean(filtered, trim)
+    std_dev = np.std(filtered)
+    cv = std_dev / abs(mean_delta) if mean_delta != 0 else np.inf
+
+    return mean_delta, std_dev, cv, len(filtered)
+
+
+def quantity_delta_stats(agg, z_threshold=2.5):
+    """
+    Yields (op_id, (mean_delta, std_dev, cv, sample_size)) from either
+    the exact delta lists or the streaming sketches.
+    """
     for op_id, deltas in agg.get("quantity_deltas", {}).items():
-        deltas = np.array(deltas)
+        yield op_id, exact_delta_stats(deltas, z_threshold)
 
-        z = np.abs(stats.zscore(deltas))
-        filtered = deltas[z < 2.5]
+    for op_id, sketch in agg.get("quantity_sketches", {}).items():
+        yield op_id, sketch.summary(z_threshold)
 
-        if len(filtered) < 3:
+
+def propose_quantity_changes(task_df, agg, thresholds=None):
+    thresholds = thresholds or resolve_thresholds()
+    proposals = []
+
+    for op_id, delta_stats in quantity_delta_stats(agg, thresholds["z_score_max"]):
+        if delta_stats is None:
             continue
 
-        mean_delta = stats.trim_mean(filtered, 0.1)
-        std_dev = np.std(filtered)
-        cv = std_dev / abs(mean_delta) if mean_delta != 0 else np.inf
+        mean_delta, std_dev, cv, sample_size = delta_stats
 
-        if abs(mean_delta) < 0.25:
+        if sample_size < 3:
+            continue
+
+        if abs(mean_delta) < thresholds["min_delta_hours"]:
             continue
 
         row = task_df.loc[
@@ -211,7 +365,7 @@ def propose_quantity_changes(task_df, agg):
                 "mean_delta_hours": round(mean_delta, 2),
                 "std_dev": round(std_dev, 2),
                 "cv": round(cv, 2),
-                "sample_size": int(len(filtered))
+                "sample_size": int(sample_size)
             },
             "confidence": confidence,
             "rule": "UNIT_COUPLED_WITH_QUANTITY"
@@ -220,14 +374,11 @@ def propose_quantity_changes(task_df, agg):
     return proposals
 
 
-def propose_description_changes_semantic(task_df, agg, total_orders):
+def description_variants(agg):
     """
-    Detects semantic description drift and proposes a merged master description.
-    Uses NLP embeddings + clustering.
+    Yields (op_id, norm_descs, raw_descs) for every op with enough
+    description deltas to be clustered.
     """
-
-    proposals = []
-
     # Collect description variants per operation
     desc_map = {}
     for (op_id, field, actual_desc), count in agg.get("field_stats", {}).items():
@@ -252,14 +403,32 @@ def propose_description_changes_semantic(task_df, agg, total_orders):
         if not norm_descs:
             continue
 
+        yield op_id, norm_descs, raw_descs
+
+
+def propose_description_changes_semantic(task_df, agg, total_orders, thresholds=None, deadline=None):
+    """
+    Detects semantic description drift and proposes a merged master description.
+    Uses NLP embeddings + clustering.
+    """
+    thresholds = thresholds or resolve_thresholds()
+    similarity = thresholds["semantic_similarity"]
+
+    proposals = []
+
+    for op_id, norm_descs, raw_descs in description_variants(agg):
+        if deadline is not None and deadline.expired():
+            deadline.skip("semantic_descriptions")
+            break
+
         # Semantic clustering
-        clusters = cluster_by_similarity(norm_descs, threshold=0.8)
+        clusters = cluster_cached(norm_descs, threshold=similarity)
 
         # Find dominant cluster
         dominant = max(clusters, key=len)
         ratio = len(dominant) / total_orders
         print(ratio)
-        if ratio < 0.6:
+        if ratio < thresholds["min_order_ratio"]:
             continue
 
         # Representative phrase (most frequent raw text in cluster)
@@ -284,7 +453,7 @@ def propose_description_changes_semantic(task_df, agg, total_orders):
                 "variants": list(set(cluster_raw)),
                 "occurrences": len(cluster_raw),
                 "orders_affected_ratio": round(ratio, 2),
-                "semantic_threshold": 0.8
+                "semantic_threshold": similarity
             },
             "method": "SEMANTIC_CLUSTERING"
         })
@@ -292,26 +461,126 @@ def propose_description_changes_semantic(task_df, agg, total_orders):
     return proposals
 
 
+# ------------------------------------------------------------------
+# New operation clustering
+# ------------------------------------------------------------------
+def new_operation_frame(new_ops):
+    """
+    agg["new_ops"] as a DataFrame. Chunked aggregation keeps a list of
+    per-chunk frames; aggregates rebuilt from dict results or the order
+    store hold a list of records.
+    """
+    if isinstance(new_ops, pd.DataFrame):
+        return new_ops.reset_index(drop=True)
+    new_ops = list(new_ops)
+    if new_ops and all(isinstance(part, pd.DataFrame) for part in new_ops):
+        return pd.concat(new_ops, ignore_index=True)
+    return pd.DataFrame(new_ops)
+
+
+def new_operation_hours(frame):
+    """
+    Quantity in hours per new-op row (NaN where quantity or unit is missing).
+    """
+    if "Quantity_H" in frame:
+        return frame["Quantity_H"].astype(float)
+
+    known = frame["Quantity"].notna() & frame["Unit"].notna()
+    hours = pd.Series(np.nan, index=frame.index)
+    hours[known] = quantity_hours(frame[known])
+    return hours
+
+
+def cluster_new_operations(new_ops, threshold=PROPOSAL_THRESHOLDS["semantic_similarity"]):
+    """
+    Clusters new-op rows by embedding similarity of their distinct
+    normalized descriptions. Only distinct descriptions are embedded
+    (cached) and compared; the most frequent variant seeds its cluster.
+    Returns (frame, clusters), each cluster being
+    {"rows": row positions, "orders": distinct orders, "variants": [...]}.
+    """
+    frame = new_operation_frame(new_ops)
+    if not len(frame):
+        return frame, []
+
+    if "NormDescription" in frame:
+        norm = frame["NormDescription"]
+    else:
+        norm = normalized_descriptions(frame["OperationDescription"].astype("category"))[0]
+
+    desc_codes, variants = pd.factorize(norm)
+    variants = np.asarray(variants, dtype=object)
+    valid = np.flatnonzero(desc_codes >= 0)
+    if not len(valid):
+        return frame, []
+
+    freq = np.bincount(desc_codes[valid], minlength=len(variants))
+    by_freq = np.argsort(-freq, kind="stable")
+    sim_matrix, rep_members = lexical_similarity([variants[i] for i in by_freq])
+    groups = expand_clusters(cluster_from_similarity(sim_matrix, threshold), rep_members)
+
+    label = np.empty(len(variants), dtype=np.int64)
+    for c, members in enumerate(groups):
+        label[by_freq[members]] = c
+    row_labels = label[desc_codes[valid]]
+
+    # Distinct (cluster, order) pairs -> affected orders per cluster
+    order_codes = pd.factorize(frame["MaintenanceOrder"])[0][valid]
+    n_orders = int(order_codes.max()) + 1
+    pairs = np.unique(row_labels * n_orders + order_codes)
+    orders = np.bincount(pairs // n_orders, minlength=len(groups))
+
+    by_label = np.argsort(row_labels, kind="stable")
+    rows = np.split(valid[by_label], np.searchsorted(row_labels[by_label], np.arange(1, len(groups))))
+
+    clusters = [
+        {
+            "rows": rows[c],
+            "orders": int(orders[c]),
+            "variants": [variants[by_freq[m]] for m in members]
+        }
+        for c, members in enumerate(groups)
+    ]
+    return frame, clusters
+
+
 # ------------------------------------------------------------------
 # Master proposal orchestrator
 # ------------------------------------------------------------------
-def propose_master_changes(task_df, agg, total_orders):
+def propose_master_changes(task_df, agg, total_orders, thresholds=None, deadline=None):
+    """
+    With a deadline, the semantic and new-operation stages are skipped
+    (and recorded on the deadline) once time is up; the cheap counting
+    stages always run.
+    """
+    thresholds = resolve_thresholds(thresholds)
+    min_ratio = thresholds["min_order_ratio"]
     proposals = []
 
+    if total_orders == 0:
+        return proposals
+
     # Quantity proposals (single source of truth)
-    proposals.extend(propose_quantity_changes(task_df, agg))
+    proposals.extend(propose_quantity_changes(task_df, agg, thresholds))
 
     if ENABLE_SEMANTIC_DESC:
-        proposals.extend(
-            propose_description_changes_semantic(task_df, agg, total_orders)
-        )
+        if deadline is not None and deadline.expired():
+            deadline.skip("semantic_descriptions")
+        else:
+            proposals.extend(
+                propose_description_changes_semantic(
+                    task_df, agg, total_orders, thresholds, deadline
+                )
+            )
 
     # Non-quantity field proposals
     for (op_id, field, proposed_value), count in agg.get("field_stats", {}).items():
-        if count / total_orders < 0.6:
+        if count / total_orders < min_ratio:
             continue
         if field == "Unit" or field == "OperationDescription":
             continue
+        if pd.isna(proposed_value):
+            continue  # the orders dropped the value: nothing to suggest
 
         current_value = task_df.loc[
             task_df.TaskListOperationInternalId == op_id, field
@@ -331,10 +600,10 @@ def propose_master_changes(task_df, agg, total_orders):
             presence = agg.get("op_presence", {}).get(op_key, 0)
             presence_ratio = presence / total_orders
 
-            if presence_ratio < MIN_PRESENCE_RATIO:
+            if presence_ratio < thresholds["min_presence_ratio"]:
                 continue
 
-            if count / total_orders > 0.6:
+            if count / total_orders > min_ratio:
                 proposals.append({
                     "TaskListOperationInternalId": int(op_key),
                     "type": "DELETE_OPERATION",
@@ -348,54 +617,64 @@ def propose_master_changes(task_df, agg, total_orders):
     new_ops = agg.get("new_ops", [])
     new_op_ratio = agg.get("new_ops_count", {}).get("NEW_OP", 0) / total_orders
 
-    if new_ops and new_op_ratio > 0.4:
-        total_orders = total_orders
-
-        # Cluster by normalized description
-        clusters = {}
-        for op in new_ops:
-            key = normalize_description(op.get("OperationDescription"))
-            if key:
-                clusters.setdefault(key, []).append(op)
+    if len(new_ops) and deadline is not None and deadline.expired():
+        deadline.skip("new_operations")
+    elif len(new_ops) and new_op_ratio > 0.4:
+        frame, clusters = cluster_new_operations(new_ops, thresholds["semantic_similarity"])
+        hours = new_operation_hours(frame).to_numpy()
+        new_op_proposals = []
 
-        for desc_key, ops in clusters.items():
-            affected_orders = len(set(op["MaintenanceOrder"] for op in ops))
-            ratio = affected_orders / total_orders
+        for cluster in clusters:
+            ratio = cluster["orders"] / total_orders
 
-            if ratio < 0.6:
+            if ratio < min_ratio:
                 continue  # not strong enough
 
-            # Aggregate attributes
-            wc_values = [op["WorkCenter"] for op in ops if op.get("WorkCenter")]
-            plant_values = [op["Plant"] for op in ops if op.get("Plant")]
-
-            qty_hours = [
-                normalize_to_hours(op["Quantity"], op["Unit"])
-                for op in ops
-                if op.get("Quantity") is not None and op.get("Unit") is not None
-            ]
+            rows = cluster["rows"]
+            qty_hours = hours[rows][~np.isnan(hours[rows])]
 
-            if not qty_hours:
+            if not len(qty_hours):
                 continue
 
-            avg_hours = stats.trim_mean(qty_hours, 0.1)
+            # Aggregate attributes
+            wc_values = [v for v in frame["WorkCenter"].iloc[rows].tolist() if v and v == v]
+            plant_values = [v for v in frame["Plant"].iloc[rows].tolist() if v and v == v]
+
+            avg_hours = trimmed_mean(qty_hours, 0.1)
             suggested_qty, suggested_unit = suggest_quantity_and_unit(avg_hours)
 
-            proposals.append({
+            evidence = {
+                "occurrences": len(rows),
+                "orders_affected_ratio": round(ratio, 2),
+                "avg_quantity_hours": round(avg_hours, 2)
+            }
+            if len(cluster["variants"]) > 1:
+                evidence["description_variants"] = cluster["variants"]
+
+            new_op_proposals.append({
                 "type": "ADD_NEW_OPERATION",
                 "confidence": "HIGH",
                 "suggested_operation": {
-                    "Description": ops[0]["OperationDescription"],
+                    "Description": most_common(
+                        frame["OperationDescription"].iloc[rows].astype(object).tolist()
+                    ),
                     "WorkCenter": most_common(wc_values),
                     "Plant": most_common(plant_values),
                     "Quantity": suggested_qty,
                     "Unit": suggested_unit
                 },
-                "evidence": {
-                    "occurrences": len(ops),
-                    "orders_affected_ratio": round(ratio, 2),
-                    "avg_quantity_hours": round(avg_hours, 2)
-                }
+                "evidence": evidence
             })
 
+        # Flag proposals that look like a reworded existing master op
+        matches = likely_existing_operations(
+            task_df,
+            [p["suggested_operation"]["Description"] for p in new_op_proposals],
+            thresholds["existing_op_similarity"]
+        )
+        for proposal, match in zip(new_op_proposals, matches):
+            if match is not None:
+                proposal["evidence"]["likely_existing_operation"] = match
+        proposals.extend(new_op_proposals)
+
     return proposals
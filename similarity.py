@@ -0,0 +1,133 @@
+"""
+Offline PCA projection for description similarity.
+
+    python similarity.py [--components 64] [--out embeddingStore/<model>/projection.npy]
+
+Fits the projection on every embedding in the shared store and saves it
+next to the store. Workers load that file (SIMILARITY_PCA_COMPONENTS >
+0), so every process uses the same projection however its own corpus
+looks; refit and restart to pick up a new one.
+"""
+import argparse
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from constants import SIMILARITY_PCA_COMPONENTS, EMBEDDING_STORE_DIR, EMBEDDING_MODEL_NAME
+
+PROJECTION_FILE = "projection.npy"
+
+
+# ------------------------------------------------------------------
+# Pairwise cosine similarity over normalized embeddings
+#
+# Plain float32 product (numpy has no faster float16 / int8 kernels, and
+# the vectors are not kept once the matrix is built, so lower precision
+# would save nothing). An optional PCA projection (fitted offline on the
+# stored description embeddings, uncentered so dot products are
+# preserved in the least-squares sense) shrinks the product's inner
+# dimension.
+# ------------------------------------------------------------------
+class Projection:
+
+    def __init__(self, components):
+        self.components = np.asarray(components, dtype=np.float32)
+        # Identifies the projection in cache keys
+        self.digest = hashlib.sha1(self.components.tobytes()).hexdigest()
+
+    @classmethod
+    def fit(cls, corpus, n_components):
+        corpus = np.asarray(corpus, dtype=np.float32)
+        dim = corpus.shape[1]
+        if not 0 < n_components < dim:
+            raise ValueError(f"n_components must be between 1 and {dim - 1}: {n_components}")
+        if len(corpus) < 4 * n_components:
+            raise ValueError(
+                f"{len(corpus)} embeddings are too few to fit {n_components} components "
+                f"(need {4 * n_components})"
+            )
+        _, _, vt = np.linalg.svd(corpus, full_matrices=False)
+        return cls(vt[:n_components])
+
+    def save(self, path):
+        # Written aside and renamed, so a worker never reads a partial file
+        tmp = f"{path}.tmp.npy"
+        np.save(tmp, self.components)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        return cls(np.load(path))
+
+    def project(self, embeddings):
+        projected = np.asarray(embeddings, dtype=np.float32) @ self.components.T
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        return projected / np.maximum(norms, 1e-12)
+
+
+def pairwise_similarity(embeddings, projection=None):
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if projection is not None and len(embeddings):
+        embeddings = projection.project(embeddings)
+    return embeddings @ embeddings.T
+
+
+# ------------------------------------------------------------------
+# Saved projection (SIMILARITY_PCA_COMPONENTS > 0)
+# ------------------------------------------------------------------
+_projections = {}
+_projection_lock = threading.Lock()
+
+
+def projection_path(model_name=EMBEDDING_MODEL_NAME):
+    return os.path.join(EMBEDDING_STORE_DIR, model_name, PROJECTION_FILE)
+
+
+def load_projection(path=None, n_components=SIMILARITY_PCA_COMPONENTS):
+    """
+    The projection saved at path, read once per process. None when
+    disabled, not fitted yet, or fitted with another component count.
+    """
+    if n_components <= 0:
+        return None
+    path = path or projection_path()
+
+    with _projection_lock:
+        if path not in _projections:
+            projection = None
+            if not os.path.exists(path):
+                print(f"No similarity projection at {path} (python similarity.py): using full embeddings")
+            else:
+                projection = Projection.load(path)
+                if len(projection.components) != n_components:
+                    print(
+                        f"Similarity projection {path} has {len(projection.components)} "
+                        f"components, expected {n_components}: using full embeddings"
+                    )
+                    projection = None
+            _projections[path] = projection
+        return _projections[path]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=SIMILARITY_PCA_COMPONENTS or 64)
+    parser.add_argument("--out", default=projection_path())
+    args = parser.parse_args(argv)
+
+    from nlpUtils import embedding_corpus  # loads the model and the store
+
+    corpus = embedding_corpus()
+    projection = Projection.fit(corpus, args.components)
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    projection.save(args.out)
+    print(
+        f"Fitted {args.components} components on {len(corpus)} embeddings "
+        f"({corpus.shape[1]} dims) into {args.out} [{projection.digest[:12]}]"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import functools
+import hashlib
+import threading
+
+from flask import Response, make_response, request
+
+from constants import ENABLE_COALESCING
+
+
+# ------------------------------------------------------------------
+# Request coalescing (single-flight)
+#
+# Identical requests (method, path + query string, deadline header,
+# body) that arrive while one is already being computed wait for that
+# computation and get a copy of its response instead of redoing the
+# work; an exception from the leader is raised in every waiter. Sits
+# in front of admission control, so waiters hold no admission slot.
+# Streamed responses cannot be replayed: waiters on one run their own
+# request. Coalescing is per process (i.e. per gunicorn worker).
+# ------------------------------------------------------------------
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+
+    def __init__(self, enabled=ENABLE_COALESCING):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._counters = {"leaders": 0, "coalesced": 0, "shared_errors": 0}
+
+    def do(self, key, fn):
+        """
+        fn() once per key among concurrent callers.
+        Returns (value, shared) where shared is True for waiters.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._counters["leaders"] += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self._counters["coalesced"] += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                with self._lock:
+                    self._counters["shared_errors"] += 1
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "in_flight": len(self._calls),
+                "waiting": sum(c.waiters for c in self._calls.values()),
+                **self._counters
+            }
+
+    def coalesce(self, skip=None):
+        """
+        Flask view decorator; skip(request) -> True bypasses coalescing
+        (e.g. requests with side effects).
+        """
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or (skip is not None and skip(request)):
+                    return view(*args, **kwargs)
+
+                key = request_key()
+
+                def run():
+                    response = make_response(view(*args, **kwargs))
+                    if response.is_streamed:
+                        return response
+                    return response.get_data(), response.status_code, list(response.headers.items())
+
+                value, shared = self.do(key, run)
+                if isinstance(value, Response):
+                    # Streamed: only usable by the leader
+                    return value if not shared else view(*args, **kwargs)
+
+                body, status, headers = value
+                return Response(body, status=status, headers=headers)
+
+            return wrapper
+        return decorator
+
+
+def request_key():
+    digest = hashlib.sha1()
+    for part in (request.method, request.full_path, request.headers.get("X-Deadline-Ms", "")):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(request.get_data(cache=True))
+    return digest.hexdigest()
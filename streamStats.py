@@ -0,0 +1,302 @@
+import math
+
+import numpy as np
+
+from constants import SKETCH_COMPRESSION
+
+
+# ------------------------------------------------------------------
+# Bounded-memory statistics for quantity deltas
+#
+# Error bounds (n = samples seen, d = compression):
+#   * count / mean / std of the raw deltas are exact (running moments).
+#   * Every centroid covering quantile q holds at most
+#     max(1, 4 * n * q * (1 - q) / d) samples, so any rank computed from
+#     the sketch is off by at most that many samples (n / d in the
+#     median, far less in the tails).
+#   * The z-score cut classifies whole centroids by their mean, so the
+#     filtered sample size can be off by at most the weight of the two
+#     centroids straddling mean +/- z * std.
+#   * The trimmed mean can be off by at most
+#     (2 * n / d) / n_filtered * (max - min); in practice the trim
+#     boundaries sit in the tails where centroids are small.
+#   * Centroids keep their internal sum of squares, so the filtered std
+#     includes the spread inside them; a centroid straddling a fence is
+#     split assuming its samples spread uniformly over mean +/- sqrt(3)
+#     * its std. The remaining error comes from that split. Measured
+#     against exact_delta_stats, with or without merge() (see
+#     tests/test_streamStats.py): under 0.1% on normal deltas, under
+#     0.5% on lognormal, and up to ~1.5% when a dense outlier cluster
+#     sits on a fence. The bound tested there is 3%.
+# Memory per op does not depend on the number of orders beyond a slow
+# logarithmic growth of the centroid count (~600 centroids for d=100 at
+# 200k deltas) plus a buffer of at most 5 * d raw values.
+# ------------------------------------------------------------------
+class RunningMoments:
+    """
+    Count / mean / variance via Welford's update; mergeable (Chan et al.).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        x = float(x)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    @classmethod
+    def from_values(cls, values):
+        moments = cls()
+        values = np.asarray(values, dtype=np.float64)
+        if len(values):
+            moments.count = len(values)
+            moments.mean = float(values.mean())
+            moments.m2 = float(((values - moments.mean) ** 2).sum())
+            moments.min = float(values.min())
+            moments.max = float(values.max())
+        return moments
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def std(self):
+        # Population std (ddof=0), same as np.std / stats.zscore
+        if self.count == 0:
+            return 0.0
+        return math.sqrt(max(self.m2, 0.0) / self.count)
+
+
+class CentroidSketch:
+    """
+    Mergeable quantile sketch (merging t-digest).
+    Keeps weighted centroids sorted by mean; centroid size shrinks
+    towards the tails so extreme quantiles stay accurate.
+    """
+
+    def __init__(self, compression=SKETCH_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.m2s = np.empty(0)  # sum of squared deviations within each centroid
+        self.buffer = []
+
+    @property
+    def total_weight(self):
+        return float(self.weights.sum()) + len(self.buffer)
+
+    def add(self, x):
+        self.buffer.append(float(x))
+        if len(self.buffer) >= 5 * self.compression:
+            self._compress()
+
+    def add_many(self, values):
+        self.buffer.extend(np.asarray(values, dtype=np.float64).tolist())
+        if len(self.buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other):
+        other._compress()
+        self._compress()
+        self.means = np.concatenate([self.means, other.means])
+        self.weights = np.concatenate([self.weights, other.weights])
+        self.m2s = np.concatenate([self.m2s, other.m2s])
+        self._compress(force=True)
+        return self
+
+    def _compress(self, force=False):
+        if not self.buffer and not force:
+            return
+
+        means = np.concatenate([self.means, np.array(self.buffer)])
+        weights = np.concatenate([self.weights, np.ones(len(self.buffer))])
+        m2s = np.concatenate([self.m2s, np.zeros(len(self.buffer))])
+        self.buffer = []
+
+        if len(means) == 0:
+            return
+
+        order = np.argsort(means, kind="mergesort")
+        means, weights, m2s = means[order], weights[order], m2s[order]
+        total = weights.sum()
+
+        out_means, out_weights, out_m2s = [], [], []
+        cur_mean, cur_weight, cur_m2 = means[0], weights[0], m2s[0]
+        cum = 0.0
+
+        for m, w, m2 in zip(means[1:], weights[1:], m2s[1:]):
+            merged = cur_weight + w
+            q = (cum + merged / 2) / total
+            limit = max(1.0, 4 * total * q * (1 - q) / self.compression)
+
+            if merged <= limit:
+                delta = m - cur_mean
+                cur_m2 += m2 + delta * delta * cur_weight * w / merged
+                cur_mean += delta * w / merged
+                cur_weight = merged
+            else:
+                out_means.append(cur_mean)
+                out_weights.append(cur_weight)
+                out_m2s.append(cur_m2)
+                cum += cur_weight
+                cur_mean, cur_weight, cur_m2 = m, w, m2
+
+        out_means.append(cur_mean)
+        out_weights.append(cur_weight)
+        out_m2s.append(cur_m2)
+
+        self.means = np.array(out_means)
+        self.weights = np.array(out_weights)
+        self.m2s = np.array(out_m2s)
+
+    def centroids(self):
+        self._compress()
+        return self.means, self.weights
+
+    def quantile(self, q):
+        means, weights = self.centroids()
+        if len(means) == 0:
+            return None
+
+        cum = np.cumsum(weights) - weights / 2
+        return float(np.interp(q * weights.sum(), cum, means))
+
+
+class DeltaSketch:
+    """
+    Constant-memory replacement for the per-op list of quantity deltas.
+    """
+
+    def __init__(self, compression=SKETCH_COMPRESSION):
+        self.moments = RunningMoments()
+        self.digest = CentroidSketch(compression)
+
+    def add(self, delta):
+        self.moments.add(delta)
+        self.digest.add(delta)
+
+    def add_many(self, deltas):
+        self.moments.merge(RunningMoments.from_values(deltas))
+        self.digest.add_many(deltas)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        return self
+
+    def __len__(self):
+        return self.moments.count
+
+    def to_state(self):
+        """
+        JSON-serializable state (centroids compressed first).
+        """
+        means, weights = self.digest.centroids()
+        m = self.moments
+        return {
+            "moments": [m.count, m.mean, m.m2, m.min, m.max],
+            "compression": self.digest.compression,
+            "means": means.tolist(),
+            "weights": weights.tolist(),
+            "m2s": self.digest.m2s.tolist()
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(state["compression"])
+        m = sketch.moments
+        m.count, m.mean, m.m2, m.min, m.max = state["moments"]
+        sketch.digest.means = np.array(state["means"], dtype=np.float64)
+        sketch.digest.weights = np.array(state["weights"], dtype=np.float64)
+        # States saved before centroids tracked their spread: treat them as points
+        sketch.digest.m2s = np.array(
+            state.get("m2s", np.zeros(len(sketch.digest.means))), dtype=np.float64
+        )
+        return sketch
+
+    @staticmethod
+    def _inside(means, weights, m2s, lo, hi):
+        """
+        The part of each centroid inside (lo, hi) as (means, weights,
+        m2s), with every centroid spread uniformly over
+        mean +/- sqrt(3) * its std (the uniform range with that std).
+        """
+        half = np.sqrt(3 * np.maximum(m2s, 0) / weights)
+        left = np.maximum(means - half, lo)
+        right = np.minimum(means + half, hi)
+
+        spread = half > 0
+        share = np.where(
+            spread,
+            np.clip(right - left, 0, None) / np.where(spread, 2 * half, 1),
+            (means > lo) & (means < hi)
+        )
+        keep = share > 0
+        share, left, right = share[keep], left[keep], right[keep]
+        spread = spread[keep]
+
+        weights = weights[keep] * share
+        means = np.where(spread, (left + right) / 2, means[keep])
+        m2s = np.where(spread, weights * (right - left) ** 2 / 12, 0.0)
+        return means, weights, m2s
+
+    def summary(self, z_threshold=2.5, trim=0.1):
+        """
+        Approximate (mean_delta, std_dev, cv, sample_size) after the
+        z-score filter and trimmed mean used by the exact path.
+        Returns None when no sample survives the filter.
+        """
+        std = self.moments.std
+        if self.moments.count == 0 or std == 0:
+            # stats.zscore gives NaN for constant input -> nothing kept
+            return None
+
+        lo = self.moments.mean - z_threshold * std
+        hi = self.moments.mean + z_threshold * std
+
+        means, weights = self.digest.centroids()
+        means, weights, m2s = self._inside(means, weights, self.digest.m2s, lo, hi)
+
+        n = weights.sum()
+        if n == 0:
+            return None
+
+        filtered_mean = float((means * weights).sum() / n)
+        filtered_std = float(np.sqrt(
+            (m2s.sum() + (weights * (means - filtered_mean) ** 2).sum()) / n
+        ))
+
+        # Trimmed mean: drop int(trim * n) samples from each side
+        cut = math.floor(trim * n)
+        upper = n - cut
+        cum_hi = np.cumsum(weights)
+        cum_lo = cum_hi - weights
+        kept = np.clip(np.minimum(cum_hi, upper) - np.maximum(cum_lo, cut), 0, None)
+        mean_delta = float((means * kept).sum() / kept.sum()) if kept.sum() else filtered_mean
+
+        cv = filtered_std / abs(mean_delta) if mean_delta != 0 else np.inf
+
+        return mean_delta, filtered_std, cv, int(round(n))
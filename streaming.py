@@ -0,0 +1,78 @@
+from setupData import *
+from serializer import dumps
+from constants import STREAM_CHUNK_ORDERS
+
+
+# ------------------------------------------------------------------
+# Chunked streaming of analyze results
+#
+# Orders are analyzed once, in ANALYZE_CHUNK_ORDERS chunks that are
+# folded into the aggregate as they complete, so proposals can be
+# written first. The columnar chunk stores are kept and only serialized
+# STREAM_CHUNK_ORDERS orders at a time, so the dict-shaped results and
+# their encoded bytes never exist for the whole response at once.
+# Proposals need every order, so nothing is sent before all orders are
+# analyzed: time to first byte still grows with the payload.
+# ------------------------------------------------------------------
+STREAM_FORMATS = ("json", "ndjson")
+
+
+def _analyze_and_aggregate(task_df, mo_df, streaming_stats, deadline=None):
+    agg = new_aggregate(streaming_stats)
+    parts = []
+    analyzed = 0
+
+    for part, total in iter_order_chunks(mo_df, task_df):
+        if deadline is not None and deadline.expired(keep_reserve=True):
+            deadline.skip("orders", orders_analyzed=analyzed, orders_total=total)
+            break
+        accumulate_store(agg, part)
+        parts.append(part)
+        analyzed += len(part)
+
+    return agg, parts
+
+
+def _order_chunks(parts):
+    for part in parts:
+        for start in range(0, len(part), STREAM_CHUNK_ORDERS):
+            yield part.slice(start, start + STREAM_CHUNK_ORDERS).to_dict().items()
+
+
+def stream_analysis(task_df, mo_df, fmt="json", streaming_stats=ENABLE_STREAMING_STATS,
+                    deadline=None):
+    """
+    Yields the analyze response as bytes.
+    json:   {"master_change_proposals": [...], "order_level_analysis": {...}}
+    ndjson: one {"master_change_proposals": [...]} line, then one
+            {"order_id": ..., "analysis": {...}} line per order.
+    With a deadline, its report is added next to the proposals.
+    """
+    agg, parts = _analyze_and_aggregate(task_df, mo_df, streaming_stats, deadline)
+    proposals = propose_master_changes(
+        task_df, agg, total_orders=sum(len(p) for p in parts), deadline=deadline
+    )
+    del agg
+
+    head = {"master_change_proposals": proposals}
+    if deadline is not None and deadline.seconds is not None:
+        head["deadline"] = deadline.report()
+
+    if fmt == "ndjson":
+        yield dumps(head) + b"\n"
+        for chunk in _order_chunks(parts):
+            yield b"".join(
+                dumps({"order_id": order_id, "analysis": result}) + b"\n"
+                for order_id, result in chunk
+            )
+        return
+
+    yield dumps(head)[:-1] + b',"order_level_analysis":{'
+    first = True
+    for chunk in _order_chunks(parts):
+        pieces = []
+        for order_id, result in chunk:
+            pieces.append((b"" if first else b",") + dumps(str(order_id)) + b":" + dumps(result))
+            first = False
+        yield b"".join(pieces)
+    yield b"}}"
@@ -0,0 +1,169 @@
+import math
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from constants import FIELDS_TO_COMPARE
+from columnar import OrderResultStore
+from dataCreation import generate_large_payload
+from setupData import build_data_model, new_aggregate, propose_master_changes
+
+
+# ------------------------------------------------------------------
+# The analysis as it was before the columnar rewrite: object-dtype
+# frames (pandas 2 keeps None in them) compared row by row with
+# iterrows over the planned / actual merge.
+# ------------------------------------------------------------------
+UNIT_HOURS = {"H": 1.0, "MIN": 1 / 60, "D": 8.0}
+
+
+def baseline_frames(payload):
+    task_df = pd.DataFrame(payload["results"][1]["value"], dtype=object)
+    mo_df = pd.DataFrame(payload["results"][0]["d"]["results"], dtype=object)
+
+    task_df["TaskListOperationInternalId"] = task_df["TaskListOperationInternalId"].astype(int)
+    mo_df["TaskListOperationInternalId"] = mo_df["TaskListOperationInternalId"].astype(int)
+
+    task_df = task_df[
+        ["WorkCenter", "Plant", "OpPlannedWorkQuantity",
+         "OpWorkQuantityUnit", "TaskListOperationInternalId", "OperationText"]
+    ].rename(columns={
+        "OpPlannedWorkQuantity": "Quantity",
+        "OpWorkQuantityUnit": "Unit",
+        "OperationText": "OperationDescription"
+    })
+    mo_df = mo_df[
+        ["MaintenanceOrder", "MaintenanceOrderOperation", "WorkCenter", "Plant",
+         "MaintOrderOperationQuantity", "MaintOrdOperationQuantityUnit",
+         "TaskListOperationInternalId", "OperationDescription"]
+    ].rename(columns={
+        "MaintOrderOperationQuantity": "Quantity",
+        "MaintOrdOperationQuantityUnit": "Unit"
+    })
+
+    for df in (task_df, mo_df):
+        df["Quantity_H"] = [float(q) * UNIT_HOURS[u] for q, u in zip(df["Quantity"], df["Unit"])]
+    return task_df, mo_df
+
+
+def baseline_single_order(order_df, task_df):
+    result = {
+        "new_operations": [],
+        "missing_operations": [],
+        "quantity_deltas": [],
+        "field_deltas": []
+    }
+
+    task_ops = set(task_df["TaskListOperationInternalId"])
+    order_ops = set(order_df["TaskListOperationInternalId"])
+
+    new_ops = order_df[order_df["TaskListOperationInternalId"] == 0]
+    if not new_ops.empty:
+        result["new_operations"] = new_ops.to_dict("records")
+
+    result["missing_operations"] = list(task_ops - order_ops)
+
+    merged = order_df.merge(
+        task_df,
+        on="TaskListOperationInternalId",
+        how="inner",
+        suffixes=("_actual", "_planned")
+    )
+
+    for _, row in merged.iterrows():
+        for field in FIELDS_TO_COMPARE:
+            actual = row[f"{field}_actual"]
+            planned = row[f"{field}_planned"]
+
+            if field == "Quantity":
+                delta = row["Quantity_H_actual"] - row["Quantity_H_planned"]
+                result["quantity_deltas"].append({
+                    "TaskListOperationInternalId": row["TaskListOperationInternalId"],
+                    "delta": delta
+                })
+            elif actual != planned:
+                result["field_deltas"].append({
+                    "TaskListOperationInternalId": row["TaskListOperationInternalId"],
+                    "field": field,
+                    "actual": actual
+                })
+    return result
+
+
+def _value(v):
+    # The columnar store decodes every missing value to None
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return None
+    return str(v)
+
+
+def _normalized(result):
+    return {
+        "new_operations": len(result["new_operations"]),
+        "missing_operations": sorted(int(op) for op in result["missing_operations"]),
+        "quantity_deltas": sorted(
+            (int(q["TaskListOperationInternalId"]), round(float(q["delta"]), 9))
+            for q in result["quantity_deltas"]
+        ),
+        "field_deltas": sorted(
+            (int(f["TaskListOperationInternalId"]), f["field"], str(_value(f["actual"])))
+            for f in result["field_deltas"]
+        )
+    }
+
+
+def _payload(num_orders, seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    payload = generate_large_payload(num_orders)
+
+    # Missing values on both sides, and on the order side only
+    tasks = payload["results"][1]["value"]
+    orders = payload["results"][0]["d"]["results"]
+    op = tasks[0]["TaskListOperationInternalId"]
+    tasks[0]["WorkCenter"] = None
+    for order in orders:
+        if order["TaskListOperationInternalId"] == op:
+            order["WorkCenter"] = None
+    orders[len(orders) // 2]["Plant"] = None
+    return payload
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_from_frames_matches_baseline(seed):
+    payload = _payload(40, seed)
+
+    base_task_df, base_mo_df = baseline_frames(payload)
+    expected = {
+        order_id: _normalized(baseline_single_order(order_df, base_task_df))
+        for order_id, order_df in base_mo_df.groupby("MaintenanceOrder")
+    }
+
+    task_df, mo_df = build_data_model(payload)
+    actual = {
+        order_id: _normalized(result)
+        for order_id, result in OrderResultStore.from_frames(mo_df, task_df).to_dict().items()
+    }
+
+    assert actual == expected
+
+
+def test_missing_on_both_sides_is_not_a_field_delta():
+    task_df, mo_df = build_data_model(_payload(10, 1))
+    results = OrderResultStore.from_frames(mo_df, task_df).to_dict()
+    deltas = [f for result in results.values() for f in result["field_deltas"]]
+
+    # Plant dropped on the order side only is still reported
+    assert any(f["field"] == "Plant" and f["actual"] is None for f in deltas)
+    assert not any(f["field"] == "WorkCenter" and f["actual"] is None for f in deltas)
+
+
+def test_no_field_proposal_without_a_suggested_value():
+    task_df, _ = build_data_model(_payload(10, 1))
+    agg = new_aggregate(streaming=False)
+    agg["field_stats"] = {(10, "Plant", None): 10, (10, "Plant", "2000"): 9}
+
+    proposals = propose_master_changes(task_df, agg, total_orders=10)
+    assert [p["suggested_value"] for p in proposals] == ["2000"]
@@ -0,0 +1,17 @@
+from benchmarks.importBench import FORBIDDEN, import_profile
+
+
+# ------------------------------------------------------------------
+# Importing the app stays cheap: each profile is a fresh interpreter
+# (python -X importtime), the best of a few runs is held to the same
+# budget and forbidden-module list as benchmarks/importBench.py.
+# ------------------------------------------------------------------
+BUDGET_SECONDS = 1.0
+
+
+def test_app_import_budget():
+    runs = [import_profile("app") for _ in range(3)]
+    profile = min(runs, key=lambda p: p["app"])
+
+    assert profile["app"] <= BUDGET_SECONDS
+    assert [m for m in FORBIDDEN.split(",") if m in profile] == []
@@ -0,0 +1,60 @@
+import json
+
+import numpy as np
+import pytest
+
+from setupData import exact_delta_stats
+from streamStats import DeltaSketch
+
+
+# ------------------------------------------------------------------
+# DeltaSketch.summary against exact_delta_stats on the same deltas.
+# Tolerances are the bounds documented in streamStats.py: std relative
+# to the exact std, mean error in units of the exact std.
+# ------------------------------------------------------------------
+DISTRIBUTIONS = {
+    "normal": (lambda rng, n: rng.normal(0.5, 1.0, n), 0.005),
+    "lognormal": (lambda rng, n: rng.lognormal(0.0, 2.0, n), 0.015),
+    "outliers": (
+        lambda rng, n: np.where(rng.random(n) < 0.02, rng.uniform(5, 40, n), rng.normal(0.2, 0.5, n)),
+        0.03
+    ),
+}
+
+
+def _sketch(deltas, parts):
+    if parts == 1:
+        sketch = DeltaSketch()
+        sketch.add_many(deltas)
+        return sketch
+
+    sketch = DeltaSketch()
+    for part in np.array_split(deltas, parts):
+        chunk = DeltaSketch()
+        chunk.add_many(part)
+        sketch.merge(chunk)
+    return sketch
+
+
+@pytest.mark.parametrize("parts", [1, 16], ids=["single", "merged"])
+@pytest.mark.parametrize("name", list(DISTRIBUTIONS))
+@pytest.mark.parametrize("n", [300, 20000])
+def test_summary_matches_exact(name, n, parts):
+    generate, std_tolerance = DISTRIBUTIONS[name]
+
+    for seed in range(3):
+        deltas = generate(np.random.default_rng(seed), n)
+        mean, std, _, sample_size = _sketch(deltas, parts).summary()
+        exact_mean, exact_std, _, exact_size = exact_delta_stats(deltas)
+
+        assert abs(std - exact_std) <= std_tolerance * exact_std
+        assert abs(mean - exact_mean) <= 0.01 * exact_std
+        assert abs(sample_size - exact_size) <= 0.01 * exact_size
+
+
+def test_state_round_trip_keeps_centroid_spread():
+    deltas = DISTRIBUTIONS["outliers"][0](np.random.default_rng(0), 5000)
+    sketch = _sketch(deltas, 1)
+
+    restored = DeltaSketch.from_state(json.loads(json.dumps(sketch.to_state())))
+    assert restored.summary() == sketch.summary()
@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+
+
+# ------------------------------------------------------------------
+# Thread configuration for torch, BLAS and tokenizers
+#
+# Left at their defaults, every process starts one torch thread and
+# one BLAS thread per core plus a tokenizers pool, so N server workers
+# oversubscribe the node N times over. Settings come from the JSON
+# file named by THREAD_CONFIG, overridden by environment variables:
+#   TORCH_THREADS_PER_WORKER  intra-op threads (0 = cpus / WEB_WORKERS)
+#   TORCH_INTEROP_THREADS     inter-op threads (0 = torch default)
+#   BLAS_THREADS_PER_WORKER   OpenMP / OpenBLAS / MKL (0 = an operator
+#                             set OMP_NUM_THREADS etc., else torch threads)
+#   TOKENIZERS_PARALLELISM    true / false
+# BLAS and tokenizers only read their variables when first loaded, so
+# apply_env runs when this module is imported; import it before numpy
+# and torch. It leaves variables the operator already set alone unless
+# the matching setting above is configured explicitly. apply_runtime
+# covers libraries that are already loaded.
+# ------------------------------------------------------------------
+THREAD_ENV = {
+    "torch_threads": "TORCH_THREADS_PER_WORKER",
+    "torch_interop_threads": "TORCH_INTEROP_THREADS",
+    "blas_threads": "BLAS_THREADS_PER_WORKER",
+    "tokenizers_parallelism": "TOKENIZERS_PARALLELISM",
+}
+BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"
+)
+EXPORTED_ENV_VARS = BLAS_ENV_VARS + ("TOKENIZERS_PARALLELISM",)
+# Set by the operator (captured before apply_env exports anything)
+OPERATOR_ENV = {var: os.environ[var] for var in EXPORTED_ENV_VARS if os.environ.get(var)}
+
+
+def thread_config(path=None, **overrides):
+    """
+    Resolved settings: defaults < THREAD_CONFIG file < env < overrides
+    (None overrides are ignored). "configured" lists the settings that
+    were set explicitly by any of those.
+    """
+    config = {"torch_threads": 0, "torch_interop_threads": 0, "blas_threads": 0,
+              "tokenizers_parallelism": False}
+    configured = set()
+
+    path = path or os.environ.get("THREAD_CONFIG")
+    if path:
+        with open(path) as f:
+            from_file = json.load(f)
+        unknown = set(from_file) - set(config)
+        if unknown:
+            raise ValueError(f"Unknown thread settings in {path}: {sorted(unknown)}")
+        config.update(from_file)
+        configured.update(from_file)
+
+    for key, var in THREAD_ENV.items():
+        # Variables apply_env exports only count when the operator set them
+        value = OPERATOR_ENV.get(var) if var in EXPORTED_ENV_VARS else os.environ.get(var)
+        if value:
+            config[key] = value
+            configured.add(key)
+    overrides = {k: v for k, v in overrides.items() if v is not None}
+    config.update(overrides)
+    configured.update(overrides)
+
+    workers = max(1, int(os.environ.get("WEB_WORKERS", 1)))
+    torch_threads = int(config["torch_threads"]) or max(1, (os.cpu_count() or 1) // workers)
+    # Unset BLAS threads follow an operator's OMP_NUM_THREADS etc.
+    inherited = [OPERATOR_ENV[var] for var in BLAS_ENV_VARS if OPERATOR_ENV.get(var, "").isdigit()]
+    return {
+        "torch_threads": torch_threads,
+        "torch_interop_threads": int(config["torch_interop_threads"]),
+        "blas_threads": int(config["blas_threads"]) or int(inherited[0] if inherited else 0) or torch_threads,
+        "tokenizers_parallelism": str(config["tokenizers_parallelism"]).lower() in ("1", "true"),
+        "configured": sorted(configured),
+    }
+
+
+def apply_env(config):
+    """
+    Exports the BLAS / tokenizers variables; one the operator already
+    set is only replaced when its setting is in config["configured"].
+    """
+    configured = config.get("configured", ())
+    for var in BLAS_ENV_VARS:
+        if "blas_threads" in configured or var not in OPERATOR_ENV:
+            os.environ[var] = str(config["blas_threads"])
+    if "tokenizers_parallelism" in configured or "TOKENIZERS_PARALLELISM" not in OPERATOR_ENV:
+        os.environ["TOKENIZERS_PARALLELISM"] = "true" if config["tokenizers_parallelism"] else "false"
+
+
+def apply_runtime(config):
+    """
+    Applies config to torch and BLAS in this process if already loaded.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(config["torch_threads"])
+        if config["torch_interop_threads"]:
+            try:
+                torch.set_num_interop_threads(config["torch_interop_threads"])
+            except RuntimeError:  # only settable before the first parallel op
+                pass
+
+    if "numpy" in sys.modules:
+        try:
+            from threadpoolctl import threadpool_limits
+        except ImportError:  # optional; env vars still apply to fresh processes
+            return
+        threadpool_limits(config["blas_threads"], user_api="blas")
+
+
+apply_env(thread_config())
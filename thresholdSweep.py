@@ -0,0 +1,144 @@
+import numpy as np
+
+from constants import SWEEP_MAX_POINTS
+from setupData import *
+
+
+# ------------------------------------------------------------------
+# Threshold sweep over a cached aggregate
+#
+# Every combination of the requested threshold values is evaluated in
+# one pass: per-op work (z filtering, trimmed means, similarity
+# matrices, cluster ratios) is computed once per distinct value and the
+# grid is then scored with numpy broadcasting.
+# ------------------------------------------------------------------
+def threshold_grid(grid):
+    if not isinstance(grid, dict):
+        raise ValueError("sweep must be an object of threshold name -> list of values")
+
+    names = list(PROPOSAL_THRESHOLDS)
+    base = resolve_thresholds()
+    for name in grid:
+        resolve_thresholds({name: base[name]})  # rejects unknown names
+
+    axes = {
+        name: np.unique(np.array(grid.get(name, [base[name]]), dtype=float).ravel())
+        for name in names
+    }
+    n_points = int(np.prod([len(axis) for axis in axes.values()]))
+    if n_points > SWEEP_MAX_POINTS:
+        raise ValueError(f"sweep has {n_points} combinations; at most {SWEEP_MAX_POINTS} allowed")
+
+    mesh = np.meshgrid(*axes.values(), indexing="ij")
+    points = {name: m.ravel() for name, m in zip(names, mesh)}
+    return axes, points
+
+
+def _axis_index(axes, points, name):
+    return np.searchsorted(axes[name], points[name])
+
+
+def sweep_thresholds(task_df, agg, total_orders, grid):
+    """
+    grid: {threshold_name: [values, ...]}; missing names use defaults.
+    Returns one entry per combination with proposal counts by category.
+    """
+    axes, points = threshold_grid(grid)
+    n_points = len(points["min_order_ratio"])
+
+    if total_orders == 0:
+        return [
+            {
+                "thresholds": {name: float(values[i]) for name, values in points.items()},
+                "proposal_counts": {},
+                "total": 0
+            }
+            for i in range(n_points)
+        ]
+    min_ratio = points["min_order_ratio"][:, None]
+
+    counts = {}
+
+    # Quantity: |trimmed mean| per (z threshold, op)
+    op_stats = []
+    for z in axes["z_score_max"]:
+        row = []
+        for _, delta_stats in quantity_delta_stats(agg, z):
+            if delta_stats is None or delta_stats[3] < 3:
+                row.append(np.nan)
+            else:
+                row.append(abs(delta_stats[0]))
+        op_stats.append(row)
+    mean_abs = np.array(op_stats, dtype=float).reshape(len(axes["z_score_max"]), -1)
+    mean_abs = mean_abs[_axis_index(axes, points, "z_score_max")]
+    counts["quantity"] = (mean_abs >= points["min_delta_hours"][:, None]).sum(axis=1)
+
+    # Semantic descriptions: dominant cluster ratio per (similarity, op)
+    if ENABLE_SEMANTIC_DESC:
+        ratios = []
+        for op_id, norm_descs, raw_descs in description_variants(agg):
+            current_desc = task_df.loc[
+                task_df.TaskListOperationInternalId == op_id,
+                "OperationDescription"
+            ].iloc[0]
+            # Same seeding and cache as propose_description_changes_semantic
+            op_ratios = []
+            for clusters in cluster_cached_thresholds(norm_descs, axes["semantic_similarity"].tolist()):
+                dominant = max(clusters, key=len)
+                suggested = most_common([raw_descs[i] for i in dominant])
+                if normalize_description(current_desc) == normalize_description(suggested):
+                    op_ratios.append(np.nan)
+                else:
+                    op_ratios.append(len(dominant) / total_orders)
+            ratios.append(op_ratios)
+
+        ratios = np.array(ratios, dtype=float).reshape(-1, len(axes["semantic_similarity"])).T
+        ratios = ratios[_axis_index(axes, points, "semantic_similarity")]
+        counts["description"] = (ratios >= min_ratio).sum(axis=1)
+
+    # Non-quantity fields
+    field_ratios = np.array([
+        count / total_orders
+        for (op_id, field, value), count in agg.get("field_stats", {}).items()
+        if field not in ("Unit", "OperationDescription") and not pd.isna(value)
+    ], dtype=float)
+    counts["field"] = (field_ratios[None, :] >= min_ratio).sum(axis=1)
+
+    # Structural deletes
+    if MIN_ORDERED_NEEDED_FOR_DELETE > 10:
+        missing = agg.get("missing_ops_count", {})
+        presence = np.array([
+            agg.get("op_presence", {}).get(op_key, 0) / total_orders for op_key in missing
+        ], dtype=float)
+        missing_ratio = np.array(list(missing.values()), dtype=float) / total_orders
+        counts["delete"] = (
+            (presence[None, :] >= points["min_presence_ratio"][:, None])
+            & (missing_ratio[None, :] > min_ratio)
+        ).sum(axis=1)
+
+    # New operations: cluster ratios per (similarity, cluster)
+    new_ops = agg.get("new_ops", [])
+    new_op_ratio = agg.get("new_ops_count", {}).get("NEW_OP", 0) / total_orders
+    cluster_ratios = [[] for _ in axes["semantic_similarity"]]
+    if len(new_ops) and new_op_ratio > 0.4:
+        for i, similarity in enumerate(axes["semantic_similarity"]):
+            frame, clusters = cluster_new_operations(new_ops, similarity)
+            has_hours = new_operation_hours(frame).notna().to_numpy()
+            cluster_ratios[i] = [
+                c["orders"] / total_orders for c in clusters if has_hours[c["rows"]].any()
+            ]
+
+    width = max(len(r) for r in cluster_ratios)
+    cluster_ratios = np.array([r + [np.nan] * (width - len(r)) for r in cluster_ratios], dtype=float)
+    cluster_ratios = cluster_ratios.reshape(len(axes["semantic_similarity"]), width)
+    cluster_ratios = cluster_ratios[_axis_index(axes, points, "semantic_similarity")]
+    counts["new_operation"] = (cluster_ratios >= min_ratio).sum(axis=1)
+
+    return [
+        {
+            "thresholds": {name: float(values[i]) for name, values in points.items()},
+            "proposal_counts": {category: int(c[i]) for category, c in counts.items()},
+            "total": int(sum(c[i] for c in counts.values()))
+        }
+        for i in range(n_points)
+    ]
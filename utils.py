@@ -1,7 +1,6 @@
 from constants import *
 from collections import Counter
 import numpy as np
-from scipy import stats
 from nlpUtils import *
 import re
 
@@ -56,6 +55,8 @@ def suggest_quantity_and_unit(hours_value, preferred_unit=None):
 
 
 def trimmed_mean(values, proportion=0.1):
+    from scipy import stats  # deferred: scipy.stats alone is ~0.5s of import time
+
     values = np.array(values)
     if len(values) == 0:
         return None